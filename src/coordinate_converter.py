@@ -184,6 +184,25 @@ class CoordinateConverter:
             # Decimal format without degree symbol
             return f"{decimal_degrees:.6f}"
     
+    @staticmethod
+    def format_coordinates(values, is_longitude_flags, use_dms=True):
+        """
+        Format several coordinates at once (e.g. west, north, east, south)
+        
+        Args:
+            values: Sequence of float coordinate values
+            is_longitude_flags: Matching sequence of is_longitude flags
+            use_dms: True for DMS format, False for decimal format
+        
+        Returns:
+            Tuple of formatted strings, in the same order as values
+        """
+        # Pick the formatter once instead of re-checking use_dms per value
+        if use_dms:
+            float_to_dms = CoordinateConverter.float_to_dms
+            return tuple(float_to_dms(value, is_lon) for value, is_lon in zip(values, is_longitude_flags))
+        return tuple(f"{value:.6f}" for value in values)
+    
     @staticmethod
     def parse_coordinate(coord_string):
         """
@@ -5,28 +5,65 @@ Handles coordinate clamping, pixel grid snapping, DMS parsing, and formatting
 """
 
 import re
-from typing import Tuple, Optional, Dict
+from functools import lru_cache
+from typing import Tuple, Optional, Dict, List
 from coordinate_converter import CoordinateConverter
 
+
+# DMS parsing regex patterns
+_DMS_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # 45°30'15"N, 45°30'15.5"W, etc.
+    r'^(-?\d+)°(\d+)\'(\d+(?:\.\d+)?)\"([NSEW])$',
+    # 45°30"N (no minutes)
+    r'^(-?\d+)°(\d+)\"([NSEW])$',
+    # 45°N (degrees only)
+    r'^(-?\d+)°([NSEW])$',
+    # -45.5 (plain decimal)
+    r'^(-?\d+(?:\.\d+)?)$'
+))
+
+
+@lru_cache(maxsize=1024)
+def _parse_coordinate_input(input_text: str) -> Optional[float]:
+    """Memoized body of CoordinateValidator.parse_coordinate_input; field texts repeat far more than they change"""
+    input_text = input_text.strip().upper()
+    
+    # Try DMS patterns first
+    for pattern in _DMS_PATTERNS:
+        match = pattern.match(input_text)
+        if match:
+            return CoordinateValidator._parse_dms_match(match)
+    
+    # Try plain decimal
+    try:
+        return float(input_text)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=2048)
+def _format_coordinate_clean(coordinate: float, is_longitude: bool, use_dms: bool) -> str:
+    """Memoized body of CoordinateValidator.format_coordinate_clean (a pure function of its arguments)"""
+    if use_dms:
+        return CoordinateConverter.format_coordinate(coordinate, is_longitude, True)
+    else:
+        # Clean decimal formatting
+        if abs(coordinate - round(coordinate)) < 1e-10:
+            # Essentially a whole number
+            return f"{coordinate:.0f}"
+        else:
+            # Has decimals - remove trailing zeros
+            formatted = f"{coordinate:.6f}".rstrip('0').rstrip('.')
+            return formatted
+
 class CoordinateValidator:
     """
     Comprehensive coordinate validation and formatting system
     """
     
     def __init__(self):
-        # DMS parsing regex patterns
-        self.dms_patterns = [
-            # 45°30'15"N, 45°30'15"W, etc.
-            r'^(-?\d+)°(\d+)\'(\d+(?:\.\d+)?)\"([NSEW])$',
-            # 45°30'15.5"N
-            r'^(-?\d+)°(\d+)\'(\d+(?:\.\d+)?)\"([NSEW])$',
-            # 45°30"N (no minutes)
-            r'^(-?\d+)°(\d+)\"([NSEW])$',
-            # 45°N (degrees only)
-            r'^(-?\d+)°([NSEW])$',
-            # -45.5 (plain decimal)
-            r'^(-?\d+(?:\.\d+)?)$'
-        ]
+        # DMS parsing regex patterns, compiled once
+        self.dms_patterns = _DMS_PATTERNS
     
     def snap_to_pixel_grid(self, coordinate: float, database_bounds: Dict, 
                           is_longitude: bool) -> float:
@@ -128,22 +165,29 @@ class CoordinateValidator:
         """
         if not input_text or not input_text.strip():
             return None
-            
-        input_text = input_text.strip().upper()
         
-        # Try DMS patterns first
-        for pattern in self.dms_patterns:
-            match = re.match(pattern, input_text)
-            if match:
-                return self._parse_dms_match(match)
+        return _parse_coordinate_input(input_text)
+    
+    def parse_coordinate_inputs(self, input_texts, default: Optional[float] = None) -> List[Optional[float]]:
+        """
+        Parse several coordinate inputs at once
         
-        # Try plain decimal
-        try:
-            return float(input_text)
-        except ValueError:
-            return None
+        Args:
+            input_texts: Sequence of user input strings
+            default: Value returned in place of any input that doesn't parse
+            
+        Returns:
+            List of parsed coordinates, in the same order as input_texts
+        """
+        parse = self.parse_coordinate_input
+        results = []
+        for input_text in input_texts:
+            value = parse(input_text)
+            results.append(default if value is None else value)
+        return results
     
-    def _parse_dms_match(self, match) -> Optional[float]:
+    @staticmethod
+    def _parse_dms_match(match) -> Optional[float]:
         """Parse a DMS regex match into decimal degrees"""
         groups = match.groups()
         
@@ -249,17 +293,28 @@ class CoordinateValidator:
         Returns:
             Formatted coordinate string
         """
-        if use_dms:
-            return CoordinateConverter.format_coordinate(coordinate, is_longitude, True)
-        else:
-            # Clean decimal formatting
-            if abs(coordinate - round(coordinate)) < 1e-10:
-                # Essentially a whole number
-                return f"{coordinate:.0f}"
-            else:
-                # Has decimals - remove trailing zeros
-                formatted = f"{coordinate:.6f}".rstrip('0').rstrip('.')
-                return formatted
+        coordinate = float(coordinate)
+        if coordinate == 0.0:
+            # -0.0 and 0.0 share a cache key but format differently, so zero bypasses the cache
+            return _format_coordinate_clean.__wrapped__(coordinate, bool(is_longitude), bool(use_dms))
+        return _format_coordinate_clean(coordinate, bool(is_longitude), bool(use_dms))
+
+    def format_coordinates_clean(self, coordinates, is_longitude_flags,
+                                 use_dms: bool = False) -> Tuple[str, ...]:
+        """
+        Format several coordinates at once with clean display
+        
+        Args:
+            coordinates: Sequence of coordinate values
+            is_longitude_flags: Matching sequence of is_longitude flags
+            use_dms: True to format as DMS
+            
+        Returns:
+            Tuple of formatted coordinate strings, in the same order as coordinates
+        """
+        format_clean = self.format_coordinate_clean
+        return tuple(format_clean(coordinate, is_lon, use_dms)
+                     for coordinate, is_lon in zip(coordinates, is_longitude_flags))
 
 # Global validator instance
 coordinate_validator = CoordinateValidator()
\ No newline at end of file
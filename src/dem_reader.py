@@ -352,6 +352,8 @@ class DEMReader:
                 self.metadata['NROWS'] = dataset.height
                 self.metadata['NCOLS'] = dataset.width
                 self.metadata['NBANDS'] = dataset.count
+                if dataset.nodata is not None:
+                    self.metadata['NODATA'] = dataset.nodata
 
                 # Normalize bounds to handle values slightly beyond ±180°/±90°
                 self.bounds = self._normalize_bounds(
@@ -393,27 +395,95 @@ class DEMReader:
         else:
             return self._load_bil_data(subsample)
     
+    def load_elevation_window(self, col_off: int, row_off: int, width: int, height: int,
+                              mask_nodata: bool = True) -> np.ndarray:
+        """
+        Load only a rectangular pixel window of elevation data
+        
+        Unlike load_elevation_data(), only the bytes covering the window are read
+        from disk, and the result is not stored on self.elevation_data.
+        
+        Args:
+            col_off: Column offset of the window (pixels from the west edge)
+            row_off: Row offset of the window (pixels from the north edge)
+            width: Window width in pixels
+            height: Window height in pixels
+            mask_nodata: If False, keep the file's native dtype (e.g. int16) and leave
+                no-data samples (metadata['NODATA']) in place instead of converting to
+                float32 with NaN - cheaper for callers that only reduce the data
+            
+        Returns:
+            2D numpy array of elevation values (NaN for no-data unless mask_nodata is False)
+        """
+        if self.file_path.suffix.lower() in ['.tif', '.tiff']:
+            return self._load_geotiff_window(col_off, row_off, width, height, mask_nodata)
+        else:
+            return self._load_bil_window(col_off, row_off, width, height, mask_nodata)
+    
+    def _bil_dtype(self) -> str:
+        """Numpy dtype string for the BIL sample format described by the header"""
+        nbits = self.metadata['NBITS']
+        byteorder = self.metadata.get('BYTEORDER', 'M')
+        endian = '>' if byteorder == 'M' else '<'  # Motorola (big-endian) or Intel (little-endian)
+        if nbits == 16:
+            return f'{endian}i2'
+        elif nbits == 32:
+            return f'{endian}i4'
+        raise ValueError(f"Unsupported bit depth: {nbits}")
+    
+    def mmap_elevation(self) -> Optional[np.memmap]:
+        """
+        Map the raw BIL samples read-only, without reading them into memory
+        
+        Slices of the map are views; pages are only read from disk when touched.
+        Samples keep their native dtype and no-data values (metadata['NODATA']) are not masked.
+        
+        Returns:
+            (rows, cols) memory map, or None for GeoTIFF files (which may be compressed)
+        """
+        if self.file_path.suffix.lower() in ['.tif', '.tiff']:
+            return None
+        shape = (self.metadata['NROWS'], self.metadata['NCOLS'])
+        return np.memmap(self.dem_file, dtype=self._bil_dtype(), mode='r', shape=shape)
+    
+    def _load_bil_window(self, col_off: int, row_off: int, width: int, height: int,
+                         mask_nodata: bool = True) -> np.ndarray:
+        """Load a pixel window of BIL data via a read-only memory map"""
+        raw = self.mmap_elevation()
+        window = raw[row_off:row_off + height, col_off:col_off + width]
+        if not mask_nodata:
+            return np.array(window)
+        data = window.astype(np.float32)
+        del raw, window
+        
+        data[data == self.metadata['NODATA']] = np.nan
+        return data
+    
+    def _load_geotiff_window(self, col_off: int, row_off: int, width: int, height: int,
+                             mask_nodata: bool = True) -> np.ndarray:
+        """Load a pixel window of GeoTIFF data using a rasterio window read"""
+        if not RASTERIO_AVAILABLE:
+            raise ImportError("rasterio library required for GeoTIFF support")
+        from rasterio.windows import Window
+        
+        with rasterio.open(self.file_path) as dataset:
+            data = dataset.read(1, window=Window(col_off, row_off, width, height))
+            
+            # Handle no-data values
+            if mask_nodata and dataset.nodata is not None:
+                data = data.astype(np.float32)
+                data[data == dataset.nodata] = np.nan
+        
+        return data
+    
     def _load_bil_data(self, subsample: Optional[int] = None) -> np.ndarray:
         """Load BIL format elevation data"""
         nrows = self.metadata['NROWS']
         ncols = self.metadata['NCOLS']
-        nbits = self.metadata['NBITS']
-        byteorder = self.metadata.get('BYTEORDER', 'M')
         nodata = self.metadata['NODATA']
         
         # Determine data type and byte order
-        if nbits == 16:
-            if byteorder == 'M':  # Motorola (big-endian)
-                dtype = '>i2'
-            else:  # Intel (little-endian)
-                dtype = '<i2'
-        elif nbits == 32:
-            if byteorder == 'M':
-                dtype = '>i4'
-            else:
-                dtype = '<i4'
-        else:
-            raise ValueError(f"Unsupported bit depth: {nbits}")
+        dtype = self._bil_dtype()
         
         # Load data
         with open(self.dem_file, 'rb') as f:
@@ -13,8 +13,14 @@ from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Union
 import numpy as np
 from dataclasses import dataclass
+from enum import Enum
 import colorsys
 
+class GradientUnits(Enum):
+    """Units a gradient's elevation range is expressed in."""
+    METERS = "meters"
+    PERCENT = "percent"
+
 @dataclass
 class ColorStop:
     """Represents a single color stop in a gradient."""
@@ -78,6 +84,9 @@ class Gradient:
             print(f"⚠️ Invalid units '{self.units}' for gradient '{self.name}', defaulting to meters")
             self.units = "meters"
         
+        # Enum form of the (now validated) units string, for cheap comparisons
+        self.units_enum = GradientUnits(self.units)
+        
         # Ensure color stops are sorted by position
         self.color_stops.sort(key=lambda stop: stop.position)
     
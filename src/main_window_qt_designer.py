@@ -9,14 +9,26 @@ _DEBUG = False
 
 import sys
 import logging
+import bisect
 import os
+import re
 import shutil
+import subprocess
+import time
+import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import NamedTuple, Optional
 
+import numpy as np
 from PyQt6 import uic
-from PyQt6.QtWidgets import QMainWindow, QApplication, QMessageBox
-from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import (QMainWindow, QApplication, QMessageBox, QButtonGroup, QMenu,
+                             QFileDialog, QProgressDialog, QInputDialog, QPushButton)
+from PyQt6.QtCore import (QTimer, QCoreApplication, Qt, pyqtSlot, QThread, pyqtSignal, QEventLoop, QUrl,
+                          QSignalBlocker, QLocale)
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QDesktopServices, QDoubleValidator, QAction
 
 def get_resource_path(relative_path):
     """Get absolute path to resource, works for dev and PyInstaller bundled app"""
@@ -79,6 +91,36 @@ def get_writable_data_path(relative_path):
         project_root = Path(__file__).parent.parent  # Go up from src/ to project root
         return project_root / "assets" / relative_path
 
+# Matches user-created preview icon files such as "preview_icon_07.tif"
+_PREVIEW_ICON_RE = re.compile(r"preview_icon_(\d+)\.tif$")
+
+def _scan_dem_files(directory, extensions):
+    """Yield paths of regular files in directory whose lowercase extension is in extensions.
+
+    Uses os.scandir so the file type comes from the directory entry itself
+    instead of one stat call per file.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            dot = name.rfind('.')
+            if dot < 0 or name[dot:].lower() not in extensions:
+                continue
+            if entry.is_file():
+                yield Path(entry.path)
+
+def _first_file_with_suffix(directory, suffix):
+    """Return the first regular file in directory whose name ends with suffix, or None.
+
+    Stops scanning at the first match, which keeps the metadata probe cheap
+    on folders holding thousands of tiles.
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                return Path(entry.path)
+    return None
+
 def check_essential_maps():
     """Check if essential map files exist and show error dialog if missing"""
     essential_maps = [
@@ -168,10 +210,12 @@ debug_logger = setup_debug_logging()
 # Import existing modules
 from dem_reader import DEMReader
 from multi_tile_loader import MultiTileLoader
-from gradient_system import GradientManager
+from multi_file_database import MultiFileDatabase
+from gradient_system import GradientManager, GradientUnits
 from terrain_renderer import TerrainRenderer
 from recent_databases import recent_db_manager, StartupDatabaseDialog
 from coordinate_converter import CoordinateConverter
+from coordinate_validator import coordinate_validator
 from export_controls_logic import ExportControlsLogic, LockType, Units
 from map_widgets import MapDisplayWidget, WorldMapWidget
 from gradient_widgets import GradientBrowserWidget
@@ -183,9 +227,195 @@ from key_file_generator import KeyFileGenerator, create_key_filename
 from meridian_utils import normalize_longitude, calculate_longitude_span
 
 
+# Opens a file with the system default application without waiting for it; chosen once per platform
+if sys.platform == 'darwin':
+    def _open_with_default_app(path):
+        subprocess.Popen(['open', str(path)])
+elif sys.platform.startswith('win'):
+    def _open_with_default_app(path):
+        os.startfile(str(path))
+else:
+    def _open_with_default_app(path):
+        subprocess.Popen(['xdg-open', str(path)])
+
+
+# is_longitude flags for a (west, north, east, south) coordinate tuple
+_WNES_IS_LONGITUDE = (True, False, True, False)
+
+# Export scale combo entries keyed by round(percent * 10); other spinbox values show "Custom"
+_SCALE_COMBO_TEXT = {1000: "100%", 500: "50%", 333: "33.3%", 250: "25%", 100: "10%"}
+
+
+class _InfoView(NamedTuple):
+    """Fields of a database/export info dict, read once for the info panel labels"""
+    width_pixels: int
+    height_pixels: int
+    pix_per_degree: float
+    west: float
+    north: float
+    east: float
+    south: float
+
+    @classmethod
+    def from_info(cls, info):
+        get = info.get
+        return cls(get('width_pixels', 0), get('height_pixels', 0), get('pix_per_degree', 0),
+                   get('west', 0), get('north', 0), get('east', 0), get('south', 0))
+
+
+def _fmt_size(total_pixels, bytes_per_pixel):
+    """Format an estimated file size as KB below 1 MB, otherwise MB"""
+    file_size_kb = total_pixels * bytes_per_pixel / 1024
+    return f"{file_size_kb:.1f} KB" if file_size_kb < 1024 else f"{file_size_kb / 1024:.1f} MB"
+
+
+def _fmt_pixel_height(north, south, height_pixels):
+    """Format the ground height of one pixel as km (mi.)"""
+    if height_pixels > 0:
+        miles_per_pixel = abs(float(north) - float(south)) / height_pixels * 69  # Roughly 69 miles per degree latitude
+        return format_distance_km_miles(miles_per_pixel)
+    return "0.00 km (0.00 mi.)"
+
+
+def _add_database_display_strings(database_info):
+    """Store the info panel's size and pixel-height strings on a freshly built database_info
+    
+    These only change when a different database is loaded, so they are
+    formatted once here instead of on every info panel refresh.
+    """
+    db = _InfoView.from_info(database_info)
+    database_info['_size_str'] = _fmt_size(db.width_pixels * db.height_pixels, 2)  # 2 bytes per pixel estimate
+    database_info['_pxheight_str'] = _fmt_pixel_height(db.north, db.south, db.height_pixels)
+    return database_info
+
+
+def _pixel_grid(database_info):
+    """Degrees per pixel and pixels per degree (x, y) of a database, as used by clamp_to_pixel_grid
+    
+    Returns:
+        (degrees_per_pixel_x, degrees_per_pixel_y, pixels_per_degree_x, pixels_per_degree_y),
+        or () when the database has no pixel dimensions
+    """
+    width_pixels = database_info.get('width_pixels', 0)
+    height_pixels = database_info.get('height_pixels', 0)
+    if width_pixels <= 0 or height_pixels <= 0:
+        return ()
+    span_x = abs(database_info.get('east', 0) - database_info.get('west', 0))
+    span_y = abs(database_info.get('north', 0) - database_info.get('south', 0))
+    return (span_x / width_pixels, span_y / height_pixels,
+            width_pixels / span_x, height_pixels / span_y)
+
+
+# Rendered gradient preview images kept for reuse by update_gradient_preview
+_GRADIENT_PREVIEW_CACHE_SIZE = 32
+
+# Rows reduced at a time by _elevation_min_max, bounding how much of a mapped window is resident at once
+_MINMAX_BLOCK_ROWS = 1024
+
+
+def _block_min_max(block, nodata=None):
+    """(min, max) of one block of elevation data, or None if it holds no valid elevation"""
+    if block.size == 0:
+        return None
+    is_integer = block.dtype.kind in 'iu'
+    if nodata is not None:
+        # Reduce under a mask rather than building a compacted copy of the valid values
+        valid = block != nodata
+        if not is_integer:
+            valid &= ~np.isnan(block)
+        if not valid.any():
+            return None
+        if is_integer:
+            limits = np.iinfo(block.dtype)
+            return (np.min(block, where=valid, initial=limits.max),
+                    np.max(block, where=valid, initial=limits.min))
+        return (np.min(block, where=valid, initial=np.inf),
+                np.max(block, where=valid, initial=-np.inf))
+    if is_integer:
+        # Integer DEMs can't hold NaN: plain reductions
+        return block.min(), block.max()
+    # fmin/fmax skip NaN inside the reduction itself; the result is only NaN when every value is
+    block_min = np.fmin.reduce(block, axis=None)
+    if np.isnan(block_min):
+        return None
+    return block_min, np.fmax.reduce(block, axis=None)
+
+
+def _elevation_min_max(elevation_data, nodata=None):
+    """Min and max of an elevation array, skipping NaN and (if given) the raw no-data value
+    
+    The array is reduced in row blocks, so a memory-mapped window is streamed
+    through rather than copied into RAM in one piece. NumPy releases the GIL
+    inside its reductions, so the blocks are spread over a thread pool.
+    
+    Returns:
+        (min, max) as floats, or None if the array holds no valid elevation
+    """
+    blocks = [elevation_data[row:row + _MINMAX_BLOCK_ROWS]
+              for row in range(0, elevation_data.shape[0], _MINMAX_BLOCK_ROWS)]
+    if len(blocks) > 1:
+        workers = min(len(blocks), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(partial(_block_min_max, nodata=nodata), blocks))
+    else:
+        results = [_block_min_max(block, nodata) for block in blocks]
+    
+    results = [result for result in results if result is not None]
+    if not results:
+        return None
+    return float(min(r[0] for r in results)), float(max(r[1] for r in results))
+
+
+class MetadataScanThread(QThread):
+    """Thread for building a multi-file database metadata file without blocking the UI"""
+    
+    scan_finished = pyqtSignal(bool, str)  # Success flag, error message ('' when no exception)
+    
+    def __init__(self, folder_path, database_name=None):
+        super().__init__()
+        self.folder_path = folder_path
+        self.database_name = database_name
+    
+    def run(self):
+        try:
+            success = MultiFileDatabase.create_metadata_file(self.folder_path, self.database_name)
+            self.scan_finished.emit(bool(success), "")
+        except Exception as e:
+            self.scan_finished.emit(False, str(e))
+
+
+# Static first-run welcome message (rich text), built once at import time
+_WELCOME_HTML = """<h3>Setup Complete</h3>
+
+<p>Your TopoToImage workspace has been configured at:</p>
+<p><code>~/TopoToImage_Data/</code></p>
+
+<p>This workspace includes:</p>
+<ul>
+<li>Sample terrain database (Gtopo30_reduced_2160x1080.tif)</li>
+<li>Preview icon databases for visualization</li>
+<li>Gradient configurations for map styling</li>
+</ul>
+
+<p>The sample terrain database has been loaded automatically.</p>
+
+<p>You can now:</p>
+<ul>
+<li>Experiment with gradient schemes</li>
+<li>Adjust coordinate selections</li>
+<li>Export high-quality topographic maps</li>
+</ul>"""
+
+
 class DEMVisualizerQtDesignerWindow(QMainWindow):
     """Main application window using Qt Designer layout"""
     
+    # Welcome dialog icon, scaled on first use and shared across dialogs
+    _cached_welcome_pixmap = None
+    
+    # Bundled fallback preview database, resolved on first use
+    _fallback_preview_db = None
+    
     def __init__(self):
         super().__init__()
         
@@ -201,16 +431,96 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         self.key_file_generator = KeyFileGenerator(self.gradient_manager, self.terrain_renderer)
         self.updating_fields = False  # Flag to prevent signal recursion during field updates
         self.export_logic = ExportControlsLogic()  # Export controls calculation logic
+        self._recent_menu_sig = None  # Menu items the Recent Databases submenu was last built from
+        self._recent_action_map = {}  # (path, type) -> QAction currently in the Recent Databases submenu
+        self._recent_menu_separator = None  # Separator above "Clear Recent Databases"
+        self._shown_database_info = None  # Copy of the database info the info panel currently shows
+        self._shown_export_info = None  # Copy of the export info the info panel currently shows
+        self._last_selection = None  # (w, n, e, s) map selection the coordinate fields were last filled from
+        self._last_field_vals = None  # (field texts, database info) the fields were last validated against
+        self._last_gradient_name = None  # Gradient the elevation controls were last set from
+        self._last_gradient_controls = None  # Control state update_controls_from_gradient left behind
+        self._gradient_file_dialog = None  # Reused file dialog for gradient import/export (created on first use)
+        self._elev_range_cache = {}  # _elevation_range_cache_key(...) -> (min, max) found by crop-mode scans
+        self._last_coord_update_key = None  # _coord_update_key(...) after the last coordinate field update
+        self._preview_label_searched = False  # find_and_setup_preview_widget already scanned all labels
+        self._gradient_preview_cache = OrderedDict()  # _gradient_preview_cache_key(...) -> (QImage, its pixel bytes), LRU order
+        self._scaled_preview_cache = OrderedDict()  # (QImage.cacheKey(), label w, label h) -> scaled QPixmap, LRU order
+        
+        # Coordinate field edits are applied once per event-loop pass: Enter emits both
+        # returnPressed and editingFinished, which would otherwise validate twice
+        self._coord_apply_timer = QTimer(self)
+        self._coord_apply_timer.setSingleShot(True)
+        self._coord_apply_timer.setInterval(0)
+        self._coord_apply_timer.timeout.connect(self._apply_coordinate_field_changes)
+        
+        # Export size/resolution recalculation is debounced so bursts of control changes
+        # (scale, lock, units, selection) recompute once; finished edits flush it immediately
+        self._export_calc_timer = QTimer(self)
+        self._export_calc_timer.setSingleShot(True)
+        self._export_calc_timer.setInterval(50)
+        self._export_calc_timer.timeout.connect(self._do_update_export_calculations)
+        
+        # Bursts of gradient preview triggers (spinbox typing/scrolling, arrowing through
+        # the gradient list, repeated cycling clicks) re-render once the burst settles
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(100)
+        self._preview_timer.timeout.connect(self.update_gradient_preview)
         
         # Preview database cycling state
         self.preview_databases = []  # List of available preview database files
         self.current_preview_index = 0  # Index of currently active preview database
+        self._last_preview_click_time = 0.0  # Timestamp of last left-click on preview (double-click detection)
+        self._preview_numbers = None  # Numbers used by preview_icon_NN.tif files (scanned lazily)
+        self._preview_scratch = None  # Reusable 120x120 float32 buffer for preview icon resampling
         
         # Preview window
         self.preview_window = None  # Will be created when first needed
         
+        # User guide PDF in the application directory; existence is re-checked only while it is missing
+        self._user_guide_path = Path(__file__).resolve().parent / "TopoToImage_User_Guide.pdf"
+        self._user_guide_exists = self._user_guide_path.exists()
+        
         # Load the UI file
         self.load_ui()
+        
+        # Optional widgets, resolved once so hot handlers test for None instead of hasattr
+        self._dms_radio = getattr(self, 'dms_radio', None)
+        self._decimal_radio = getattr(self, 'decimal_radio', None)
+        self._scale_to_crop_radio = getattr(self, 'scale_to_crop_radio', None)
+        self._scale_to_max_min_radio = getattr(self, 'scale_to_max_min_radio', None)
+        self._min_elevation = getattr(self, 'min_elevation', None)
+        self._max_elevation = getattr(self, 'max_elevation', None)
+        self._meters_radio = getattr(self, 'meters_radio', None)
+        self._resolution_unit_label = getattr(self, 'resolution_unit_label', None)
+        self._export_scale_spinbox = getattr(self, 'export_scale_spinbox', None)
+        self._gradient_list = getattr(self, 'gradient_list', None)
+        # Export size fields, in the order _do_update_export_calculations fills them
+        self._export_size_edits = [getattr(self, name, None) for name in ('width_edit', 'height_edit', 'resolution_edit')]
+        
+        # Coordinate format (DMS or decimal) the coordinate fields are currently written in
+        self._coord_fields_dms = self._dms_radio is not None and self._dms_radio.isChecked()
+        
+        # Export lock/units radio button -> setting, for one-lookup dispatch in the button group handlers
+        self._lock_map = {}
+        for name, lock_type in (('lock_width_radio', LockType.WIDTH),
+                                ('lock_height_radio', LockType.HEIGHT),
+                                ('lock_resolution_radio', LockType.RESOLUTION)):
+            if hasattr(self, name):
+                self._lock_map[getattr(self, name)] = lock_type
+        self._units_map = {}
+        for name, units in (('inches_radio', (Units.INCHES, "In.")),
+                            ('picas_radio', (Units.PICAS, "Pi.")),
+                            ('points_radio', (Units.POINTS, "Pt.")),
+                            ('cm_radio', (Units.CENTIMETERS, "CM"))):
+            if hasattr(self, name):
+                self._units_map[getattr(self, name)] = units
+        
+        # Width/height unit labels follow the selected units
+        self._unit_labels = [getattr(self, name) for name in ('width_unit_label', 'height_unit_label')
+                             if hasattr(self, name)]
+        self._current_unit_text = None  # Text the unit labels were last set to
         self.setup_menu()
         self.setup_status_bar()
         
@@ -676,7 +986,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 self.load_list_btn.clicked.connect(self.load_gradient_list_from_file)
             
             # Connect coordinate format toggle (using the button group)
-            from PyQt6.QtWidgets import QButtonGroup
             self.coord_format_group = QButtonGroup(self)
             self.coord_format_group.addButton(self.decimal_radio)
             self.coord_format_group.addButton(self.dms_radio)
@@ -690,6 +999,17 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             if hasattr(self, 'export_scale_spinbox'):
                 self.export_scale_spinbox.valueChanged.connect(self.on_export_scale_spinbox_changed)
             
+            # Export dimension fields only accept plain positive numbers, so editingFinished
+            # (which requires acceptable input) always carries a value float() can parse
+            number_locale = QLocale.c()
+            number_locale.setNumberOptions(QLocale.NumberOption.RejectGroupSeparator)
+            for name in ('width_edit', 'height_edit', 'resolution_edit'):
+                if hasattr(self, name):
+                    validator = QDoubleValidator(0.0, 1e9, 6, self)
+                    validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+                    validator.setLocale(number_locale)
+                    getattr(self, name).setValidator(validator)
+            
             # Export dimension fields (connect to editingFinished to avoid constant updates)
             if hasattr(self, 'width_edit'):
                 self.width_edit.editingFinished.connect(self.on_width_changed)
@@ -763,6 +1083,9 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             select_gradient_name: Optional name of gradient to select after loading
         """
         try:
+            # Gradients may have been edited; controls must be re-applied from the reloaded data
+            self._last_gradient_name = None
+            
             if hasattr(self, 'gradient_list'):
                 # Clear existing items
                 self.gradient_list.clear()
@@ -787,7 +1110,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     self.gradient_list.setCurrentRow(selected_row)
                     
                     # Ensure the selection is processed
-                    from PyQt6.QtCore import QCoreApplication
                     QCoreApplication.processEvents()
                     
                     # Update controls based on the selected gradient
@@ -854,6 +1176,11 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             print(f"⚠️  Error checking first run status: {e}")
             return False  # Assume not first run to avoid errors
     
+    def mark_first_run_complete(self, user_data_dir):
+        """Create the first-run flag file with a single open/close (no separate utime call)"""
+        first_run_flag = user_data_dir / ".first_run_complete"
+        os.close(os.open(first_run_flag, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644))
+    
     def setup_first_run_experience(self):
         """Set up first-run experience with sample data and user directory"""
         try:
@@ -913,17 +1240,12 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     self.status_bar.showMessage(welcome_msg, 8000)
                     
                     # Add sample database to recent databases so it loads on next run
-                    from recent_databases import recent_db_manager
-                    recent_db_manager.add_recent_database(str(user_sample), 'single_file', 'Gtopo30_reduced_2160x1080.tif')
+                    # (single write; also creates the file in the development assets location)
+                    recent_db_manager.add_recent_database(str(user_sample), 'single_file', 'Gtopo30_reduced_2160x1080.tif',
+                                                          defer_save=True)
+                    recent_db_manager.save_recent_databases()
                     print(f"📝 Added sample database to recent databases")
                     
-                    # Also ensure recent database file exists in development assets location
-                    # (since get_writable_data_path points there in development mode)
-                    dev_recent_db_file = get_writable_data_path("recent_databases.json")
-                    if not dev_recent_db_file.exists():
-                        print(f"📝 Creating recent database file in development assets")
-                        recent_db_manager.save_recent_databases()
-                    
                     # Show proper welcome dialog box
                     self.show_welcome_dialog()
                     
@@ -931,8 +1253,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     self.update_window_title("Gtopo30_reduced_2160x1080.tif - TopoToImage")
                     
                     # Mark first run as complete (in home directory)
-                    first_run_flag = user_data_dir / ".first_run_complete"
-                    first_run_flag.touch()
+                    self.mark_first_run_complete(user_data_dir)
                     print(f"✅ First run setup completed")
                     
                     return True
@@ -953,8 +1274,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                         self.update_window_title("assembled_dem_20250811_194830.dem")
                         
                         # Mark first run as complete (in home directory)
-                        first_run_flag = user_data_dir / ".first_run_complete"
-                        first_run_flag.touch()
+                        self.mark_first_run_complete(user_data_dir)
                         print(f"✅ First run setup completed")
                         
                         return True
@@ -970,10 +1290,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
     def show_welcome_dialog(self):
         """Show welcome dialog for first-run users"""
         try:
-            from PyQt6.QtWidgets import QMessageBox
-            from PyQt6.QtCore import Qt
-            from PyQt6.QtGui import QIcon, QPixmap
-            
             # Create welcome message box
             msg_box = QMessageBox(self)
             msg_box.setWindowTitle("TopoToImage - Initial Setup Complete")
@@ -983,38 +1299,19 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             if icon_path.exists():
                 app_icon = QIcon(str(icon_path))
                 msg_box.setWindowIcon(app_icon)
-                # Try to set a custom icon for the dialog
+                # Try to set a custom icon for the dialog (decoded once per session)
                 try:
-                    pixmap = QPixmap(str(icon_path)).scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
-                    msg_box.setIconPixmap(pixmap)
+                    cls = type(self)
+                    if cls._cached_welcome_pixmap is None:
+                        cls._cached_welcome_pixmap = QPixmap(str(icon_path)).scaled(64, 64, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                    msg_box.setIconPixmap(cls._cached_welcome_pixmap)
                 except:
                     msg_box.setIcon(QMessageBox.Icon.Information)
             else:
                 msg_box.setIcon(QMessageBox.Icon.Information)
             
             # Professional welcome message
-            welcome_text = """<h3>Setup Complete</h3>
-
-<p>Your TopoToImage workspace has been configured at:</p>
-<p><code>~/TopoToImage_Data/</code></p>
-
-<p>This workspace includes:</p>
-<ul>
-<li>Sample terrain database (Gtopo30_reduced_2160x1080.tif)</li>
-<li>Preview icon databases for visualization</li>
-<li>Gradient configurations for map styling</li>
-</ul>
-
-<p>The sample terrain database has been loaded automatically.</p>
-
-<p>You can now:</p>
-<ul>
-<li>Experiment with gradient schemes</li>
-<li>Adjust coordinate selections</li>
-<li>Export high-quality topographic maps</li>
-</ul>"""
-
-            msg_box.setText(welcome_text)
+            msg_box.setText(_WELCOME_HTML)
             msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
             
             # Professional dialog size
@@ -1048,10 +1345,9 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 debug_logger.info("📂 Development mode: scanning single directory")
                 if bundled_preview_dir.exists():
                     debug_logger.info("📂 Scanning preview databases:")
-                    for file_path in bundled_preview_dir.iterdir():
-                        if file_path.is_file() and file_path.suffix.lower() in dem_extensions:
-                            debug_logger.info(f"  📄 Found: {file_path.name}")
-                            self.preview_databases.append(file_path)
+                    for file_path in _scan_dem_files(bundled_preview_dir, dem_extensions):
+                        debug_logger.info(f"  📄 Found: {file_path.name}")
+                        self.preview_databases.append(file_path)
                 else:
                     debug_logger.warning(f"📂 Preview directory does not exist: {bundled_preview_dir}")
             else:
@@ -1062,25 +1358,23 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 # Scan bundled first
                 if bundled_preview_dir.exists():
                     debug_logger.info("📂 Scanning bundled preview databases:")
-                    for file_path in bundled_preview_dir.iterdir():
-                        if file_path.is_file() and file_path.suffix.lower() in dem_extensions:
-                            filename = file_path.name
-                            debug_logger.info(f"  📄 Found bundled: {filename}")
-                            self.preview_databases.append(file_path)
-                            seen_filenames.add(filename)
+                    for file_path in _scan_dem_files(bundled_preview_dir, dem_extensions):
+                        filename = file_path.name
+                        debug_logger.info(f"  📄 Found bundled: {filename}")
+                        self.preview_databases.append(file_path)
+                        seen_filenames.add(filename)
                 
                 # Scan user directory, skipping duplicates
                 if user_preview_dir.exists():
                     debug_logger.info("📂 Scanning user-created preview databases:")
-                    for file_path in user_preview_dir.iterdir():
-                        if file_path.is_file() and file_path.suffix.lower() in dem_extensions:
-                            filename = file_path.name
-                            if filename not in seen_filenames:
-                                debug_logger.info(f"  📄 Found user-created: {filename}")
-                                self.preview_databases.append(file_path)
-                                seen_filenames.add(filename)
-                            else:
-                                debug_logger.info(f"  ⚠️  Skipping duplicate: {filename}")
+                    for file_path in _scan_dem_files(user_preview_dir, dem_extensions):
+                        filename = file_path.name
+                        if filename not in seen_filenames:
+                            debug_logger.info(f"  📄 Found user-created: {filename}")
+                            self.preview_databases.append(file_path)
+                            seen_filenames.add(filename)
+                        else:
+                            debug_logger.info(f"  ⚠️  Skipping duplicate: {filename}")
             
             # Sort by name for consistent ordering
             self.preview_databases.sort(key=lambda p: p.name)
@@ -1110,16 +1404,10 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         """Set up double-click handler and tooltip for the preview label"""
         try:
             if hasattr(self, 'preview_label') and self.preview_label:
-                # Create a custom preview label class that handles double-clicks
-                from PyQt6.QtWidgets import QLabel
-                from PyQt6.QtCore import QEvent
-                
                 # Store original mousePressEvent if it exists
                 original_mouse_press = getattr(self.preview_label, 'mousePressEvent', None)
                 
                 def handle_mouse_press(event):
-                    from PyQt6.QtCore import Qt
-                    import time  # Move import to top of function
                     
                     print(f"🖱️  === PREVIEW MOUSE PRESS EVENT ===")
                     print(f"🖱️  Button: {event.button()}")
@@ -1132,24 +1420,21 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                         print(f"🖱️  Current time: {current_time}")
                         
                         # Check for double-click
-                        if hasattr(handle_mouse_press, 'last_click_time'):
-                            time_diff = current_time - handle_mouse_press.last_click_time
-                            print(f"🖱️  Last click time: {handle_mouse_press.last_click_time}")
-                            print(f"🖱️  Time difference: {time_diff:.3f}s")
-                            print(f"🖱️  Double-click threshold: 0.5s")
-                            
-                            if time_diff < 0.5:  # 500ms double-click threshold
-                                print(f"🖱️  ✅ DOUBLE-CLICK DETECTED! Cycling preview database...")
-                                self.cycle_to_next_preview_database()
-                                print(f"🖱️  ✅ Double-click handler completed, returning early")
-                                return
-                            else:
-                                print(f"🖱️  ❌ Not a double-click (time diff: {time_diff:.3f}s > 0.5s)")
+                        time_diff = current_time - self._last_preview_click_time
+                        print(f"🖱️  Last click time: {self._last_preview_click_time}")
+                        print(f"🖱️  Time difference: {time_diff:.3f}s")
+                        print(f"🖱️  Double-click threshold: 0.5s")
+                        
+                        if time_diff < 0.5:  # 500ms double-click threshold
+                            print(f"🖱️  ✅ DOUBLE-CLICK DETECTED! Cycling preview database...")
+                            self.cycle_to_next_preview_database()
+                            print(f"🖱️  ✅ Double-click handler completed, returning early")
+                            return
                         else:
-                            print(f"🖱️  ❌ No previous click recorded")
+                            print(f"🖱️  ❌ Not a double-click (time diff: {time_diff:.3f}s > 0.5s)")
                         
                         print(f"🖱️  Recording click time: {current_time}")
-                        handle_mouse_press.last_click_time = current_time
+                        self._last_preview_click_time = current_time
                         
                     elif event.button() == Qt.MouseButton.RightButton:
                         print(f"🖱️  Right button pressed - showing context menu")
@@ -1217,8 +1502,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
     def show_preview_context_menu(self, global_pos):
         """Show context menu for preview icon with delete option"""
         try:
-            from PyQt6.QtWidgets import QMenu
-            
             # Don't show context menu if no databases available
             if not self.preview_databases:
                 return
@@ -1251,6 +1534,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             import traceback
             traceback.print_exc()
     
+    @pyqtSlot()
     def delete_current_preview_database(self):
         """Delete the currently active preview database"""
         try:
@@ -1332,11 +1616,11 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 self.status_bar.showMessage("Failed to create preview icon: Could not extract elevation data", 3000)
                 return
             
-            # Crop to square aspect ratio (center crop)
-            square_data = self.crop_to_square_aspect_ratio(elevation_data)
+            # Square aspect ratio (center crop) - computed as a region, not sliced
+            square_region = self.crop_to_square_aspect_ratio(elevation_data)
             
-            # Scale to 120x120 pixels using high-quality resampling
-            preview_data = self.scale_elevation_data_to_120x120(square_data)
+            # Scale the square region to 120x120 pixels using high-quality resampling
+            preview_data = self.scale_elevation_data_to_120x120(elevation_data, square_region)
             
             # Generate a unique filename
             preview_filename = self.generate_unique_preview_filename()
@@ -1344,18 +1628,24 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             # Save as GeoTIFF in the preview databases folder (use writable location)
             preview_path = get_writable_data_path("preview_icon_databases") / preview_filename
             self.save_elevation_data_as_geotiff(preview_data, selection_bounds, preview_path)
+            match = _PREVIEW_ICON_RE.match(preview_filename)
+            if match and self._preview_numbers is not None:
+                self._preview_numbers.add(int(match.group(1)))
+            
+            # Insert the new database into the (name-sorted) list instead of rescanning the folders
+            existing = [i for i, db_path in enumerate(self.preview_databases) if db_path.name == preview_filename]
+            if existing:
+                self.preview_databases[existing[0]] = preview_path
+                self.current_preview_index = existing[0]
+            else:
+                names = [db_path.name for db_path in self.preview_databases]
+                insert_index = bisect.bisect(names, preview_filename)
+                self.preview_databases.insert(insert_index, preview_path)
+                self.current_preview_index = insert_index
+            self.update_preview_icon_menu_state()
             
-            # Refresh the preview database list
-            self.scan_preview_databases()
-            
-            # Switch to the new preview database (it will be the last one after sorting)
+            # Switch to the new preview database
             if self.preview_databases:
-                # Find the new database in the list
-                for i, db_path in enumerate(self.preview_databases):
-                    if db_path.name == preview_filename:
-                        self.current_preview_index = i
-                        break
-                
                 # Update the preview and tooltip
                 self.update_gradient_preview()
                 self.update_preview_tooltip()
@@ -1388,54 +1678,14 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             # Try single DEM file first (most common case)
             if hasattr(self, 'current_dem_file') and self.current_dem_file:
                 print(f"📁 Using single DEM file: {self.current_dem_file}")
-                # Use single DEM file
-                from dem_reader import DEMReader
-                dem_reader = DEMReader(self.current_dem_file)
-                
-                # Load elevation data
-                full_elevation_data = dem_reader.load_elevation_data()
-                if full_elevation_data is None:
-                    print("❌ Failed to load elevation data from DEM file")
-                    return None
-                
-                # For single files covering large areas, we need to crop to the selection bounds
-                # Get the geographic bounds of the DEM file
-                try:
-                    bounds_list = dem_reader.get_geographic_bounds()
-                    if bounds_list and len(bounds_list) >= 4:
-                        # Convert from list format [west, north, east, south] to dict
-                        dem_bounds = {
-                            'west': bounds_list[0],
-                            'north': bounds_list[1], 
-                            'east': bounds_list[2],
-                            'south': bounds_list[3]
-                        }
-                        print(f"📍 DEM file bounds: W={dem_bounds['west']}, N={dem_bounds['north']}, E={dem_bounds['east']}, S={dem_bounds['south']}")
-                        
-                        # Calculate which portion of the data corresponds to the selection
-                        cropped_data = self.crop_elevation_data_to_geographic_bounds(
-                            full_elevation_data, dem_bounds, bounds
-                        )
-                        
-                        if cropped_data is not None:
-                            print(f"✅ Cropped elevation data from single DEM file: {cropped_data.shape}")
-                            return cropped_data
-                        else:
-                            print("⚠️  Selection outside DEM bounds, using full data")
-                            return full_elevation_data
-                    else:
-                        print("⚠️  Could not get DEM bounds, using full elevation data")
-                        return full_elevation_data
-                        
-                except Exception as e:
-                    print(f"⚠️  Error getting DEM bounds: {e}, using full elevation data")
-                    return full_elevation_data
+                # Reuse the reader (parsed header, bounds and raster shape) across previews
+                dem_reader = self._get_preview_source_reader(self.current_dem_file)
+                return self._read_window_for_bounds(dem_reader, bounds)
                     
             # Check if we have a multi-file database
             elif hasattr(self, 'current_database_info') and self.current_database_info and self.current_database_info.get('type') == 'multi_file':
                 print(f"📁 Using multi-file database: {self.current_database_info['path']}")
                 # Use multi-file database assembly
-                from multi_file_database import MultiFileDatabase
                 multi_db = MultiFileDatabase(self.current_database_info['path'])
                 
                 # Assemble tiles for the specified bounds
@@ -1466,31 +1716,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 print(f"📄 Using single-file database via current_database_info: {self.current_database_info['path']}")
                 # Use single-file database via dem_reader
                 if hasattr(self, 'dem_reader') and self.dem_reader:
-                    # Load elevation data
-                    full_elevation_data = self.dem_reader.load_elevation_data()
-                    if full_elevation_data is None:
-                        print("❌ Failed to load elevation data from single-file database")
-                        return None
-                    
-                    # Crop to bounds
-                    try:
-                        dem_bounds = self.dem_reader.bounds
-                        print(f"📍 Single-file database bounds: W={dem_bounds['west']}, N={dem_bounds['north']}, E={dem_bounds['east']}, S={dem_bounds['south']}")
-                        
-                        # Calculate which portion of the data corresponds to the selection
-                        cropped_data = self.crop_elevation_data_to_geographic_bounds(
-                            full_elevation_data, dem_bounds, bounds
-                        )
-                        
-                        if cropped_data is not None:
-                            print(f"✅ Cropped elevation data from single-file database: {cropped_data.shape}")
-                            return cropped_data
-                        else:
-                            print("⚠️  Selection outside database bounds, using full data")
-                            return full_elevation_data
-                    except Exception as e:
-                        print(f"⚠️  Error cropping single-file database data: {e}, using full data")
-                        return full_elevation_data
+                    return self._read_window_for_bounds(self.dem_reader, bounds)
                 else:
                     print("❌ No DEM reader available for single-file database")
                     return None
@@ -1505,62 +1731,150 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             traceback.print_exc()
             return None
     
+    def _get_preview_source_reader(self, dem_file):
+        """Return a DEMReader for dem_file, reusing the cached one if the path is unchanged"""
+        cached = getattr(self, '_preview_source_reader', None)
+        if cached is None or cached[0] != dem_file:
+            cached = (dem_file, DEMReader(dem_file))
+            self._preview_source_reader = cached
+        return cached[1]
+    
+    def _read_window_for_bounds(self, reader, sel_bounds):
+        """Read the elevation pixels of a single-file DEM that fall within sel_bounds
+        
+        Only the selection's pixel window is read from disk. Falls back to the full
+        raster if the reader has no bounds or the selection does not overlap it.
+        """
+        try:
+            dem_bounds = reader.bounds
+            if dem_bounds:
+                print(f"📍 DEM bounds: W={dem_bounds['west']}, N={dem_bounds['north']}, E={dem_bounds['east']}, S={dem_bounds['south']}")
+                
+                # Calculate which portion of the data corresponds to the selection
+                window = self._geographic_bounds_to_pixel_window(
+                    dem_bounds, reader.height, reader.width, sel_bounds
+                )
+                
+                if window is not None:
+                    y_start, y_end, x_start, x_end = window
+                    cropped_data = reader.load_elevation_window(
+                        x_start, y_start, x_end - x_start, y_end - y_start
+                    )
+                    print(f"✅ Read elevation window: {cropped_data.shape}")
+                    return cropped_data
+                else:
+                    print("⚠️  Selection outside DEM bounds, using full data")
+            else:
+                print("⚠️  Could not get DEM bounds, using full elevation data")
+                
+        except Exception as e:
+            print(f"⚠️  Error reading DEM window: {e}, using full elevation data")
+        
+        # Fallback: load the full elevation data
+        full_elevation_data = reader.load_elevation_data()
+        if full_elevation_data is None:
+            print("❌ Failed to load elevation data from DEM file")
+        return full_elevation_data
+    
+    def _mapped_window_for_bounds(self, reader, sel_bounds):
+        """Native-dtype view of the selection's pixel window, for reductions like the elevation range scan
+        
+        BIL rasters are memory-mapped and sliced, so the window is streamed from disk
+        rather than copied into RAM. GeoTIFF windows are read in the file's own dtype
+        (int16 stays int16) with no-data left in place rather than masked to float32 NaN.
+        Falls back to _read_window_for_bounds if the selection can't be windowed.
+        
+        Returns:
+            (elevation_data, nodata) - nodata is the raw no-data value left in the data, else None
+        """
+        try:
+            if reader.bounds:
+                window = self._geographic_bounds_to_pixel_window(
+                    reader.bounds, reader.height, reader.width, sel_bounds
+                )
+                if window is not None:
+                    y_start, y_end, x_start, x_end = window
+                    nodata = reader.metadata.get('NODATA')
+                    raw = reader.mmap_elevation()
+                    if raw is not None:
+                        return raw[y_start:y_end, x_start:x_end], nodata
+                    return reader.load_elevation_window(
+                        x_start, y_start, x_end - x_start, y_end - y_start, mask_nodata=False
+                    ), nodata
+        except Exception as e:
+            print(f"⚠️  Could not read native DEM window: {e}")
+        
+        return self._read_window_for_bounds(reader, sel_bounds), None
+    
+    def _geographic_bounds_to_pixel_window(self, dem_bounds, height, width, selection_bounds):
+        """Convert selection bounds to a pixel window of a DEM raster
+        
+        Returns:
+            (y_start, y_end, x_start, x_end) clipped to the raster, or None if the window is empty
+        """
+        # Calculate the pixel coordinates that correspond to the selection bounds
+        dem_west = dem_bounds['west']
+        dem_east = dem_bounds['east'] 
+        dem_north = dem_bounds['north']
+        dem_south = dem_bounds['south']
+        
+        sel_west = selection_bounds['west']
+        sel_east = selection_bounds['east']
+        sel_north = selection_bounds['north'] 
+        sel_south = selection_bounds['south']
+        
+        # Calculate pixel coordinates (0,0 is top-left)
+        # X corresponds to longitude (west to east)
+        # Y corresponds to latitude (north to south, inverted)
+        
+        # Calculate X bounds (longitude)
+        if dem_east > dem_west:  # Normal case (no meridian crossing)
+            x_start = max(0, int((sel_west - dem_west) / (dem_east - dem_west) * width))
+            x_end = min(width, int((sel_east - dem_west) / (dem_east - dem_west) * width))
+        else:
+            # Handle meridian crossing case if needed
+            x_start = 0
+            x_end = width
+        
+        # Calculate Y bounds (latitude, inverted because image coordinates)
+        if dem_north > dem_south:  # Normal case
+            y_start = max(0, int((dem_north - sel_north) / (dem_north - dem_south) * height))
+            y_end = min(height, int((dem_north - sel_south) / (dem_north - dem_south) * height))
+        else:
+            y_start = 0
+            y_end = height
+        
+        # Ensure we have valid bounds
+        if x_start >= x_end or y_start >= y_end:
+            print(f"⚠️  Invalid crop bounds: x={x_start}:{x_end}, y={y_start}:{y_end}")
+            return None
+        
+        return y_start, y_end, x_start, x_end
+    
     def crop_elevation_data_to_geographic_bounds(self, elevation_data, dem_bounds, selection_bounds):
-        """Crop elevation data to match the selected geographic bounds"""
+        """Crop elevation data to match the selected geographic bounds
+        
+        Returns a view into elevation_data (basic slicing, no copy), or None on failure.
+        """
         try:
-            import numpy as np
-            
             height, width = elevation_data.shape
             
-            # Calculate the pixel coordinates that correspond to the selection bounds
-            dem_west = dem_bounds['west']
-            dem_east = dem_bounds['east'] 
-            dem_north = dem_bounds['north']
-            dem_south = dem_bounds['south']
-            
-            sel_west = selection_bounds['west']
-            sel_east = selection_bounds['east']
-            sel_north = selection_bounds['north'] 
-            sel_south = selection_bounds['south']
-            
-            # Calculate pixel coordinates (0,0 is top-left)
-            # X corresponds to longitude (west to east)
-            # Y corresponds to latitude (north to south, inverted)
-            
-            # Calculate X bounds (longitude)
-            if dem_east > dem_west:  # Normal case (no meridian crossing)
-                x_start = max(0, int((sel_west - dem_west) / (dem_east - dem_west) * width))
-                x_end = min(width, int((sel_east - dem_west) / (dem_east - dem_west) * width))
-            else:
-                # Handle meridian crossing case if needed
-                x_start = 0
-                x_end = width
-            
-            # Calculate Y bounds (latitude, inverted because image coordinates)
-            if dem_north > dem_south:  # Normal case
-                y_start = max(0, int((dem_north - sel_north) / (dem_north - dem_south) * height))
-                y_end = min(height, int((dem_north - sel_south) / (dem_north - dem_south) * height))
-            else:
-                y_start = 0
-                y_end = height
-            
-            # Ensure we have valid bounds
-            if x_start >= x_end or y_start >= y_end:
-                print(f"⚠️  Invalid crop bounds: x={x_start}:{x_end}, y={y_start}:{y_end}")
+            window = self._geographic_bounds_to_pixel_window(dem_bounds, height, width, selection_bounds)
+            if window is None:
                 return None
+            y_start, y_end, x_start, x_end = window
             
             # Crop the elevation data
             cropped_data = elevation_data[y_start:y_end, x_start:x_end]
             
             print(f"📐 Cropped elevation data: {height}x{width} → {cropped_data.shape}")
-            print(f"   Selection bounds: W={sel_west}, N={sel_north}, E={sel_east}, S={sel_south}")
+            print(f"   Selection bounds: W={selection_bounds['west']}, N={selection_bounds['north']}, E={selection_bounds['east']}, S={selection_bounds['south']}")
             print(f"   Pixel bounds: x={x_start}:{x_end}, y={y_start}:{y_end}")
             
-            # Add diagnostic information about the cropped data
-            if cropped_data.size > 0:
-                min_val = np.nanmin(cropped_data)
-                max_val = np.nanmax(cropped_data)
-                valid_pixels = np.sum(~np.isnan(cropped_data))
+            # Add diagnostic information about the cropped data (full scans - debug only)
+            if _DEBUG and cropped_data.size > 0:
+                from nan_aware_interpolation import nan_stats
+                min_val, max_val, _, valid_pixels = nan_stats(cropped_data)
                 print(f"   Cropped data range: {min_val} to {max_val} meters")
                 print(f"   Valid pixels: {valid_pixels}/{cropped_data.size}")
             
@@ -1573,205 +1887,83 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             return None
     
     def crop_to_square_aspect_ratio(self, elevation_data):
-        """Crop elevation data to square aspect ratio (center crop)"""
-        try:
-            if elevation_data is None:
-                return None
-                
-            height, width = elevation_data.shape
-            print(f"📐 Cropping elevation data from {width}x{height} to square")
-            
-            # Determine the size of the square (minimum of width/height)
-            square_size = min(width, height)
-            
-            # Calculate center crop coordinates
-            center_x = width // 2
-            center_y = height // 2
-            half_size = square_size // 2
-            
-            # Crop to square
-            start_x = center_x - half_size
-            end_x = start_x + square_size
-            start_y = center_y - half_size  
-            end_y = start_y + square_size
-            
-            # Ensure we don't go out of bounds
-            start_x = max(0, start_x)
-            end_x = min(width, end_x)
-            start_y = max(0, start_y)
-            end_y = min(height, end_y)
-            
-            square_data = elevation_data[start_y:end_y, start_x:end_x]
-            print(f"✅ Cropped to square: {square_data.shape}")
-            
-            return square_data
-            
-        except Exception as e:
-            print(f"❌ Error cropping to square: {e}")
-            import traceback
-            traceback.print_exc()
+        """Compute the centered square crop of elevation data.
+        
+        Returns (slice_y, slice_x) rather than a sliced array so the resampler
+        can read the square region directly from the source data.
+        """
+        if elevation_data is None:
             return None
+            
+        height, width = elevation_data.shape
+        
+        # Square size is the minimum of width/height; centered crop always fits
+        square_size = min(width, height)
+        x_start = width // 2 - square_size // 2
+        y_start = height // 2 - square_size // 2
+        
+        return slice(y_start, y_start + square_size), slice(x_start, x_start + square_size)
     
-    def scale_elevation_data_to_120x120(self, elevation_data):
-        """Scale elevation data to 120x120 pixels using NaN-aware resampling"""
+    def scale_elevation_data_to_120x120(self, elevation_data, square_region=None):
+        """Scale elevation data to 120x120 pixels using NaN-aware resampling
+        
+        Args:
+            elevation_data: Source elevation array
+            square_region: Optional (slice_y, slice_x) from crop_to_square_aspect_ratio;
+                only that region of elevation_data is sampled
+        """
         try:
             if elevation_data is None:
                 return None
                 
-            import numpy as np
+            # Local: nan_aware_interpolation pulls in scipy.ndimage, which is only loaded on first use
+            from nan_aware_interpolation import resize_bilinear_nan
             
-            print(f"🔄 Scaling elevation data from {elevation_data.shape} to 120x120")
+            region = None
+            if square_region is not None:
+                slice_y, slice_x = square_region
+                region = (slice_y.start, slice_x.start,
+                          slice_y.stop - slice_y.start, slice_x.stop - slice_x.start)
             
-            # Check for NaN values before scaling
-            nan_mask = np.isnan(elevation_data)
-            valid_pixels_before = np.sum(~nan_mask)
-            total_pixels_before = elevation_data.size
+            print(f"🔄 Scaling elevation data from {elevation_data.shape} (region {region}) to 120x120")
             
-            if valid_pixels_before == 0:
-                print("❌ All input data is NaN - cannot scale")
-                return np.full((120, 120), np.nan, dtype=np.float32)
+            # Reuse one output buffer across icon creations (written to disk immediately)
+            if self._preview_scratch is None:
+                self._preview_scratch = np.empty((120, 120), dtype=np.float32)
             
-            print(f"📊 Input data: {valid_pixels_before}/{total_pixels_before} valid pixels ({100*valid_pixels_before/total_pixels_before:.1f}%)")
+            # Single-pass bilinear resample; NaN (no-data) propagates from any neighbour
+            scaled_data = resize_bilinear_nan(elevation_data, (120, 120), region, out=self._preview_scratch)
             
-            # Use NaN-aware scaling approach
-            try:
-                from scipy.ndimage import zoom
-                
-                current_height, current_width = elevation_data.shape
-                scale_y = 120.0 / current_height
-                scale_x = 120.0 / current_width
-                
-                # Method 1: Handle NaN values properly for no-data color rendering
-                if np.any(nan_mask):
-                    print("🌊 Preserving NaN values for proper no-data color rendering...")
-                    
-                    # Create a copy for processing
-                    filled_data = elevation_data.copy()
-                    
-                    # Temporarily fill NaN with a placeholder value for scaling
-                    # We'll restore NaN values afterwards
-                    valid_mean = np.nanmean(elevation_data)
-                    if np.isnan(valid_mean):
-                        # All data is NaN, use 0 as placeholder
-                        placeholder_value = 0.0
-                    else:
-                        placeholder_value = valid_mean
-                    
-                    filled_data[nan_mask] = placeholder_value
-                    
-                    # Scale the temporarily filled data
-                    scaled_data = zoom(filled_data, (scale_y, scale_x), order=1)  # Use linear interpolation
-                    
-                    # Now we need to determine which pixels in the scaled data should be NaN
-                    # Scale the NaN mask to match the new resolution
-                    nan_mask_float = nan_mask.astype(np.float32)
-                    scaled_nan_mask = zoom(nan_mask_float, (scale_y, scale_x), order=0)  # Use nearest neighbor for mask
-                    
-                    # Restore NaN values where the scaled mask indicates no-data areas
-                    # Use a threshold to determine which pixels should be NaN (>0.5 means mostly no-data)
-                    scaled_data[scaled_nan_mask > 0.5] = np.nan
-                    
-                    print(f"✅ Scaled data preserving NaN areas using scipy.ndimage.zoom: {scaled_data.shape}")
-                else:
-                    # No NaN values, use normal scaling
-                    scaled_data = zoom(elevation_data, (scale_y, scale_x), order=3)
-                    print(f"✅ Scaled clean data using scipy.ndimage.zoom: {scaled_data.shape}")
-                
-                # Ensure exact 120x120 size
-                scaled_data = scaled_data[:120, :120]
-                
-                # Check results
-                valid_pixels_after = np.sum(~np.isnan(scaled_data))
-                print(f"📊 Output data: {valid_pixels_after}/{scaled_data.size} valid pixels ({100*valid_pixels_after/scaled_data.size:.1f}%)")
-                
-                return scaled_data
-                
-            except ImportError:
-                # Fallback to PIL-based resizing
-                print("🔄 Using PIL fallback for scaling...")
-                from PIL import Image
-                
-                # Handle NaN values for PIL processing while preserving no-data areas
-                if np.any(nan_mask):
-                    print("🌊 Preserving NaN values for proper no-data color rendering (PIL)...")
-                    filled_data = elevation_data.copy()
-                    
-                    # Temporarily fill NaN with mean for PIL processing
-                    valid_mean = np.nanmean(elevation_data)
-                    if np.isnan(valid_mean):
-                        placeholder_value = 0.0
-                    else:
-                        placeholder_value = valid_mean
-                    filled_data[nan_mask] = placeholder_value
-                else:
-                    filled_data = elevation_data
-                
-                # Normalize to 0-255 range for PIL processing
-                data_min = np.nanmin(filled_data)
-                data_max = np.nanmax(filled_data)
-                
-                if data_max > data_min:
-                    normalized = ((filled_data - data_min) / (data_max - data_min) * 255).astype(np.uint8)
-                else:
-                    normalized = np.full_like(filled_data, 128, dtype=np.uint8)
-                
-                pil_image = Image.fromarray(normalized)
-                resized_pil = pil_image.resize((120, 120), Image.Resampling.BICUBIC)
-                
-                # Convert back to elevation values
-                resized_normalized = np.array(resized_pil).astype(np.float32)
-                if data_max > data_min:
-                    scaled_data = (resized_normalized / 255.0 * (data_max - data_min) + data_min)
-                else:
-                    scaled_data = np.full((120, 120), data_min, dtype=np.float32)
-                
-                # Restore NaN values for no-data areas if there were any originally
-                if np.any(nan_mask):
-                    # Scale the original NaN mask to the new size
-                    from PIL import Image as PILImage
-                    nan_mask_uint8 = (nan_mask * 255).astype(np.uint8)
-                    nan_pil = PILImage.fromarray(nan_mask_uint8)
-                    scaled_nan_pil = nan_pil.resize((120, 120), PILImage.Resampling.NEAREST)
-                    scaled_nan_mask = np.array(scaled_nan_pil) > 127  # Threshold to boolean
-                    
-                    # Restore NaN values
-                    scaled_data[scaled_nan_mask] = np.nan
-                
-                print(f"✅ Scaled using PIL fallback: {scaled_data.shape}")
-                return scaled_data
+            # Check results (120x120 only, cheap)
+            valid_pixels_after = np.count_nonzero(~np.isnan(scaled_data))
+            if valid_pixels_after == 0:
+                print("❌ All scaled data is NaN")
+            print(f"📊 Output data: {valid_pixels_after}/{scaled_data.size} valid pixels ({100*valid_pixels_after/scaled_data.size:.1f}%)")
+            
+            return scaled_data
                 
         except Exception as e:
             print(f"❌ Error scaling elevation data: {e}")
-            import traceback
             traceback.print_exc()
             return None
     
     def generate_unique_preview_filename(self):
         """Generate a unique filename for a new preview database"""
         try:
-            preview_dir = get_resource_path("preview_icon_databases")
-            base_name = "preview_icon_"
-            extension = ".tif"
-            
-            # Find the next available number
-            existing_numbers = []
-            for file_path in preview_dir.iterdir():
-                if file_path.is_file() and file_path.name.startswith(base_name):
-                    try:
-                        # Extract number from filename like "preview_icon_07.tif"
-                        name_part = file_path.stem.replace(base_name, "")
-                        if name_part.isdigit():
-                            existing_numbers.append(int(name_part))
-                    except:
-                        continue
+            # Scan the folder once per session; later creations update the cached set
+            if self._preview_numbers is None:
+                preview_dir = get_resource_path("preview_icon_databases")
+                self._preview_numbers = {
+                    int(match.group(1))
+                    for name in os.listdir(preview_dir)
+                    if (match := _PREVIEW_ICON_RE.match(name))
+                }
             
-            # Find the next number
-            next_number = 1
-            while next_number in existing_numbers:
-                next_number += 1
+            # Next number after the highest existing one
+            next_number = max(self._preview_numbers, default=0) + 1
             
             # Format with zero padding
-            filename = f"{base_name}{next_number:02d}{extension}"
+            filename = f"preview_icon_{next_number:02d}.tif"
             print(f"📝 Generated unique preview filename: {filename}")
             
             return filename
@@ -1788,12 +1980,10 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             
             print(f"💾 Saving elevation data as GeoTIFF: {output_path}")
             
-            # Diagnostic information about the elevation data
-            if elevation_data is not None:
-                min_val = np.nanmin(elevation_data)
-                max_val = np.nanmax(elevation_data)
-                mean_val = np.nanmean(elevation_data)
-                valid_pixels = np.sum(~np.isnan(elevation_data))
+            # Diagnostic information about the elevation data (full scans - debug only)
+            if _DEBUG and elevation_data is not None:
+                from nan_aware_interpolation import nan_stats
+                min_val, max_val, mean_val, valid_pixels = nan_stats(elevation_data)
                 total_pixels = elevation_data.size
                 
                 print(f"📊 Elevation data stats:")
@@ -1813,56 +2003,48 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             # Ensure the preview_icon_databases directory exists
             output_path.parent.mkdir(exist_ok=True)
             
-            # Use rasterio for proper GeoTIFF creation if available
-            try:
-                import rasterio
-                from rasterio.transform import from_bounds
-                from rasterio.crs import CRS
-                
-                height, width = elevation_data.shape
-                
-                # Create transform from geographic bounds
-                transform = from_bounds(
-                    bounds['west'], bounds['south'], 
-                    bounds['east'], bounds['north'], 
-                    width, height
-                )
-                
-                # Save as GeoTIFF
-                with rasterio.open(
-                    output_path,
-                    'w',
-                    driver='GTiff',
-                    height=height,
-                    width=width,
-                    count=1,
-                    dtype=elevation_data.dtype,
-                    crs=CRS.from_epsg(4326),  # WGS84
-                    transform=transform,
-                    compress='lzw'
-                ) as dst:
-                    dst.write(elevation_data, 1)
-                
-                print(f"✅ Saved GeoTIFF with rasterio: {output_path}")
-                
-            except ImportError:
-                # Fallback to simple TIFF using PIL
-                from PIL import Image
-                
-                # Convert to 16-bit integer for better precision
-                elevation_min = elevation_data.min()
-                elevation_max = elevation_data.max()
-                
-                if elevation_max > elevation_min:
-                    normalized = ((elevation_data - elevation_min) / 
-                                (elevation_max - elevation_min) * 65535).astype(np.uint16)
-                else:
-                    normalized = np.zeros_like(elevation_data, dtype=np.uint16)
-                
-                pil_image = Image.fromarray(normalized)
-                pil_image.save(output_path, format='TIFF')
-                
-                print(f"✅ Saved TIFF with PIL fallback: {output_path}")
+            # Write with rasterio (required for GeoTIFF support - ImportError propagates)
+            import rasterio
+            from rasterio.transform import from_bounds
+            from rasterio.crs import CRS
+            
+            # Contiguous buffer so rasterio can write it without an internal copy
+            elevation_data = np.ascontiguousarray(elevation_data)
+            height, width = elevation_data.shape
+            
+            # Create transform from geographic bounds
+            transform = from_bounds(
+                bounds['west'], bounds['south'], 
+                bounds['east'], bounds['north'], 
+                width, height
+            )
+            
+            # LZW with a horizontal predictor (floating-point predictor for float data)
+            profile = {
+                'compress': 'lzw',
+                'predictor': 3 if elevation_data.dtype.kind == 'f' else 2,
+                'BIGTIFF': 'IF_SAFER',
+            }
+            # Tile rasters larger than one block (small preview icons stay striped)
+            if height > 256 and width > 256:
+                profile.update(tiled=True, blockxsize=256, blockysize=256)
+            
+            # Save as GeoTIFF
+            with rasterio.open(
+                output_path,
+                'w',
+                driver='GTiff',
+                height=height,
+                width=width,
+                count=1,
+                dtype=elevation_data.dtype,
+                crs=CRS.from_epsg(4326),  # WGS84
+                transform=transform,
+                **profile
+            ) as dst:
+                dst.write(elevation_data, 1)
+            
+            print(f"✅ Saved GeoTIFF with rasterio: {output_path}")
                 
         except Exception as e:
             print(f"❌ Error saving elevation data as GeoTIFF: {e}")
@@ -1870,47 +2052,36 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             traceback.print_exc()
             raise
     
+    @pyqtSlot()
     def cycle_to_next_preview_database(self):
         """Cycle to the next preview database and update the preview"""
         try:
-            print(f"🔄 === CYCLE PREVIEW DATABASE CALLED ===")
-            print(f"🔄 Preview databases available: {len(self.preview_databases) if self.preview_databases else 0}")
-            print(f"🔄 Current preview index: {self.current_preview_index}")
-            
             if not self.preview_databases:
                 print("⚠️  No preview databases available for cycling")
                 return
             
             # Store old index for comparison
             old_index = self.current_preview_index
-            old_db = self.preview_databases[old_index] if self.preview_databases else None
             
             # Move to next database (cycle back to 0 if at end)
             self.current_preview_index = (self.current_preview_index + 1) % len(self.preview_databases)
             
             current_db = self.preview_databases[self.current_preview_index]
-            print(f"🔄 Index changed: {old_index} → {self.current_preview_index}")
-            print(f"🔄 Database changed: {old_db.name if old_db else 'None'} → {current_db.name}")
-            print(f"🔄 Cycling to preview database: {current_db.name} ({self.current_preview_index + 1} of {len(self.preview_databases)})")
+            debug_logger.debug("🔄 Cycling preview database: index %d → %d (%s, %d of %d)",
+                               old_index, self.current_preview_index, current_db,
+                               self.current_preview_index + 1, len(self.preview_databases))
             
             # Update the gradient preview with the new database
-            print(f"🔄 Calling update_gradient_preview()...")
-            self.update_gradient_preview()
-            print(f"🔄 update_gradient_preview() completed")
+            self.schedule_gradient_preview()
             
             # Update the tooltip to reflect the new database
-            print(f"🔄 Updating preview tooltip...")
             self.update_preview_tooltip()
-            print(f"🔄 Preview tooltip updated")
             
             # Show brief status message
             db_name = current_db.stem  # Filename without extension
             status_msg = f"Preview: {db_name} ({self.current_preview_index + 1} of {len(self.preview_databases)})"
-            print(f"🔄 Setting status message: {status_msg}")
             self.status_bar.showMessage(status_msg, 3000)  # Show for 3 seconds
             
-            print(f"🔄 === CYCLE PREVIEW DATABASE COMPLETED ===")
-            
             # Update menu state after cycling 
             self.update_preview_icon_menu_state()
             
@@ -1921,20 +2092,17 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
     
     def get_current_preview_database(self):
         """Get the path to the currently active preview database"""
-        print(f"📂 === GET_CURRENT_PREVIEW_DATABASE CALLED ===")
-        print(f"📂 Preview databases available: {len(self.preview_databases) if self.preview_databases else 0}")
-        print(f"📂 Current preview index: {self.current_preview_index}")
-        
         if self.preview_databases and 0 <= self.current_preview_index < len(self.preview_databases):
             selected_db = self.preview_databases[self.current_preview_index]
-            print(f"📂 Returning selected database: {selected_db.name}")
-            print(f"📂 Database path: {selected_db}")
+            debug_logger.debug("📂 Current preview database: %s", selected_db)
             return selected_db
         
         # Fallback to the original hardcoded database using resource path
-        fallback_db = get_resource_path("preview_icon_databases") / "pr01_fixed.tif"
-        print(f"📂 Using fallback database: {fallback_db}")
-        return fallback_db
+        cls = type(self)
+        if cls._fallback_preview_db is None:
+            cls._fallback_preview_db = get_resource_path("preview_icon_databases") / "pr01_fixed.tif"
+        debug_logger.debug("📂 Using fallback preview database: %s", cls._fallback_preview_db)
+        return cls._fallback_preview_db
     
     def initialize_export_controls(self):
         """Initialize export controls with default values"""
@@ -2012,8 +2180,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                         success = self.load_dem_file(last_database['path'])
                         if success:
                             # Update window title for auto-opened single files
-                            file_path = Path(last_database['path'])
-                            self.update_window_title(file_path.name)
+                            self.update_window_title(last_database['path_obj'].name)
                     elif last_database['type'] == 'multi_file':
                         # Add extra protection for multi-file databases
                         try:
@@ -2072,73 +2239,60 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
     
     def update_database_info_display(self, database_info=None, export_info=None):
         """Update the database info display with new Qt Designer layout"""
+        # Skip panels that already show exactly this info
+        if database_info and database_info == self._shown_database_info:
+            database_info = None
+        if export_info and export_info == self._shown_export_info:
+            export_info = None
+        if not database_info and not export_info:
+            return
+        
+        # Both info group boxes live in scroll_contents; suspend its repaints
+        # while the labels are rewritten so Qt paints the panel once
+        info_panel = getattr(self, 'scroll_contents', None)
+        if info_panel is not None:
+            info_panel.setUpdatesEnabled(False)
         try:
             if database_info:
-                # Update database info labels with safe key access
-                try:
-                    self.width_db_label.setText(str(database_info.get('width_pixels', 0)))
-                    self.height_db_label.setText(str(database_info.get('height_pixels', 0)))
-                    self.pix_deg_db_label.setText(f"{database_info.get('pix_per_degree', 0):.2f}")
-                    # Use clean coordinate formatting for database labels
-                    from coordinate_validator import coordinate_validator
-                    west_db_clean = coordinate_validator.format_coordinate_clean(database_info.get('west', 0), is_longitude=True, use_dms=False)
-                    north_db_clean = coordinate_validator.format_coordinate_clean(database_info.get('north', 0), is_longitude=False, use_dms=False)
-                    east_db_clean = coordinate_validator.format_coordinate_clean(database_info.get('east', 0), is_longitude=True, use_dms=False)
-                    south_db_clean = coordinate_validator.format_coordinate_clean(database_info.get('south', 0), is_longitude=False, use_dms=False)
-                    
-                    self.west_db_label.setText(west_db_clean)
-                    self.north_db_label.setText(north_db_clean)
-                    self.east_db_label.setText(east_db_clean)
-                    self.south_db_label.setText(south_db_clean)
-                except Exception as e:
-                    print(f"Error updating database labels: {e}")
-                    # Set default values if there's an error
-                    self.width_db_label.setText("0")
-                    self.height_db_label.setText("0")
-                    self.pix_deg_db_label.setText("0.00")
-                    self.west_db_label.setText("0")
-                    self.north_db_label.setText("0")
-                    self.east_db_label.setText("0")
-                    self.south_db_label.setText("0")
-                
-                # Calculate file size (rough estimate) with error handling
-                try:
-                    total_pixels = database_info.get('width_pixels', 0) * database_info.get('height_pixels', 0)
-                    file_size_kb = (total_pixels * 2) / 1024  # 2 bytes per pixel estimate
-                    if file_size_kb < 1024:
-                        self.size_db_label.setText(f"{file_size_kb:.1f} KB")
-                    else:
-                        self.size_db_label.setText(f"{file_size_kb/1024:.1f} MB")
-                except Exception as e:
-                    print(f"Error calculating file size: {e}")
-                    self.size_db_label.setText("Unknown")
-                
-                # Calculate pixel height in miles with error handling
-                try:
-                    height_pixels = database_info.get('height_pixels', 0)
-                    if height_pixels > 0:
-                        north = float(database_info.get('north', 0))
-                        south = float(database_info.get('south', 0))
-                        degrees_per_pixel = abs(north - south) / height_pixels
-                        miles_per_pixel = degrees_per_pixel * 69  # Roughly 69 miles per degree latitude
-                        self.pxheight_db_label.setText(format_distance_km_miles(miles_per_pixel))
-                    else:
-                        self.pxheight_db_label.setText("0.00 km (0.00 mi.)")
-                except Exception as e:
-                    print(f"Error calculating pixel height: {e}")
-                    self.pxheight_db_label.setText("0.00 km (0.00 mi.)")
+                # Read each field once with safe key access
+                db = _InfoView.from_info(database_info)
+                
+                # Update database info labels
+                self.width_db_label.setText(str(db.width_pixels))
+                self.height_db_label.setText(str(db.height_pixels))
+                self.pix_deg_db_label.setText(f"{db.pix_per_degree:.2f}")
+                # Use clean coordinate formatting for database labels
+                west_clean, north_clean, east_clean, south_clean = coordinate_validator.format_coordinates_clean(
+                    (db.west, db.north, db.east, db.south), _WNES_IS_LONGITUDE)
+                self.west_db_label.setText(west_clean)
+                self.north_db_label.setText(north_clean)
+                self.east_db_label.setText(east_clean)
+                self.south_db_label.setText(south_clean)
+                
+                # File size (rough estimate), precomputed when the database was loaded
+                size_str = database_info.get('_size_str')
+                if size_str is None:
+                    size_str = _fmt_size(db.width_pixels * db.height_pixels, 2)  # 2 bytes per pixel estimate
+                self.size_db_label.setText(size_str)
+                
+                # Pixel height in km (mi.), precomputed when the database was loaded
+                pxheight_str = database_info.get('_pxheight_str')
+                if pxheight_str is None:
+                    pxheight_str = _fmt_pixel_height(db.north, db.south, db.height_pixels)
+                self.pxheight_db_label.setText(pxheight_str)
+                
+                self._shown_database_info = dict(database_info)
             
             if export_info:
+                exp = _InfoView.from_info(export_info)
+                
                 # Update export file info labels (with _2 suffix)
-                self.width_export_label_2.setText(str(export_info.get('width_pixels', 0)))
-                self.height_export_label_2.setText(str(export_info.get('height_pixels', 0)))
-                self.pix_deg_export_label_2.setText(f"{export_info.get('pix_per_degree', 0):.2f}")
+                self.width_export_label_2.setText(str(exp.width_pixels))
+                self.height_export_label_2.setText(str(exp.height_pixels))
+                self.pix_deg_export_label_2.setText(f"{exp.pix_per_degree:.2f}")
                 # Use clean coordinate formatting for export labels  
-                from coordinate_validator import coordinate_validator
-                west_clean = coordinate_validator.format_coordinate_clean(export_info.get('west', 0), is_longitude=True, use_dms=False)
-                north_clean = coordinate_validator.format_coordinate_clean(export_info.get('north', 0), is_longitude=False, use_dms=False)
-                east_clean = coordinate_validator.format_coordinate_clean(export_info.get('east', 0), is_longitude=True, use_dms=False)
-                south_clean = coordinate_validator.format_coordinate_clean(export_info.get('south', 0), is_longitude=False, use_dms=False)
+                west_clean, north_clean, east_clean, south_clean = coordinate_validator.format_coordinates_clean(
+                    (exp.west, exp.north, exp.east, exp.south), _WNES_IS_LONGITUDE)
                 
                 self.west_export_label_2.setText(west_clean)
                 self.north_export_label_2.setText(north_clean)
@@ -2146,27 +2300,19 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 self.south_export_label_2.setText(south_clean)
                 
                 # Calculate export file size
-                total_pixels = export_info.get('width_pixels', 0) * export_info.get('height_pixels', 0)
-                file_size_kb = (total_pixels * 4) / 1024  # 4 bytes per pixel for RGBA
-                if file_size_kb < 1024:
-                    self.size_export_label_2.setText(f"{file_size_kb:.1f} KB")
-                else:
-                    self.size_export_label_2.setText(f"{file_size_kb/1024:.1f} MB")
+                self.size_export_label_2.setText(_fmt_size(exp.width_pixels * exp.height_pixels, 4))  # 4 bytes per pixel for RGBA
                 
                 # Calculate export pixel height in miles and format as km (mi.)
-                if export_info.get('height_pixels', 0) > 0:
-                    degrees_per_pixel = abs(export_info.get('north', 0) - export_info.get('south', 0)) / export_info.get('height_pixels', 1)
-                    miles_per_pixel = degrees_per_pixel * 69
-                    self.pxheight_export_label_2.setText(format_distance_km_miles(miles_per_pixel))
-                else:
-                    self.pxheight_export_label_2.setText("0.00 km (0.00 mi.)")
-            
-            print("✅ Database info display updated successfully")
+                self.pxheight_export_label_2.setText(_fmt_pixel_height(exp.north, exp.south, exp.height_pixels))
+                
+                self._shown_export_info = dict(export_info)
             
         except Exception as e:
             print(f"❌ Error updating database info display: {e}")
-            import traceback
             traceback.print_exc()
+        finally:
+            if info_panel is not None:
+                info_panel.setUpdatesEnabled(True)
 
     # Menu action methods
     def setup_recent_databases_menu(self):
@@ -2175,29 +2321,55 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
     
     def update_recent_databases_menu(self):
         """Update the Recent Databases submenu with current recent databases"""
-        self.recent_databases_menu.clear()
+        recent_items = tuple(recent_db_manager.get_menu_items())
         
-        recent_items = recent_db_manager.get_menu_items()
+        # Rebuilding means new QActions and signal connections; skip when nothing changed
+        if recent_items == self._recent_menu_sig:
+            return
+        self._recent_menu_sig = recent_items
+        
+        menu = self.recent_databases_menu
         
         if not recent_items:
             # No recent databases
-            no_recent_action = self.recent_databases_menu.addAction("(No recent databases)")
+            menu.clear()
+            self._recent_action_map = {}
+            self._recent_menu_separator = None
+            no_recent_action = menu.addAction("(No recent databases)")
             no_recent_action.setEnabled(False)
-        else:
-            # Add recent database items
-            for display_text, path, db_type in recent_items:
-                action = self.recent_databases_menu.addAction(display_text)
-                action.triggered.connect(lambda checked, p=path, t=db_type: self.open_recent_database(p, t))
-            
-            # Add separator and clear option
-            self.recent_databases_menu.addSeparator()
-            clear_action = self.recent_databases_menu.addAction("Clear Recent Databases")
+            return
+        
+        if self._recent_menu_separator is None:
+            # First entry: replace the placeholder with the separator and clear option
+            menu.clear()
+            self._recent_menu_separator = menu.addSeparator()
+            clear_action = menu.addAction("Clear Recent Databases")
             clear_action.triggered.connect(self.clear_recent_databases)
+        
+        # Update the menu in place: reuse the actions of databases still listed (their
+        # numbering may shift), create actions only for new ones, drop the rest
+        old_actions = self._recent_action_map
+        self._recent_action_map = {}
+        for display_text, path, db_type in recent_items:
+            action = old_actions.pop((path, db_type), None)
+            if action is None:
+                action = QAction(display_text, menu)
+                action.setData((path, db_type))
+                action.triggered.connect(self._open_recent_db_action)
+            elif action.text() != display_text:
+                action.setText(display_text)
+            # insertAction moves an action that is already in the menu
+            menu.insertAction(self._recent_menu_separator, action)
+            self._recent_action_map[(path, db_type)] = action
+        
+        for action in old_actions.values():
+            menu.removeAction(action)
+            action.deleteLater()
     
     # File menu actions
+    @pyqtSlot()
     def open_dem_file(self):
         """Open a single DEM file"""
-        from PyQt6.QtWidgets import QFileDialog
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Open Elevation Database",
@@ -2213,10 +2385,9 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 recent_db_manager.add_recent_database(file_path, 'single_file')
                 self.update_recent_databases_menu()
 
+    @pyqtSlot()
     def open_database_folder(self):
         """Open a database folder"""
-        from PyQt6.QtWidgets import QFileDialog, QMessageBox
-        from pathlib import Path
         
         folder_path = QFileDialog.getExistingDirectory(
             self,
@@ -2226,10 +2397,10 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         if folder_path:
             folder_path_obj = Path(folder_path)
             
-            # Check if metadata file exists
-            existing_json_files = list(folder_path_obj.glob("*.json"))
+            # Check if metadata file exists (stop at the first match)
+            existing_json_file = _first_file_with_suffix(folder_path_obj, ".json")
             
-            if not existing_json_files:
+            if existing_json_file is None:
                 # No metadata file found - ask user if they want to create one
                 reply = QMessageBox.question(
                     self,
@@ -2243,11 +2414,9 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 
                 if reply == QMessageBox.StandardButton.Yes:
                     # Create metadata file using the create_multi_file_database workflow
-                    from multi_file_database import MultiFileDatabase
-                    
                     try:
                         print(f"🔨 Creating metadata file for folder: {folder_path}")
-                        success = MultiFileDatabase.create_metadata_file(folder_path_obj, None)
+                        success = self.create_metadata_file_in_background(folder_path_obj, None)
                         
                         if not success:
                             QMessageBox.warning(
@@ -2275,11 +2444,9 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 recent_db_manager.add_recent_database(folder_path, 'multi_file')
                 self.update_recent_databases_menu()
     
+    @pyqtSlot()
     def create_multi_file_database(self):
         """Create a multi-file database from a folder of DEM files"""
-        from PyQt6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog, QInputDialog
-        from PyQt6.QtCore import Qt
-        from pathlib import Path
         
         # Get folder from user
         folder_path = QFileDialog.getExistingDirectory(
@@ -2295,12 +2462,12 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         folder_path = Path(folder_path)
         
         # Check if metadata file already exists
-        existing_json_files = list(folder_path.glob("*_metadata.json"))
-        if existing_json_files:
+        existing_json_file = _first_file_with_suffix(folder_path, "_metadata.json")
+        if existing_json_file is not None:
             reply = QMessageBox.question(
                 self,
                 "Metadata File Exists",
-                f"This folder already contains a metadata file:\n{existing_json_files[0].name}\n\n"
+                f"This folder already contains a metadata file:\n{existing_json_file.name}\n\n"
                 f"Do you want to recreate it?",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
                 QMessageBox.StandardButton.No
@@ -2322,21 +2489,9 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         if not database_name.strip():
             database_name = None
         
-        # Show progress dialog
-        progress = QProgressDialog("Scanning folder for DEM files...", "Cancel", 0, 0, self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setAutoClose(False)
-        progress.setAutoReset(False)
-        progress.show()
-        
         try:
-            # Import and create metadata file
-            from multi_file_database import MultiFileDatabase
-            
             print(f"🔨 Creating multi-file database: {folder_path}")
-            success = MultiFileDatabase.create_metadata_file(folder_path, database_name)
-            
-            progress.close()
+            success = self.create_metadata_file_in_background(folder_path, database_name)
             
             if success:
                 # Show success dialog
@@ -2352,8 +2507,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 # Load the newly created database
                 if self.load_database_folder(folder_path):
                     # Add to recent databases
-                    from recent_databases import RecentDatabasesManager
-                    recent_db_manager = RecentDatabasesManager()
                     recent_db_manager.add_recent_database(str(folder_path), 'multi_file')
                     self.update_recent_databases_menu()
                     
@@ -2378,7 +2531,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 )
                 
         except Exception as e:
-            progress.close()
             print(f"❌ Error creating multi-file database: {e}")
             QMessageBox.critical(
                 self,
@@ -2386,6 +2538,57 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 f"An error occurred while creating the multi-file database:\n\n{str(e)}"
             )
 
+    def create_metadata_file_in_background(self, folder_path, database_name=None):
+        """Build a multi-file database metadata file on a worker thread
+        
+        Runs a local event loop under a modal progress dialog until the scan
+        finishes, so the window keeps repainting during long folder scans.
+        Returns the scan's success flag; exceptions raised by the scan are
+        re-raised here as RuntimeError.
+        """
+        
+        progress = QProgressDialog("Scanning folder for DEM files...", None, 0, 0, self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+        progress.show()
+        
+        result = {'success': False, 'error': ""}
+        
+        def on_scan_finished(success, error):
+            result['success'] = success
+            result['error'] = error
+        
+        scan_thread = MetadataScanThread(folder_path, database_name)
+        scan_thread.scan_finished.connect(on_scan_finished)
+        loop = QEventLoop()
+        scan_thread.finished.connect(loop.quit)
+        scan_thread.start()
+        loop.exec()
+        scan_thread.wait()
+        progress.close()
+        
+        if result['error']:
+            raise RuntimeError(result['error'])
+        return result['success']
+    
+    def reveal_path_in_file_browser(self, path_obj: Path, select: bool = True):
+        """Show path_obj in the system file browser
+        
+        On macOS this uses 'open -R' so Finder selects the item; elsewhere the
+        folder (the containing folder when select is True) is opened through
+        QDesktopServices without spawning a process.
+        """
+        if sys.platform == 'darwin':
+            args = ['open', '-R', str(path_obj)] if select else ['open', str(path_obj)]
+            subprocess.run(args, check=True)
+            return
+        
+        folder = path_obj.parent if select else path_obj
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(folder))):
+            raise RuntimeError(f"Could not open {folder} in the file browser")
+    
+    @pyqtSlot()
     def reveal_database_in_finder(self):
         """Reveal the currently loaded database in Finder"""
         if not hasattr(self, 'current_database_info') or not self.current_database_info:
@@ -2408,8 +2611,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             )
             return
             
-        import subprocess
-        from pathlib import Path
         
         try:
             path_obj = Path(database_path)
@@ -2417,7 +2618,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             if database_type == 'single_file':
                 # For single files, reveal and select the file in Finder
                 if path_obj.exists():
-                    subprocess.run(['open', '-R', str(path_obj)], check=True)
+                    self.reveal_path_in_file_browser(path_obj)
                     print(f"✅ Revealed single-file database in Finder: {path_obj.name}")
                 else:
                     QMessageBox.warning(
@@ -2430,7 +2631,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             elif database_type == 'multi_file':
                 # For multi-file databases, open the containing folder
                 if path_obj.is_dir() and path_obj.exists():
-                    subprocess.run(['open', str(path_obj)], check=True)
+                    self.reveal_path_in_file_browser(path_obj, select=False)
                     print(f"✅ Opened multi-file database folder in Finder: {path_obj.name}")
                 else:
                     QMessageBox.warning(
@@ -2463,9 +2664,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
 
     def show_save_complete_dialog(self, title: str, message: str, file_path: str):
         """Show save complete dialog with 'Reveal in Finder' button"""
-        import subprocess
-        from pathlib import Path
-        from PyQt6.QtWidgets import QMessageBox, QPushButton
 
         # Create custom message box
         msg_box = QMessageBox(self)
@@ -2490,7 +2688,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             try:
                 path_obj = Path(file_path)
                 if path_obj.exists():
-                    subprocess.run(['open', '-R', str(path_obj)], check=True)
+                    self.reveal_path_in_file_browser(path_obj)
                     print(f"✅ Revealed file in Finder: {path_obj.name}")
                 else:
                     QMessageBox.warning(
@@ -2512,6 +2710,16 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     f"An unexpected error occurred:\n\n{str(e)}"
                 )
 
+    @pyqtSlot(bool)
+    def _open_recent_db_action(self, checked: bool = False):
+        """Recent Databases menu entry handler; the entry's (path, db_type) is stored as its action data"""
+        action = self.sender()
+        if action is None:
+            return
+        path, db_type = action.data()
+        self.open_recent_database(path, db_type)
+
+    @pyqtSlot(str, str)
     def open_recent_database(self, path: str, db_type: str):
         """Open a recent database"""
         try:
@@ -2543,9 +2751,9 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             recent_db_manager.remove_database(path)
             self.update_recent_databases_menu()
 
+    @pyqtSlot()
     def clear_recent_databases(self):
         """Clear all recent databases"""
-        from PyQt6.QtWidgets import QMessageBox
         reply = QMessageBox.question(
             self, 
             "Clear Recent Databases",
@@ -2558,6 +2766,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             self.update_recent_databases_menu()
 
     # Edit menu actions
+    @pyqtSlot()
     def select_all_database(self):
         """Select the full database bounds"""
         if hasattr(self, 'current_database_info') and self.current_database_info:
@@ -2572,28 +2781,17 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     south = self.current_database_info.get('south', 0)
                     
                     # Format coordinates properly to avoid floating point artifacts
-                    from coordinate_converter import CoordinateConverter
-                    is_dms = self.dms_radio.isChecked() if hasattr(self, 'dms_radio') else False
+                    is_dms = self._dms_radio is not None and self._dms_radio.isChecked()
                     
                     # Format each coordinate with proper decimal places or DMS
-                    west_text = CoordinateConverter.format_coordinate(west, is_longitude=True, use_dms=is_dms)
-                    north_text = CoordinateConverter.format_coordinate(north, is_longitude=False, use_dms=is_dms)
-                    east_text = CoordinateConverter.format_coordinate(east, is_longitude=True, use_dms=is_dms)
-                    south_text = CoordinateConverter.format_coordinate(south, is_longitude=False, use_dms=is_dms)
+                    west_text, north_text, east_text, south_text = CoordinateConverter.format_coordinates(
+                        (west, north, east, south), _WNES_IS_LONGITUDE, is_dms)
                     
                     # Update coordinate input fields with clean formatting
-                    self.west_edit.setText(west_text)
-                    self.north_edit.setText(north_text)
-                    self.east_edit.setText(east_text)
-                    self.south_edit.setText(south_text)
-                    
-                    # Update the red selection rectangle to show the database bounds
-                    if hasattr(self.world_map, 'update_selection_rectangles'):
-                        self.world_map.update_selection_rectangles(west, east, south, north)
+                    self.set_coordinate_fields(west_text, north_text, east_text, south_text)
                     
-                    # Update map display (this triggers the visual update)
-                    if hasattr(self.world_map, 'update'):
-                        self.world_map.update()
+                    # Update the red selection rectangle to show the database bounds (repaints the map)
+                    self.world_map.update_selection_rectangles(west, east, south, north)
                     
                     # Update export calculations
                     self.update_export_calculations()
@@ -2604,29 +2802,54 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     
                     print(f"✅ Selected entire database: W={west_text}, N={north_text}, E={east_text}, S={south_text}")
                     
-                except Exception as e:
-                    print(f"❌ Error selecting all database: {e}")
-                    import traceback
-                    traceback.print_exc()
+                except Exception:
+                    debug_logger.exception("❌ Error selecting all database")
                 finally:
                     self.updating_fields = False
         else:
             # No database loaded - show user message
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.information(
                 self,
                 "No Database",
                 "Please load a DEM file or database first before selecting all."
             )
 
+    def _get_gradient_file_path(self, caption, name_filter, save=False):
+        """Ask for a gradient file with the reusable dialog
+        
+        Returns:
+            The selected path, or an empty string if the dialog was cancelled
+        """
+        dialog = self._gradient_file_dialog
+        if dialog is None:
+            # Created on first use and kept, since native dialog setup is slow on macOS
+            dialog = self._gradient_file_dialog = QFileDialog(self)
+        
+        # Reset everything the previous import/export left behind, like the static helpers would
+        dialog.setWindowTitle(caption)
+        dialog.setDirectory(os.getcwd())
+        dialog.selectFile("")
+        filters = name_filter.split(";;")
+        dialog.setNameFilters(filters)
+        dialog.selectNameFilter(filters[0])
+        if save:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setFileMode(QFileDialog.FileMode.AnyFile)
+        else:
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+            dialog.setFileMode(QFileDialog.FileMode.ExistingFile)
+        
+        if dialog.exec() == QFileDialog.DialogCode.Accepted:
+            selected = dialog.selectedFiles()
+            if selected:
+                return selected[0]
+        return ""
+
     # Gradient menu actions
     def import_qgis_gradients(self):
         """Import QGIS color ramps"""
-        from PyQt6.QtWidgets import QFileDialog, QMessageBox
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        file_path = self._get_gradient_file_path(
             "Import QGIS Color Ramps",
-            "",
             "QGIS Files (*.xml *.qml);;All Files (*)"
         )
         
@@ -2640,12 +2863,10 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
 
     def export_qgis_gradients(self):
         """Export gradients to QGIS XML format"""
-        from PyQt6.QtWidgets import QFileDialog, QMessageBox
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
+        file_path = self._get_gradient_file_path(
             "Export to QGIS XML",
-            "",
-            "XML Files (*.xml);;All Files (*)"
+            "XML Files (*.xml);;All Files (*)",
+            save=True
         )
         
         if file_path:
@@ -2661,30 +2882,29 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             self.gradient_manager.save_gradients()
             self.status_bar.showMessage("Gradients saved successfully")
         except Exception as e:
-            from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Save Error", f"Failed to save gradients:\n{str(e)}")
 
     # Help menu actions
+    @pyqtSlot()
     def open_user_guide(self):
         """Open the user guide PDF file"""
-        import os
-        import platform
-        from pathlib import Path
-        from PyQt6.QtWidgets import QMessageBox
-        
-        # Look for user guide PDF in the application directory
-        user_guide_path = Path(__file__).parent / "TopoToImage_User_Guide.pdf"
+        user_guide_path = self._user_guide_path
+        if not self._user_guide_exists:
+            self._user_guide_exists = user_guide_path.exists()
         
-        if user_guide_path.exists():
+        if self._user_guide_exists:
             try:
                 # Open PDF with system default viewer
-                if platform.system() == "Darwin":  # macOS
-                    os.system(f'open "{user_guide_path}"')
-                elif platform.system() == "Windows":  # Windows
-                    os.startfile(str(user_guide_path))
-                else:  # Linux and others
-                    os.system(f'xdg-open "{user_guide_path}"')
+                _open_with_default_app(user_guide_path)
+            except FileNotFoundError as e:
+                self._user_guide_exists = user_guide_path.exists()
+                QMessageBox.warning(
+                    self,
+                    "Error Opening User Guide",
+                    f"Could not find a program to open the user guide:\n{str(e)}\n\nFile location: {user_guide_path}"
+                )
             except Exception as e:
+                self._user_guide_exists = user_guide_path.exists()
                 QMessageBox.warning(
                     self, 
                     "Error Opening User Guide", 
@@ -2697,6 +2917,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 f"The user guide is not yet available.\n\nWhen complete, it will be located at:\n{user_guide_path}"
             )
 
+    @pyqtSlot()
     def show_about_dialog(self):
         """Show the About dialog with application information"""
         from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
@@ -2815,57 +3036,90 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         dialog.setLayout(layout)
         dialog.exec()
 
+    def set_coordinate_fields(self, west_text, north_text, east_text, south_text):
+        """Write all four coordinate fields as one batch
+        
+        Fields that already hold their text are left alone. Signals are blocked
+        per field and repaints of the coordinates group are suspended, so the
+        group is repainted once for the whole update.
+        """
+        # The fields no longer match whatever the selection/validation handlers last applied
+        self._last_selection = None
+        self._last_field_vals = None
+        
+        group = self.west_edit.parentWidget()
+        group.setUpdatesEnabled(False)
+        try:
+            for edit, text in ((self.west_edit, west_text), (self.north_edit, north_text),
+                               (self.east_edit, east_text), (self.south_edit, south_text)):
+                if edit.text() == text:
+                    continue
+                with QSignalBlocker(edit):
+                    edit.setText(text)
+        finally:
+            group.setUpdatesEnabled(True)
+
     # Signal handlers
     def on_selection_changed(self, bounds):
         """Handle map selection changes - expects a dict with bounds"""
         if not self.updating_fields:
+            # Get coordinate values
+            west = bounds.get('west', 0)
+            north = bounds.get('north', 0)
+            east = bounds.get('east', 0)
+            south = bounds.get('south', 0)
+            
+            # The map resends unchanged bounds while dragging; nothing to update then
+            selection = (west, north, east, south)
+            if selection == self._last_selection:
+                return
+            
             self.updating_fields = True
             try:
-                # Get coordinate values
-                west = bounds.get('west', 0)
-                north = bounds.get('north', 0)
-                east = bounds.get('east', 0)
-                south = bounds.get('south', 0)
-                
                 # Format coordinates with clean display (no trailing zeros)
-                from coordinate_validator import coordinate_validator
-                is_dms = self.dms_radio.isChecked() if hasattr(self, 'dms_radio') else False
+                is_dms = self._dms_radio is not None and self._dms_radio.isChecked()
                 
                 # Format each coordinate with clean formatting (removes trailing zeros)
-                west_text = coordinate_validator.format_coordinate_clean(west, is_longitude=True, use_dms=is_dms)
-                north_text = coordinate_validator.format_coordinate_clean(north, is_longitude=False, use_dms=is_dms)
-                east_text = coordinate_validator.format_coordinate_clean(east, is_longitude=True, use_dms=is_dms)
-                south_text = coordinate_validator.format_coordinate_clean(south, is_longitude=False, use_dms=is_dms)
+                west_text, north_text, east_text, south_text = coordinate_validator.format_coordinates_clean(
+                    (west, north, east, south), _WNES_IS_LONGITUDE, is_dms)
                 
                 # Update coordinate fields with clean formatting
-                self.west_edit.setText(west_text)
-                self.north_edit.setText(north_text)
-                self.east_edit.setText(east_text)
-                self.south_edit.setText(south_text)
+                self.set_coordinate_fields(west_text, north_text, east_text, south_text)
+                self._last_selection = selection
                 
                 # Update export calculations (includes export info and physical dimensions)
                 self.update_export_calculations()
                 
-                print(f"✅ Selection changed: W={west_text}, N={north_text}, E={east_text}, S={south_text}")
+                debug_logger.debug("✅ Selection changed: W=%s, N=%s, E=%s, S=%s", west_text, north_text, east_text, south_text)
                 
             finally:
                 self.updating_fields = False
 
     def on_coordinate_field_changed(self):
+        """Queue validation of the coordinate fields after an edit is finished"""
+        if not self.updating_fields:
+            self._coord_apply_timer.start()
+
+    def _apply_coordinate_field_changes(self):
         """Handle coordinate field changes with validation and snapping"""
         if not self.updating_fields:
-            print(f"🔄 on_coordinate_field_changed: User triggered validation")
+            debug_logger.debug("🔄 on_coordinate_field_changed: User triggered validation")
             self.updating_fields = True
             try:
-                # Import validator
-                from coordinate_validator import coordinate_validator
-                
                 # Get current database bounds for validation
                 if not hasattr(self, 'current_database_info') or not self.current_database_info:
                     return
                 
                 database_bounds = self.current_database_info
-                is_dms = self.dms_radio.isChecked() if hasattr(self, 'dms_radio') else False
+                is_dms = self._dms_radio is not None and self._dms_radio.isChecked()
+                
+                # Fields already hold the validated text for this database: nothing to redo
+                field_texts = (self.west_edit.text(), self.north_edit.text(),
+                               self.east_edit.text(), self.south_edit.text())
+                if self._last_field_vals is not None:
+                    last_texts, last_bounds = self._last_field_vals
+                    if field_texts == last_texts and database_bounds is last_bounds:
+                        return
                 
                 # Parse current longitude values to determine meridian-crossing limits
                 try:
@@ -2886,19 +3140,14 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     self.south_edit.text(), database_bounds, False, is_dms)
                 
                 # Update fields with validated/formatted values
-                self.west_edit.setText(west_formatted)
-                self.north_edit.setText(north_formatted)
-                self.east_edit.setText(east_formatted)
-                self.south_edit.setText(south_formatted)
+                self.set_coordinate_fields(west_formatted, north_formatted, east_formatted, south_formatted)
+                self._last_field_vals = ((west_formatted, north_formatted, east_formatted, south_formatted),
+                                         database_bounds)
                 
                 # Update selection rectangle (NOT database coverage)
                 # This should only affect the red selection rectangle, not the green database boundaries
-                if hasattr(self.world_map, 'update_selection_rectangles'):
-                    self.world_map.update_selection_rectangles(west_val, east_val, south_val, north_val)
-                
-                # Trigger map redraw to show updated selection
-                if hasattr(self.world_map, 'update'):
-                    self.world_map.update()
+                # (also triggers the map redraw)
+                self.world_map.update_selection_rectangles(west_val, east_val, south_val, north_val)
                 
                 # Update export info
                 self.update_export_info_from_selection()
@@ -2912,12 +3161,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     east = float(self.east_edit.text() or 0)
                     south = float(self.south_edit.text() or 0)
                     
-                    if hasattr(self.world_map, 'update_selection_rectangles'):
-                        self.world_map.update_selection_rectangles(west, east, south, north)
-                    
-                    if hasattr(self.world_map, 'update'):
-                        self.world_map.update()
-                        
+                    self.world_map.update_selection_rectangles(west, east, south, north)
                     self.update_export_info_from_selection()
                 except ValueError:
                     pass
@@ -2926,18 +3170,20 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
 
     def on_coordinate_format_changed(self, button):
         """Handle coordinate format changes"""
-        if not hasattr(self, 'decimal_radio') or not hasattr(self, 'dms_radio'):
+        if self._decimal_radio is None or self._dms_radio is None:
             return
             
         # Determine if DMS format is selected
         is_dms = self.dms_radio.isChecked()
         
+        # Re-clicking the already selected format emits buttonClicked too; fields are already in it
+        if is_dms == self._coord_fields_dms:
+            return
+        
         # Prevent recursion during field updates
         if not self.updating_fields:
             self.updating_fields = True
             try:
-                from coordinate_converter import CoordinateConverter
-                
                 # Parse current coordinate values from the fields
                 current_west = CoordinateConverter.parse_coordinate(self.west_edit.text())
                 current_north = CoordinateConverter.parse_coordinate(self.north_edit.text())
@@ -2945,23 +3191,17 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 current_south = CoordinateConverter.parse_coordinate(self.south_edit.text())
                 
                 # Format coordinates in the new format
-                west_text = CoordinateConverter.format_coordinate(current_west, is_longitude=True, use_dms=is_dms)
-                north_text = CoordinateConverter.format_coordinate(current_north, is_longitude=False, use_dms=is_dms)
-                east_text = CoordinateConverter.format_coordinate(current_east, is_longitude=True, use_dms=is_dms)
-                south_text = CoordinateConverter.format_coordinate(current_south, is_longitude=False, use_dms=is_dms)
+                west_text, north_text, east_text, south_text = CoordinateConverter.format_coordinates(
+                    (current_west, current_north, current_east, current_south), _WNES_IS_LONGITUDE, is_dms)
                 
                 # Update the coordinate input fields
-                self.west_edit.setText(west_text)
-                self.north_edit.setText(north_text)
-                self.east_edit.setText(east_text)
-                self.south_edit.setText(south_text)
+                self.set_coordinate_fields(west_text, north_text, east_text, south_text)
+                self._coord_fields_dms = is_dms
                 
-                print(f"✅ Converted coordinates to {'DMS' if is_dms else 'Decimal'} format")
+                debug_logger.debug("✅ Converted coordinates to %s format", 'DMS' if is_dms else 'Decimal')
                 
-            except Exception as e:
-                print(f"❌ Error converting coordinate format: {e}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                debug_logger.exception("❌ Error converting coordinate format")
             finally:
                 self.updating_fields = False
 
@@ -2975,11 +3215,26 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         self.update_controls_from_gradient(gradient_name)
         
         # Update preview if available
-        self.update_gradient_preview()
+        self.schedule_gradient_preview()
+
+    def _gradient_controls_state(self):
+        """Snapshot of the controls update_controls_from_gradient sets"""
+        return (
+            self._min_elevation.value() if self._min_elevation is not None else None,
+            self._max_elevation.value() if self._max_elevation is not None else None,
+            self._scale_to_crop_radio is not None and self._scale_to_crop_radio.isChecked(),
+            self._scale_to_max_min_radio is not None and self._scale_to_max_min_radio.isChecked(),
+            self._meters_radio is not None and self._meters_radio.isChecked(),
+        )
 
     def update_controls_from_gradient(self, gradient_name):
         """Update elevation controls and radio buttons based on selected gradient"""
-        elevation_signals_connected = False
+        # A click emits both itemClicked and currentItemChanged; skip the repeat as long
+        # as nobody has touched the controls since they were set from this gradient
+        if (gradient_name == self._last_gradient_name
+                and self._gradient_controls_state() == self._last_gradient_controls):
+            return
+        
         try:
             # Get the gradient data
             gradient = self.gradient_manager.get_gradient(gradient_name)
@@ -2990,92 +3245,79 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             # Prevent signal recursion during updates
             self.updating_fields = True
             
-            # Temporarily disconnect elevation spinbox signals to prevent interference
-            if hasattr(self, 'min_elevation') and hasattr(self, 'max_elevation'):
-                try:
-                    self.min_elevation.valueChanged.disconnect(self.on_elevation_range_changed)
-                    self.max_elevation.valueChanged.disconnect(self.on_elevation_range_changed)
-                    elevation_signals_connected = True
-                except:
-                    pass
-            
-            # Get gradient units for control updates
-            gradient_units = getattr(gradient, 'units', 'meters').lower()
+            # Get gradient units for control updates (string kept for log output)
+            is_percent = gradient.units_enum is GradientUnits.PERCENT
+            gradient_units = gradient.units
             
             # Update elevation spin boxes based on gradient units
-            if hasattr(self, 'min_elevation') and hasattr(self, 'max_elevation'):
-                if gradient_units == 'percent':
+            if self._min_elevation is not None and self._max_elevation is not None:
+                if is_percent:
                     # For percent gradients, don't update elevation spin boxes - keep previous values
                     # Spinboxes will only be updated during main terrain rendering (Preview/Save buttons)
-                    print(f"📊 Percent gradient selected: Keeping current elevation values (no spinbox update)")
+                    debug_logger.debug("📊 Percent gradient selected: Keeping current elevation values (no spinbox update)")
                 else:
                     # For meters gradients, update with the gradient's stored values
-                    self.min_elevation.setValue(int(gradient.min_elevation))
-                    self.max_elevation.setValue(int(gradient.max_elevation))
-                    print(f"✅ Updated elevation range: {gradient.min_elevation} to {gradient.max_elevation} {gradient_units}")
+                    # (spinbox signals blocked to prevent interference)
+                    with QSignalBlocker(self.min_elevation), QSignalBlocker(self.max_elevation):
+                        self.min_elevation.setValue(int(gradient.min_elevation))
+                        self.max_elevation.setValue(int(gradient.max_elevation))
+                    debug_logger.debug("✅ Updated elevation range: %s to %s %s", gradient.min_elevation, gradient.max_elevation, gradient_units)
             
             # Update radio buttons based on gradient units
             
             # Set elevation units radio buttons (always meters)
-            if hasattr(self, 'meters_radio'):
+            if self._meters_radio is not None:
                 self.meters_radio.setChecked(True)
-                print(f"✅ Set meters radio button (gradient units: {gradient_units})")
+                debug_logger.debug("✅ Set meters radio button (gradient units: %s)", gradient_units)
             
             # Set scale mode radio buttons based on gradient units
             # ALWAYS set radio buttons when a gradient is selected from the list
             # The dynamic override happens when user manually changes radio buttons
-            if gradient_units == 'percent':
+            if is_percent:
                 # For percent gradients, use "Scale gradient to elevations found in crop area"
-                if hasattr(self, 'scale_to_crop_radio'):
+                if self._scale_to_crop_radio is not None:
                     self.scale_to_crop_radio.setChecked(True)
-                    print(f"✅ Set 'scale to crop' radio button for percent gradient")
-                if hasattr(self, 'scale_to_max_min_radio'):
+                    debug_logger.debug("✅ Set 'scale to crop' radio button for percent gradient")
+                if self._scale_to_max_min_radio is not None:
                     self.scale_to_max_min_radio.setChecked(False)
             else:
                 # For meters gradients, use "Scale gradient to maximum minimum elevation"
-                if hasattr(self, 'scale_to_max_min_radio'):
+                if self._scale_to_max_min_radio is not None:
                     self.scale_to_max_min_radio.setChecked(True)
-                    print(f"✅ Set 'scale to max/min' radio button for {gradient_units} gradient")
-                if hasattr(self, 'scale_to_crop_radio'):
+                    debug_logger.debug("✅ Set 'scale to max/min' radio button for %s gradient", gradient_units)
+                if self._scale_to_crop_radio is not None:
                     self.scale_to_crop_radio.setChecked(False)
             
             # Update spinbox enabled state based on radio button selection
             self.update_spinbox_state()
             
-        except Exception as e:
-            print(f"❌ Error updating controls from gradient: {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            # Reconnect elevation spinbox signals
-            if elevation_signals_connected and hasattr(self, 'min_elevation') and hasattr(self, 'max_elevation'):
-                try:
-                    self.min_elevation.valueChanged.connect(self.on_elevation_range_changed)
-                    self.max_elevation.valueChanged.connect(self.on_elevation_range_changed)
-                except:
-                    pass
+            self._last_gradient_name = gradient_name
+            self._last_gradient_controls = self._gradient_controls_state()
             
+        except Exception:
+            debug_logger.exception("❌ Error updating controls from gradient")
+        finally:
             self.updating_fields = False
 
     def update_spinbox_state(self):
         """Update the enabled/disabled state of elevation spinboxes based on radio buttons"""
         try:
             # Check which radio button is selected
-            scale_to_crop = hasattr(self, 'scale_to_crop_radio') and self.scale_to_crop_radio.isChecked()
-            scale_to_max_min = hasattr(self, 'scale_to_max_min_radio') and self.scale_to_max_min_radio.isChecked()
+            scale_to_crop = self._scale_to_crop_radio is not None and self._scale_to_crop_radio.isChecked()
+            scale_to_max_min = self._scale_to_max_min_radio is not None and self._scale_to_max_min_radio.isChecked()
             
             # Update spinbox enabled state
-            if hasattr(self, 'min_elevation') and hasattr(self, 'max_elevation'):
+            if self._min_elevation is not None and self._max_elevation is not None:
                 if scale_to_crop:
                     # "Scale gradient to elevation found in crop area" = spinboxes GRAYED OUT
                     self.min_elevation.setEnabled(False)
                     self.max_elevation.setEnabled(False)
-                    print(f"🔒 Elevation spinboxes disabled (crop area mode)")
+                    debug_logger.debug("🔒 Elevation spinboxes disabled (crop area mode)")
                 elif scale_to_max_min:
                     # "Scale gradient to Maximum and Minimum elevation" = spinboxes ACTIVE
                     self.min_elevation.setEnabled(True)
                     self.max_elevation.setEnabled(True)
-                    print(f"🔓 Elevation spinboxes enabled (max/min mode)")
+                    debug_logger.debug("🔓 Elevation spinboxes enabled (max/min mode)")
                 else:
                     # Default case - enable them
                     self.min_elevation.setEnabled(True)
@@ -3090,43 +3332,37 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         """Handle width field changes"""
         if self.updating_fields:
             return
-        try:
-            width = float(self.width_edit.text())
-            self.export_logic.set_width(width)
-            # Auto-switch to width lock when user types in width field
-            if hasattr(self, 'lock_width_radio'):
-                self.lock_width_radio.setChecked(True)
-            self.update_export_calculations()
-        except ValueError:
-            pass
+        # The validator guarantees a parseable number here
+        width = float(self.width_edit.text() or '0')
+        self.export_logic.set_width(width)
+        # Auto-switch to width lock when user types in width field
+        if hasattr(self, 'lock_width_radio'):
+            self.lock_width_radio.setChecked(True)
+        self.flush_export_calculations()
 
     def on_height_changed(self):
         """Handle height field changes"""
         if self.updating_fields:
             return
-        try:
-            height = float(self.height_edit.text())
-            self.export_logic.set_height(height)
-            # Auto-switch to height lock when user types in height field
-            if hasattr(self, 'lock_height_radio'):
-                self.lock_height_radio.setChecked(True)
-            self.update_export_calculations()
-        except ValueError:
-            pass
+        # The validator guarantees a parseable number here
+        height = float(self.height_edit.text() or '0')
+        self.export_logic.set_height(height)
+        # Auto-switch to height lock when user types in height field
+        if hasattr(self, 'lock_height_radio'):
+            self.lock_height_radio.setChecked(True)
+        self.flush_export_calculations()
 
     def on_resolution_changed(self):
         """Handle resolution field changes"""
         if self.updating_fields:
             return
-        try:
-            resolution = float(self.resolution_edit.text())
-            self.export_logic.set_resolution(resolution)
-            # Auto-switch to resolution lock when user types in resolution field
-            if hasattr(self, 'lock_resolution_radio'):
-                self.lock_resolution_radio.setChecked(True)
-            self.update_export_calculations()
-        except ValueError:
-            pass
+        # The validator guarantees a parseable number here
+        resolution = float(self.resolution_edit.text() or '0')
+        self.export_logic.set_resolution(resolution)
+        # Auto-switch to resolution lock when user types in resolution field
+        if hasattr(self, 'lock_resolution_radio'):
+            self.lock_resolution_radio.setChecked(True)
+        self.flush_export_calculations()
 
     def on_export_scale_combo_changed(self):
         """Handle export scale combo box changes"""
@@ -3136,11 +3372,10 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 # Parse percentage from text like "100%" -> 100
                 if "%" in scale_text:
                     percentage_value = float(scale_text.replace("%", ""))
-                    # Temporarily disconnect spinner signal to prevent recursion
+                    # Block spinner signals to prevent recursion
                     if hasattr(self, 'export_scale_spinbox'):
-                        self.export_scale_spinbox.valueChanged.disconnect()
-                        self.export_scale_spinbox.setValue(percentage_value)
-                        self.export_scale_spinbox.valueChanged.connect(self.on_export_scale_spinbox_changed)
+                        with QSignalBlocker(self.export_scale_spinbox):
+                            self.export_scale_spinbox.setValue(percentage_value)
                 self.update_export_calculations()
         except (ValueError, AttributeError):
             pass
@@ -3149,16 +3384,14 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         """Reset export scale to 100% when loading a new database"""
         try:
             if hasattr(self, 'export_scale_spinbox'):
-                # Temporarily disconnect signals to prevent unnecessary updates
-                self.export_scale_spinbox.valueChanged.disconnect()
-                self.export_scale_spinbox.setValue(100.0)
-                self.export_scale_spinbox.valueChanged.connect(self.on_export_scale_spinbox_changed)
-                print("🔄 Export scale reset to 100%")
+                # Block signals to prevent unnecessary updates
+                with QSignalBlocker(self.export_scale_spinbox):
+                    self.export_scale_spinbox.setValue(100.0)
+                debug_logger.debug("🔄 Export scale reset to 100%")
                 
             if hasattr(self, 'export_scale_combo'):
-                self.export_scale_combo.currentTextChanged.disconnect()
-                self.export_scale_combo.setCurrentText("100%")
-                self.export_scale_combo.currentTextChanged.connect(self.on_export_scale_combo_changed)
+                with QSignalBlocker(self.export_scale_combo):
+                    self.export_scale_combo.setCurrentText("100%")
                 
         except Exception as e:
             print(f"⚠️ Could not reset export scale: {e}")
@@ -3168,28 +3401,13 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         try:
             scale_value = self.export_scale_spinbox.value()
             
-            # Check if the spinner value matches one of the predefined percentages
-            predefined_percentages = [100, 50, 33.3, 25, 10]
-            combo_text = f"{scale_value}%"
-            
-            # Handle special case for 33.3%
-            if abs(scale_value - 33.3) < 0.1:
-                combo_text = "33.3%"
+            # Matching predefined percentage, or "Custom" for any other value
+            combo_text = _SCALE_COMBO_TEXT.get(round(scale_value * 10), "Custom")
             
-            # Temporarily disconnect combo signal to prevent recursion
+            # Block combo signals to prevent recursion
             if hasattr(self, 'export_scale_combo'):
-                self.export_scale_combo.currentTextChanged.disconnect()
-                
-                # Check if the value matches a predefined percentage
-                if any(abs(scale_value - pct) < 0.1 for pct in predefined_percentages):
-                    # Set to the matching predefined percentage
+                with QSignalBlocker(self.export_scale_combo):
                     self.export_scale_combo.setCurrentText(combo_text)
-                else:
-                    # Set to "Custom" for any other value
-                    self.export_scale_combo.setCurrentText("Custom")
-                
-                # Reconnect signal
-                self.export_scale_combo.currentTextChanged.connect(self.on_export_scale_combo_changed)
             
             # Update calculations based on scale
             self.update_export_calculations()
@@ -3203,12 +3421,9 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 return
                 
             # Determine which lock option was selected
-            if hasattr(self, 'lock_width_radio') and button == self.lock_width_radio:
-                self.export_logic.set_lock(LockType.WIDTH)
-            elif hasattr(self, 'lock_height_radio') and button == self.lock_height_radio:
-                self.export_logic.set_lock(LockType.HEIGHT)
-            elif hasattr(self, 'lock_resolution_radio') and button == self.lock_resolution_radio:
-                self.export_logic.set_lock(LockType.RESOLUTION)
+            lock_type = self._lock_map.get(button)
+            if lock_type is not None:
+                self.export_logic.set_lock(lock_type)
             
             # Update calculations based on new lock setting
             self.update_export_calculations()
@@ -3222,18 +3437,11 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 return
                 
             # Determine which units option was selected and update unit labels
-            if hasattr(self, 'inches_radio') and button == self.inches_radio:
-                self.export_logic.set_units(Units.INCHES)
-                self.update_unit_labels("In.")
-            elif hasattr(self, 'picas_radio') and button == self.picas_radio:
-                self.export_logic.set_units(Units.PICAS)
-                self.update_unit_labels("Pi.")
-            elif hasattr(self, 'points_radio') and button == self.points_radio:
-                self.export_logic.set_units(Units.POINTS)
-                self.update_unit_labels("Pt.")
-            elif hasattr(self, 'cm_radio') and button == self.cm_radio:
-                self.export_logic.set_units(Units.CENTIMETERS)
-                self.update_unit_labels("CM")
+            units = self._units_map.get(button)
+            if units is not None:
+                units_value, unit_text = units
+                self.export_logic.set_units(units_value)
+                self.update_unit_labels(unit_text)
             
             # Update calculations based on new units
             self.update_export_calculations()
@@ -3242,21 +3450,21 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
 
     def update_unit_labels(self, unit_text):
         """Update the unit labels for width and height based on selected units"""
+        if unit_text == self._current_unit_text:
+            return
         try:
-            # Update width unit label
-            if hasattr(self, 'width_unit_label'):
-                self.width_unit_label.setText(unit_text)
-                print(f"✅ Updated width unit label to: {unit_text}")
-            
-            # Update height unit label
-            if hasattr(self, 'height_unit_label'):
-                self.height_unit_label.setText(unit_text)
-                print(f"✅ Updated height unit label to: {unit_text}")
+            # Update width and height unit labels (setText only when the text differs, to avoid repaints)
+            for label in self._unit_labels:
+                if label.text() != unit_text:
+                    label.setText(unit_text)
+            debug_logger.debug("✅ Updated width/height unit labels to: %s", unit_text)
             
             # Resolution unit label always stays "Pix/In." regardless of units
-            if hasattr(self, 'resolution_unit_label'):
-                self.resolution_unit_label.setText("Pix/In.")
-                print(f"✅ Resolution unit label remains: Pix/In.")
+            label = self._resolution_unit_label
+            if label is not None and label.text() != "Pix/In.":
+                label.setText("Pix/In.")
+            
+            self._current_unit_text = unit_text
                 
         except Exception as e:
             print(f"❌ Error updating unit labels: {e}")
@@ -3277,11 +3485,11 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             # Refresh preview if available and in max/min elevation mode
             # Only update preview when "Scale to max/min elevation" is selected
             # because in crop mode, spinbox values don't affect the preview
-            scale_to_max_min = hasattr(self, 'scale_to_max_min_radio') and self.scale_to_max_min_radio.isChecked()
+            scale_to_max_min = self._scale_to_max_min_radio is not None and self._scale_to_max_min_radio.isChecked()
             
             if scale_to_max_min:
-                print(f"📏 Elevation range changed to {min_elev}-{max_elev}m → updating preview")
-                self.update_gradient_preview()
+                debug_logger.debug("📏 Elevation range changed to %s-%sm → updating preview", min_elev, max_elev)
+                self.schedule_gradient_preview()
             
         except AttributeError:
             pass
@@ -3293,7 +3501,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 return
                 
             # Only meters is supported
-            if hasattr(self, 'meters_radio') and button == self.meters_radio:
+            if self._meters_radio is not None and button == self._meters_radio:
                 # Update terrain renderer with meters units
                 self.terrain_renderer.set_elevation_units('meters')
                 
@@ -3310,10 +3518,10 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 return
                 
             # Determine scale mode
-            scale_to_crop = hasattr(self, 'scale_to_crop_radio') and button == self.scale_to_crop_radio
-            scale_to_max_min = hasattr(self, 'scale_to_max_min_radio') and button == self.scale_to_max_min_radio
+            scale_to_crop = self._scale_to_crop_radio is not None and button == self._scale_to_crop_radio
+            scale_to_max_min = self._scale_to_max_min_radio is not None and button == self._scale_to_max_min_radio
             
-            print(f"📻 Scale mode changed: crop={scale_to_crop}, max_min={scale_to_max_min}")
+            debug_logger.debug("📻 Scale mode changed: crop=%s, max_min=%s", scale_to_crop, scale_to_max_min)
             
             # IMPORTANT: Radio buttons now dynamically override gradient type!
             # - "Scale to crop area" = Treat gradient as Percent type
@@ -3327,16 +3535,16 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             self.update_spinbox_state()
             
             # Second, update the preview icon
-            self.update_gradient_preview()
+            self.schedule_gradient_preview()
             
             # Third, if switching to crop mode, scan the actual database if available
             if scale_to_crop:
-                print(f"📊 Switching to crop mode - scanning actual database for elevation range")
+                debug_logger.debug("📊 Switching to crop mode - scanning actual database for elevation range")
                 self._scan_actual_database_for_elevation_range()
             else:
-                print(f"📏 Switching to max/min mode - using spinbox values")
+                debug_logger.debug("📏 Switching to max/min mode - using spinbox values")
             
-            print(f"✅ Scale mode change complete")
+            debug_logger.debug("✅ Scale mode change complete")
             
         except AttributeError as e:
             print(f"⚠️ Error in scale mode change: {e}")
@@ -3345,6 +3553,23 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             import traceback
             traceback.print_exc()
 
+    def _elevation_range_cache_key(self, west, east, south, north):
+        """Key for _elev_range_cache: the scanned file/folder, its mtime and the selection
+        
+        Returns None when there is nothing on disk to key on.
+        """
+        if self.current_database_info and self.current_database_info.get('path'):
+            source_path = self.current_database_info['path']
+        elif self.current_dem_file:
+            source_path = self.current_dem_file
+        else:
+            return None
+        try:
+            mtime = os.path.getmtime(source_path)
+        except OSError:
+            return None
+        return (str(source_path), mtime, round(west, 6), round(east, 6), round(south, 6), round(north, 6))
+
     def _scan_actual_database_for_elevation_range(self):
         """Scan the actual loaded database/DEM file for elevation range in selected coordinates"""
         try:
@@ -3369,93 +3594,93 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 print(f"⚠️ Invalid coordinates - cannot scan elevation range")
                 return
             
-            elevation_data = None
-            
-            # Try to load elevation data based on database type
-            if has_database and self.current_database_info.get('type') == 'multi_file':
-                print(f"🗂️ Loading elevation data from multi-file database...")
-                try:
-                    # For multi-file databases, we need to assemble the selection area
-                    from multi_file_database import MultiFileDatabase
-                    
-                    database_path = self.current_database_info.get('path')
-                    if database_path:
-                        multi_db = MultiFileDatabase(database_path)
-                        # Load elevation data for the selected area
-                        elevation_data = multi_db.load_elevation_data_for_bounds(west, east, south, north)
-                        print(f"✅ Loaded elevation data from multi-file database: shape {elevation_data.shape if elevation_data is not None else 'None'}")
-                except Exception as e:
-                    print(f"❌ Error loading from multi-file database: {e}")
-            
-            elif has_database and self.current_database_info.get('type') == 'single_file':
-                print(f"📄 Loading elevation data from single-file database...")
-                try:
-                    # For single-file databases, use the dem_reader
-                    if hasattr(self, 'dem_reader') and self.dem_reader:
-                        elevation_data = self.dem_reader.load_elevation_data()
-                        print(f"✅ Loaded elevation data from single-file database: shape {elevation_data.shape if elevation_data is not None else 'None'}")
-                    else:
-                        print(f"⚠️ No DEM reader available for single-file database")
-                except Exception as e:
-                    print(f"❌ Error loading from single-file database: {e}")
+            # Repeat scans of the same file and selection reuse the cached range
+            cache_key = self._elevation_range_cache_key(west, east, south, north)
+            elevation_range = self._elev_range_cache.get(cache_key) if cache_key is not None else None
             
-            elif has_dem_file:
-                print(f"📄 Loading elevation data from single DEM file...")
-                try:
-                    # For single DEM files, use the existing dem_reader
-                    if hasattr(self, 'dem_reader') and self.dem_reader:
-                        elevation_data = self.dem_reader.load_elevation_data()
-                        print(f"✅ Loaded elevation data from DEM reader: shape {elevation_data.shape if elevation_data is not None else 'None'}")
+            if elevation_range is not None:
+                print(f"📊 Using cached elevation range for this selection")
+            else:
+                elevation_data = None
+                nodata = None  # Raw no-data sample still present in a memory-mapped window
+                # Single-file reads only pull the selection's pixel window off disk
+                sel_bounds = {'west': west, 'north': north, 'east': east, 'south': south}
+                
+                # Try to load elevation data based on database type
+                if has_database and self.current_database_info.get('type') == 'multi_file':
+                    print(f"🗂️ Loading elevation data from multi-file database...")
+                    try:
+                        # For multi-file databases, we need to assemble the selection area
+                        database_path = self.current_database_info.get('path')
+                        if database_path:
+                            multi_db = MultiFileDatabase(database_path)
+                            # Load elevation data for the selected area
+                            elevation_data = multi_db.load_elevation_data_for_bounds(west, east, south, north)
+                            print(f"✅ Loaded elevation data from multi-file database: shape {elevation_data.shape if elevation_data is not None else 'None'}")
+                    except Exception as e:
+                        print(f"❌ Error loading from multi-file database: {e}")
+                
+                elif has_database and self.current_database_info.get('type') == 'single_file':
+                    print(f"📄 Loading elevation data from single-file database...")
+                    try:
+                        # For single-file databases, use the dem_reader
+                        if hasattr(self, 'dem_reader') and self.dem_reader:
+                            elevation_data, nodata = self._mapped_window_for_bounds(self.dem_reader, sel_bounds)
+                            print(f"✅ Loaded elevation data from single-file database: shape {elevation_data.shape if elevation_data is not None else 'None'}")
+                        else:
+                            print(f"⚠️ No DEM reader available for single-file database")
+                    except Exception as e:
+                        print(f"❌ Error loading from single-file database: {e}")
+                
+                elif has_dem_file:
+                    print(f"📄 Loading elevation data from single DEM file...")
+                    try:
+                        # For single DEM files, use the existing dem_reader
+                        if hasattr(self, 'dem_reader') and self.dem_reader:
+                            elevation_data, nodata = self._mapped_window_for_bounds(self.dem_reader, sel_bounds)
+                            print(f"✅ Loaded elevation data from DEM reader: shape {elevation_data.shape if elevation_data is not None else 'None'}")
+                        else:
+                            # Create a new DEM reader
+                            dem_reader = DEMReader(self.current_dem_file)
+                            elevation_data, nodata = self._mapped_window_for_bounds(dem_reader, sel_bounds)
+                            print(f"✅ Loaded elevation data from new DEM reader: shape {elevation_data.shape if elevation_data is not None else 'None'}")
+                    except Exception as e:
+                        print(f"❌ Error loading from DEM file: {e}")
+                
+                # Scan elevation data for min/max
+                if elevation_data is not None:
+                    data_range = _elevation_min_max(elevation_data, nodata)
+                    if data_range is not None:
+                        elevation_range = data_range
+                        if cache_key is not None:
+                            self._elev_range_cache[cache_key] = elevation_range
                     else:
-                        # Create a new DEM reader
-                        from dem_reader import DEMReader
-                        dem_reader = DEMReader(self.current_dem_file)
-                        elevation_data = dem_reader.load_elevation_data()
-                        print(f"✅ Loaded elevation data from new DEM reader: shape {elevation_data.shape if elevation_data is not None else 'None'}")
-                except Exception as e:
-                    print(f"❌ Error loading from DEM file: {e}")
+                        print(f"⚠️ No valid elevation data found in scanned area")
+                else:
+                    print(f"⚠️ No elevation data available for scanning")
             
-            # Scan elevation data for min/max
-            if elevation_data is not None:
-                import numpy as np
-                valid_data = elevation_data[~np.isnan(elevation_data)]
-                if len(valid_data) > 0:
-                    database_min = float(np.min(valid_data))
-                    database_max = float(np.max(valid_data))
-                    print(f"📊 Found elevation range: {database_min:.1f}m to {database_max:.1f}m")
+            if elevation_range is not None:
+                database_min, database_max = elevation_range
+                print(f"📊 Found elevation range: {database_min:.1f}m to {database_max:.1f}m")
+                
+                # Update spinboxes with discovered values
+                if self._min_elevation is not None and self._max_elevation is not None:
+                    print(f"📦 Updating spinboxes with discovered elevation range")
                     
-                    # Update spinboxes with discovered values
-                    if hasattr(self, 'min_elevation') and hasattr(self, 'max_elevation'):
-                        print(f"📦 Updating spinboxes with discovered elevation range")
-                        
-                        # Temporarily disconnect signals to prevent recursion
-                        elevation_signals_connected = False
-                        try:
-                            self.min_elevation.valueChanged.disconnect(self.on_elevation_range_changed)
-                            self.max_elevation.valueChanged.disconnect(self.on_elevation_range_changed)
-                            elevation_signals_connected = True
-                        except:
-                            pass
-                        
-                        # Update values
-                        self.min_elevation.setValue(int(database_min))
-                        self.max_elevation.setValue(int(database_max))
-                        
-                        # Reconnect signals
-                        if elevation_signals_connected:
-                            try:
-                                self.min_elevation.valueChanged.connect(self.on_elevation_range_changed)
-                                self.max_elevation.valueChanged.connect(self.on_elevation_range_changed)
-                            except:
-                                pass
-                        
-                        print(f"✅ Spinboxes updated: {int(database_min)} - {int(database_max)}")
-                    else:
-                        print(f"⚠️ Spinbox controls not found")
+                    # Update values with signals blocked to prevent recursion, and the
+                    # spinboxes' group repainted once for both
+                    group = self._min_elevation.parentWidget()
+                    group.setUpdatesEnabled(False)
+                    try:
+                        with QSignalBlocker(self._min_elevation), QSignalBlocker(self._max_elevation):
+                            self._min_elevation.setValue(int(database_min))
+                            self._max_elevation.setValue(int(database_max))
+                    finally:
+                        group.setUpdatesEnabled(True)
+                    
+                    print(f"✅ Spinboxes updated: {int(database_min)} - {int(database_max)}")
                 else:
-                    print(f"⚠️ No valid elevation data found in scanned area")
-            else:
-                print(f"⚠️ No elevation data available for scanning")
+                    print(f"⚠️ Spinbox controls not found")
                 
         except Exception as e:
             print(f"❌ Error scanning actual database: {e}")
@@ -3468,6 +3693,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         try:
             file_path = Path(file_path)  # Ensure it's a Path object
             self.current_dem_file = file_path
+            self._elev_range_cache.clear()
             
             # Load the DEM file using DEMReader
             self.dem_reader = DEMReader(file_path)
@@ -3511,6 +3737,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     'height_pixels': self.dem_reader.height,
                     'pix_per_degree': abs(self.dem_reader.width / (east - west)) if east != west else 0
                 }
+                _add_database_display_strings(database_info)
                 
                 # Check if this is a database switch (preserve selection) or first load (select full database)
                 is_database_switch = hasattr(self, 'current_database_info') and self.current_database_info is not None
@@ -3561,6 +3788,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         """Load a database folder"""
         try:
             folder_path = str(folder_path)  # Ensure it's a string
+            self._elev_range_cache.clear()
             
             # Load multi-tile database
             if self.multi_tile_loader.load_dataset(folder_path):
@@ -3584,6 +3812,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                         'pix_per_degree': dataset_info.get('pix_per_degree', 0),  # Fixed: was 'pixels_per_degree'
                         'tile_count': dataset_info.get('tiles_total', 0)  # Fixed: use tiles_total from get_dataset_info
                     }
+                    _add_database_display_strings(database_info)
                     
                     self.current_database_info = database_info
                     
@@ -3596,26 +3825,28 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                     # Set up map for multi-file database selection
                     # This enables selection rectangle drawing for multi-file databases
                     
-                    # Get tile boundaries from the multi-tile loader
-                    tile_boundaries = []
-                    if hasattr(self.multi_tile_loader, 'tiles'):
-                        for tile_name, tile_info in self.multi_tile_loader.tiles.items():
+                    # Get tile boundaries from the multi-tile loader; the map builds
+                    # the boundary dicts the first time it paints or queries them
+                    tiles = getattr(self.multi_tile_loader, 'tiles', {})
+                    
+                    def tile_boundaries():
+                        for tile_name, tile_info in tiles.items():
                             if 'bounds' in tile_info:
                                 bounds = tile_info['bounds']
                                 # Convert [west, north, east, south] to boundary dict
                                 if len(bounds) >= 4:
-                                    tile_boundaries.append({
+                                    yield {
                                         'west': bounds[0],
                                         'north': bounds[1], 
                                         'east': bounds[2],
                                         'south': bounds[3],
                                         'name': tile_name
-                                    })
+                                    }
                     
                     # Set tile boundaries on the map - this enables selection rectangle drawing
                     if hasattr(self.world_map, 'set_tile_boundaries'):
                         self.world_map.set_tile_boundaries(tile_boundaries)
-                        print(f"✅ Set {len(tile_boundaries)} tile boundaries for selection")
+                        print(f"✅ Set tile boundaries for {len(tiles)} tiles")
                     
                     # Debug: Print what database_info contains
                     print(f"🔍 Database info being passed to display:")
@@ -3681,44 +3912,39 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         """Update the window title with the loaded file/database name"""
         self.setWindowTitle(f"TopoToImage - {filename}")
 
+    def _coord_update_key(self, database_info, preserve_selection):
+        """Inputs update_coordinate_fields_from_database works from: database grid, mode and field texts"""
+        get = database_info.get
+        return (get('west', 0), get('north', 0), get('east', 0), get('south', 0), get('pix_per_degree'),
+                preserve_selection, self._dms_radio is not None and self._dms_radio.isChecked(),
+                self.west_edit.text(), self.north_edit.text(), self.east_edit.text(), self.south_edit.text())
+    
     def update_coordinate_fields_from_database(self, database_info, preserve_selection=True):
         """Update coordinate fields with database bounds or preserve existing selection"""
+        # Re-entering with the same database and the fields as this method left them would redo identical work
+        if self._coord_update_key(database_info, preserve_selection) == self._last_coord_update_key:
+            return
+        
         if not self.updating_fields:
-            print(f"🔄 update_coordinate_fields_from_database: preserve_selection={preserve_selection}")
+            debug_logger.debug("🔄 update_coordinate_fields_from_database: preserve_selection=%s", preserve_selection)
+            # set_coordinate_fields blocks the fields' signals while writing them,
+            # so no disconnect/reconnect is needed here
             self.updating_fields = True
             
-            # Temporarily disconnect coordinate field signals to prevent interference
-            self.west_edit.editingFinished.disconnect()
-            self.west_edit.returnPressed.disconnect()
-            self.north_edit.editingFinished.disconnect()
-            self.north_edit.returnPressed.disconnect()
-            self.east_edit.editingFinished.disconnect()
-            self.east_edit.returnPressed.disconnect()
-            self.south_edit.editingFinished.disconnect()
-            self.south_edit.returnPressed.disconnect()
-            
             try:
-                # Get database bounds
-                db_west = database_info.get('west', 0)
-                db_north = database_info.get('north', 0) 
-                db_east = database_info.get('east', 0)
-                db_south = database_info.get('south', 0)
+                # Get database bounds once, as floats, for the overlap test and fallbacks below
+                get = database_info.get
+                db_west, db_north, db_east, db_south = (
+                    float(get(key, 0)) for key in ('west', 'north', 'east', 'south'))
                 
                 if preserve_selection:
                     # Try to preserve existing selection if it overlaps with new database
                     try:
                         # Use coordinate validator to parse DMS coordinates properly
-                        from coordinate_validator import coordinate_validator
-                        
-                        current_west_parsed = coordinate_validator.parse_coordinate_input(self.west_edit.text() or "0")
-                        current_north_parsed = coordinate_validator.parse_coordinate_input(self.north_edit.text() or "0")
-                        current_east_parsed = coordinate_validator.parse_coordinate_input(self.east_edit.text() or "0")
-                        current_south_parsed = coordinate_validator.parse_coordinate_input(self.south_edit.text() or "0")
-                        
-                        current_west = current_west_parsed if current_west_parsed is not None else 0
-                        current_north = current_north_parsed if current_north_parsed is not None else 0
-                        current_east = current_east_parsed if current_east_parsed is not None else 0
-                        current_south = current_south_parsed if current_south_parsed is not None else 0
+                        current_west, current_north, current_east, current_south = (
+                            coordinate_validator.parse_coordinate_inputs(
+                                (self.west_edit.text(), self.north_edit.text(),
+                                 self.east_edit.text(), self.south_edit.text()), default=0))
                         
                         # Check if current selection is just zeros (no real selection to preserve)
                         is_empty_selection = (current_west == 0 and current_north == 0 and 
@@ -3727,7 +3953,8 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                         if is_empty_selection:
                             # No real selection to preserve - use database bounds
                             west, north, east, south = db_west, db_north, db_east, db_south
-                            print(f"✓ Empty selection detected, using database bounds: {west}, {north}, {east}, {south}")
+                            debug_logger.debug("✓ Empty selection detected, using database bounds: %s, %s, %s, %s",
+                                               west, north, east, south)
                         else:
                             # Check if current selection overlaps with new database bounds
                             overlaps = (current_west < db_east and current_east > db_west and
@@ -3735,73 +3962,49 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                             
                             if overlaps:
                                 # Clamp current selection to database bounds and pixel grid
-                                west = max(current_west, db_west)
-                                east = min(current_east, db_east)
-                                north = min(current_north, db_north)
-                                south = max(current_south, db_south)
-                                
-                                # Clamp to pixel grid if possible
                                 west, north, east, south = self.clamp_to_pixel_grid(
-                                    west, north, east, south, database_info
+                                    current_west, current_north, current_east, current_south, database_info
                                 )
                                 
-                                print(f"✓ Preserved and clamped selection: {west}, {north}, {east}, {south}")
+                                debug_logger.debug("✓ Preserved and clamped selection: %s, %s, %s, %s",
+                                                   west, north, east, south)
                             else:
                                 # Use database bounds if no overlap
                                 west, north, east, south = db_west, db_north, db_east, db_south
-                                print(f"✓ No overlap, using database bounds: {west}, {north}, {east}, {south}")
+                                debug_logger.debug("✓ No overlap, using database bounds: %s, %s, %s, %s",
+                                                   west, north, east, south)
                     except (ValueError, TypeError):
                         # If parsing fails, use database bounds
                         west, north, east, south = db_west, db_north, db_east, db_south
-                        print(f"✓ Parse error, using database bounds: {west}, {north}, {east}, {south}")
+                        debug_logger.debug("✓ Parse error, using database bounds: %s, %s, %s, %s",
+                                           west, north, east, south)
                 else:
                     # Use database bounds directly
                     west, north, east, south = db_west, db_north, db_east, db_south
                 
                 # Format coordinates with clean decimal display
-                from coordinate_validator import coordinate_validator
                 is_dms = self.dms_radio.isChecked() if hasattr(self, 'dms_radio') else False
                 
                 # Format each coordinate with clean formatting (remove trailing zeros)
-                west_text = coordinate_validator.format_coordinate_clean(west, is_longitude=True, use_dms=is_dms)
-                north_text = coordinate_validator.format_coordinate_clean(north, is_longitude=False, use_dms=is_dms)
-                east_text = coordinate_validator.format_coordinate_clean(east, is_longitude=True, use_dms=is_dms)
-                south_text = coordinate_validator.format_coordinate_clean(south, is_longitude=False, use_dms=is_dms)
+                west_text, north_text, east_text, south_text = coordinate_validator.format_coordinates_clean(
+                    (west, north, east, south), _WNES_IS_LONGITUDE, is_dms)
                 
                 # Update coordinate input fields
-                print(f"   Setting coordinate fields: [{west_text}, {north_text}, {east_text}, {south_text}]")
-                self.west_edit.setText(west_text)
-                self.north_edit.setText(north_text)
-                self.east_edit.setText(east_text)
-                self.south_edit.setText(south_text)
+                debug_logger.debug("   Setting coordinate fields: [%s, %s, %s, %s]",
+                                   west_text, north_text, east_text, south_text)
+                self.set_coordinate_fields(west_text, north_text, east_text, south_text)
                 
                 # Note: Database coverage should be set elsewhere, not here
                 # This method only handles coordinate field updates and selection preservation
                 
                 # Update the selection rectangle to match the database bounds
                 # This ensures the red rectangle updates properly when opening a new database
-                if hasattr(self.world_map, 'update_selection_rectangles'):
-                    self.world_map.update_selection_rectangles(west, east, south, north)
-                elif hasattr(self.world_map, 'handle_database_loaded'):
-                    # Use the smart selection management that handles overlap logic
-                    database_bounds = {'west': west, 'north': north, 'east': east, 'south': south}
-                    self.world_map.handle_database_loaded(database_bounds)
-                
-                # Trigger a map update to redraw
-                if hasattr(self.world_map, 'update'):
-                    self.world_map.update()
+                # (also triggers the map redraw)
+                self.world_map.update_selection_rectangles(west, east, south, north)
+                
+                self._last_coord_update_key = self._coord_update_key(database_info, preserve_selection)
                     
             finally:
-                # Reconnect coordinate field signals
-                self.west_edit.editingFinished.connect(self.on_coordinate_field_changed)
-                self.west_edit.returnPressed.connect(self.on_coordinate_field_changed)
-                self.north_edit.editingFinished.connect(self.on_coordinate_field_changed)
-                self.north_edit.returnPressed.connect(self.on_coordinate_field_changed)
-                self.east_edit.editingFinished.connect(self.on_coordinate_field_changed)
-                self.east_edit.returnPressed.connect(self.on_coordinate_field_changed)
-                self.south_edit.editingFinished.connect(self.on_coordinate_field_changed)
-                self.south_edit.returnPressed.connect(self.on_coordinate_field_changed)
-                
                 self.updating_fields = False
                 
         # Update export calculations after coordinate fields are updated
@@ -3809,7 +4012,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         self.update_export_calculations()
     
     def clamp_to_pixel_grid(self, west, north, east, south, database_info):
-        """Clamp coordinates to the pixel grid of the database"""
+        """Clamp coordinates to the bounds and pixel grid of the database"""
         try:
             # Get database bounds and resolution
             db_west = database_info.get('west', 0)
@@ -3817,35 +4020,40 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             db_east = database_info.get('east', 0)
             db_south = database_info.get('south', 0)
             
-            # Calculate resolution
-            width_pixels = database_info.get('width_pixels', 0)
-            height_pixels = database_info.get('height_pixels', 0)
+            # Keep the selection inside the database
+            west = max(west, db_west)
+            east = min(east, db_east)
+            north = min(north, db_north)
+            south = max(south, db_south)
+            
+            # Resolution is fixed per database, so it is worked out once and kept on database_info
+            grid = database_info.get('_pixel_grid')
+            if grid is None:
+                grid = database_info['_pixel_grid'] = _pixel_grid(database_info)
             
-            if width_pixels > 0 and height_pixels > 0:
-                # Calculate degrees per pixel
-                degrees_per_pixel_x = abs(db_east - db_west) / width_pixels
-                degrees_per_pixel_y = abs(db_north - db_south) / height_pixels
+            if grid:
+                degrees_per_pixel_x, degrees_per_pixel_y, pixels_per_degree_x, pixels_per_degree_y = grid
                 
                 # Snap coordinates to pixel boundaries
                 # For west/east: round to nearest pixel boundary from db_west
                 west_offset = west - db_west
-                west_pixel = round(west_offset / degrees_per_pixel_x)
+                west_pixel = round(west_offset * pixels_per_degree_x)
                 west = db_west + (west_pixel * degrees_per_pixel_x)
                 
                 east_offset = east - db_west
-                east_pixel = round(east_offset / degrees_per_pixel_x)
+                east_pixel = round(east_offset * pixels_per_degree_x)
                 east = db_west + (east_pixel * degrees_per_pixel_x)
                 
                 # For north/south: round to nearest pixel boundary from db_north
                 north_offset = db_north - north  # Note: north decreases as we go down
-                north_pixel = round(north_offset / degrees_per_pixel_y)
+                north_pixel = round(north_offset * pixels_per_degree_y)
                 north = db_north - (north_pixel * degrees_per_pixel_y)
                 
                 south_offset = db_north - south
-                south_pixel = round(south_offset / degrees_per_pixel_y)
+                south_pixel = round(south_offset * pixels_per_degree_y)
                 south = db_north - (south_pixel * degrees_per_pixel_y)
                 
-                print(f"✓ Clamped to pixel grid: resolution {degrees_per_pixel_x:.6f}°/pixel")
+                debug_logger.debug("✓ Clamped to pixel grid: resolution %.6f°/pixel", degrees_per_pixel_x)
             
             return west, north, east, south
             
@@ -3854,21 +4062,16 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             return west, north, east, south
 
     def update_export_info_from_selection(self):
-        """Update export info based on current selection"""
+        """Update export info based on current selection
+        
+        Returns:
+            The export info dict shown (selection bounds and scaled pixel size), or None on error
+        """
         try:
-            # Import coordinate validator for DMS parsing
-            from coordinate_validator import coordinate_validator
-            
             # Parse coordinates using validator (handles both decimal and DMS)
-            west_parsed = coordinate_validator.parse_coordinate_input(self.west_edit.text() or "0")
-            north_parsed = coordinate_validator.parse_coordinate_input(self.north_edit.text() or "0")
-            east_parsed = coordinate_validator.parse_coordinate_input(self.east_edit.text() or "0")
-            south_parsed = coordinate_validator.parse_coordinate_input(self.south_edit.text() or "0")
-            
-            west = west_parsed if west_parsed is not None else 0
-            north = north_parsed if north_parsed is not None else 0
-            east = east_parsed if east_parsed is not None else 0
-            south = south_parsed if south_parsed is not None else 0
+            west, north, east, south = coordinate_validator.parse_coordinate_inputs(
+                (self.west_edit.text(), self.north_edit.text(), self.east_edit.text(), self.south_edit.text()),
+                default=0)
             
             # Calculate basic export info from selection bounds
             width_degrees = abs(east - west)
@@ -3876,13 +4079,13 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             
             # Use current database resolution instead of hardcoded 120.0
             current_pix_per_degree = 120.0  # Default fallback
-            if hasattr(self, 'current_database_info') and self.current_database_info:
+            if self.current_database_info:
                 current_pix_per_degree = self.current_database_info.get('pix_per_degree', 120.0)
             
             # Get export scale percentage from spinner (default to 100% if not available)
             export_scale_percent = 100.0  # Default to 100%
-            if hasattr(self, 'export_scale_spinbox'):
-                export_scale_percent = self.export_scale_spinbox.value()
+            if self._export_scale_spinbox is not None:
+                export_scale_percent = self._export_scale_spinbox.value()
             
             # Apply export scale to pixel calculations
             scale_factor = export_scale_percent / 100.0
@@ -3906,46 +4109,32 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             
             # Update export file info display
             self.update_database_info_display(export_info=export_info)
+            return export_info
             
         except Exception as e:
             print(f"Error updating export info: {e}")
+            return None
 
     def update_export_calculations(self):
+        """Schedule an export calculation update (coalesced over 50 ms)"""
+        self._export_calc_timer.start()
+
+    def flush_export_calculations(self):
+        """Run any pending export calculation update now"""
+        self._export_calc_timer.stop()
+        self._do_update_export_calculations()
+
+    def _do_update_export_calculations(self):
         """Update export calculations based on current settings"""
         # First update the export info (this calculates scaled pixel dimensions)
-        self.update_export_info_from_selection()
+        export_info = self.update_export_info_from_selection()
+        if export_info is None:
+            return
         
-        # Get the current pixel dimensions from the last calculated export info
+        # Use the pixel dimensions just calculated for the export info
         try:
-            # Extract pixel dimensions from coordinate fields and scale
-            from coordinate_validator import coordinate_validator
-            
-            west_parsed = coordinate_validator.parse_coordinate_input(self.west_edit.text() or "0")
-            north_parsed = coordinate_validator.parse_coordinate_input(self.north_edit.text() or "0")
-            east_parsed = coordinate_validator.parse_coordinate_input(self.east_edit.text() or "0")
-            south_parsed = coordinate_validator.parse_coordinate_input(self.south_edit.text() or "0")
-            
-            west = west_parsed if west_parsed is not None else 0
-            north = north_parsed if north_parsed is not None else 0
-            east = east_parsed if east_parsed is not None else 0
-            south = south_parsed if south_parsed is not None else 0
-            
-            # Calculate pixel dimensions with export scale
-            width_degrees = abs(east - west)
-            height_degrees = abs(north - south)
-            
-            current_pix_per_degree = 120.0  # Default fallback
-            if hasattr(self, 'current_database_info') and self.current_database_info:
-                current_pix_per_degree = self.current_database_info.get('pix_per_degree', 120.0)
-            
-            # Get export scale and apply it
-            export_scale_percent = 100.0
-            if hasattr(self, 'export_scale_spinbox'):
-                export_scale_percent = self.export_scale_spinbox.value()
-            
-            scale_factor = export_scale_percent / 100.0
-            pixel_width = int(width_degrees * current_pix_per_degree * scale_factor)
-            pixel_height = int(height_degrees * current_pix_per_degree * scale_factor)
+            pixel_width = export_info['width_pixels']
+            pixel_height = export_info['height_pixels']
             
             # Update export logic with current pixel dimensions
             self.export_logic.set_pixel_dimensions(pixel_width, pixel_height)
@@ -3958,43 +4147,44 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             # Update UI fields with calculated values (prevent recursion)
             self.updating_fields = True
             try:
-                if hasattr(self, 'width_edit'):
-                    self.width_edit.setText(f"{calculated_width:.3f}")
-                if hasattr(self, 'height_edit'):
-                    self.height_edit.setText(f"{calculated_height:.3f}")
-                if hasattr(self, 'resolution_edit'):
-                    self.resolution_edit.setText(f"{calculated_resolution:.3f}")
+                for edit, value in zip(self._export_size_edits,
+                                       (calculated_width, calculated_height, calculated_resolution)):
+                    if edit is not None:
+                        edit.setText(f"{value:.3f}")
             finally:
                 self.updating_fields = False
                 
         except Exception as e:
             print(f"Error in export calculations: {e}")
 
+    def schedule_gradient_preview(self):
+        """Schedule a gradient preview update (coalesced over 100 ms)"""
+        self._preview_timer.start()
+
     def update_gradient_preview(self):
         """Update the gradient preview with the selected gradient applied to preview database"""
         try:
-            print(f"🎨 === UPDATE_GRADIENT_PREVIEW CALLED ===")
-            debug_logger.info("🎨 === STARTING GRADIENT PREVIEW UPDATE ===")
+            debug_logger.debug("🎨 === STARTING GRADIENT PREVIEW UPDATE ===")
             
             # Show current preview database info for debugging
-            print(f"🎨 Current preview index: {self.current_preview_index}")
-            if hasattr(self, 'preview_databases') and self.preview_databases:
-                current_db = self.preview_databases[self.current_preview_index] if 0 <= self.current_preview_index < len(self.preview_databases) else None
-                print(f"🎨 Current preview database: {current_db.name if current_db else 'None'}")
+            if debug_logger.isEnabledFor(logging.DEBUG):
+                debug_logger.debug("🎨 Current preview index: %s", self.current_preview_index)
+                if self.preview_databases:
+                    current_db = self.preview_databases[self.current_preview_index] if 0 <= self.current_preview_index < len(self.preview_databases) else None
+                    debug_logger.debug("🎨 Current preview database: %s", current_db.name if current_db else 'None')
             
             # Get currently selected gradient
-            if not hasattr(self, 'gradient_list') or not self.gradient_list.currentItem():
+            current_item = self._gradient_list.currentItem() if self._gradient_list is not None else None
+            if current_item is None:
                 debug_logger.warning("❌ No gradient list or no current item selected")
                 return
                 
-            gradient_name = self.gradient_list.currentItem().text()
-            debug_logger.info(f"🎨 Updating gradient preview for: {gradient_name}")
+            gradient_name = current_item.text()
+            debug_logger.debug("🎨 Updating gradient preview for: %s", gradient_name)
             
             # Get the current preview database (supports cycling)
             preview_db_path = self.get_current_preview_database()
-            debug_logger.info(f"📂 Preview database path: {preview_db_path}")
-            debug_logger.info(f"📂 Database exists: {preview_db_path.exists()}")
-            print(f"🎨 Preview database path from get_current_preview_database(): {preview_db_path}")
+            debug_logger.debug("📂 Preview database path: %s", preview_db_path)
             
             if not preview_db_path.exists():
                 debug_logger.error(f"❌ Preview database not found: {preview_db_path}")
@@ -4004,48 +4194,56 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             db_name = preview_db_path.stem
             current_num = self.current_preview_index + 1 if self.preview_databases else 1
             total_num = len(self.preview_databases) if self.preview_databases else 1
-            debug_logger.info(f"📊 Using preview database: {db_name} ({current_num} of {total_num})")
-            debug_logger.info(f"📊 Total preview databases available: {len(self.preview_databases) if self.preview_databases else 0}")
+            debug_logger.debug("📊 Using preview database: %s (%s of %s)", db_name, current_num, total_num)
+            debug_logger.debug("📊 Total preview databases available: %s", len(self.preview_databases) if self.preview_databases else 0)
+            
+            # Get the gradient to check its units
+            debug_logger.debug("🔧 Getting gradient: %s", gradient_name)
+            gradient = self.gradient_manager.get_gradient(gradient_name)
+            debug_logger.debug("🔧 Gradient found: %s", gradient is not None)
+            
+            if not gradient:
+                debug_logger.error(f"❌ Gradient '{gradient_name}' not found")
+                return
+            
+            # Reuse the rendered image if this database/gradient/range combination was shown recently
+            cache_key = self._gradient_preview_cache_key(preview_db_path, gradient)
+            cached = self._gradient_preview_cache.get(cache_key)
+            if cached is not None:
+                self._gradient_preview_cache.move_to_end(cache_key)
+                debug_logger.debug("✅ Gradient preview served from cache")
+                self.update_preview_display_qimage(cached[0])
+                return
             
             # Load the preview DEM data
-            debug_logger.info("🔧 Loading DEM reader...")
-            from dem_reader import DEMReader
+            debug_logger.debug("🔧 Loading DEM reader...")
             preview_dem = DEMReader(preview_db_path)
-            debug_logger.info(f"🔧 DEM reader created: {type(preview_dem)}")
+            debug_logger.debug("🔧 DEM reader created: %s", type(preview_dem))
             
             # Load elevation data explicitly
-            debug_logger.info("🔧 Loading elevation data...")
+            debug_logger.debug("🔧 Loading elevation data...")
             elevation_data = preview_dem.load_elevation_data()
-            debug_logger.info(f"🔧 Elevation data loaded: {elevation_data is not None}")
+            debug_logger.debug("🔧 Elevation data loaded: %s", elevation_data is not None)
             
-            if elevation_data is not None:
-                debug_logger.info(f"📐 Elevation data shape: {elevation_data.shape}")
-                debug_logger.info(f"📐 Elevation data type: {elevation_data.dtype}")
-                debug_logger.info(f"📐 Elevation min: {elevation_data.min()}, max: {elevation_data.max()}")
-            else:
+            if elevation_data is None:
                 debug_logger.error("❌ Could not load preview DEM data")
                 return
-            
-            # Get the gradient to check its units
-            debug_logger.info(f"🔧 Getting gradient: {gradient_name}")
-            gradient = self.gradient_manager.get_gradient(gradient_name)
-            debug_logger.info(f"🔧 Gradient found: {gradient is not None}")
-            
-            if not gradient:
-                debug_logger.error(f"❌ Gradient '{gradient_name}' not found")
-                return
-            
-            debug_logger.info(f"🎨 Gradient type: {gradient.gradient_type}")
-            debug_logger.info(f"🎨 Gradient units: {gradient.units}")
-            debug_logger.info(f"🎨 Gradient elevation range: {gradient.min_elevation} - {gradient.max_elevation}")
+            if debug_logger.isEnabledFor(logging.DEBUG):
+                # Full-array reductions: only worth paying for when they are logged
+                debug_logger.debug("📐 Elevation data shape: %s", elevation_data.shape)
+                debug_logger.debug("📐 Elevation data type: %s", elevation_data.dtype)
+                debug_logger.debug("📐 Elevation min: %s, max: %s", np.nanmin(elevation_data), np.nanmax(elevation_data))
+                debug_logger.debug("🎨 Gradient type: %s", gradient.gradient_type)
+                debug_logger.debug("🎨 Gradient units: %s", gradient.units)
+                debug_logger.debug("🎨 Gradient elevation range: %s - %s", gradient.min_elevation, gradient.max_elevation)
             
             # Determine elevation range based on gradient units
-            debug_logger.info("🔧 Calculating elevation range for preview...")
+            debug_logger.debug("🔧 Calculating elevation range for preview...")
             min_elevation, max_elevation = self.calculate_elevation_range_for_preview(gradient, elevation_data)
-            debug_logger.info(f"📐 Preview elevation range: {min_elevation} - {max_elevation}")
+            debug_logger.debug("📐 Preview elevation range: %s - %s", min_elevation, max_elevation)
             
             # Generate terrain preview with units-aware elevation range
-            debug_logger.info("🎨 Rendering terrain preview...")
+            debug_logger.debug("🎨 Rendering terrain preview...")
             preview_image = self.terrain_renderer.render_terrain(
                 elevation_data=elevation_data,
                 gradient_name=gradient_name,
@@ -4053,44 +4251,60 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 max_elevation=max_elevation
             )
             
-            debug_logger.info(f"🎨 Terrain rendered: {preview_image is not None}")
+            debug_logger.debug("🎨 Terrain rendered: %s", preview_image is not None)
             
             if preview_image:
-                debug_logger.info(f"🖼️ Preview image type: {type(preview_image)}")
-                debug_logger.info(f"🖼️ Preview image size: {preview_image.size}")
-                debug_logger.info(f"🖼️ Preview image mode: {preview_image.mode}")
+                debug_logger.debug("🖼️ Preview image type: %s", type(preview_image))
+                debug_logger.debug("🖼️ Preview image size: %s", preview_image.size)
+                debug_logger.debug("🖼️ Preview image mode: %s", preview_image.mode)
                 
                 # Convert PIL Image to QImage for display
-                from PyQt6.QtGui import QImage, QPixmap
-                from PyQt6.QtCore import Qt
+                debug_logger.debug("🔧 Converting PIL to QImage...")
                 
-                debug_logger.info("🔧 Converting PIL to QImage...")
-                
-                # Convert PIL to QImage
-                pil_image = preview_image.convert('RGBA')
+                # Convert PIL to QImage (convert() copies every pixel, so only when the mode differs)
+                pil_image = preview_image if preview_image.mode == 'RGBA' else preview_image.convert('RGBA')
                 width, height = pil_image.size
-                debug_logger.info(f"🖼️ Converted image size: {width}x{height}")
+                debug_logger.debug("🖼️ Converted image size: %sx%s", width, height)
                 
                 rgba_data = pil_image.tobytes()
-                debug_logger.info(f"🖼️ RGBA data length: {len(rgba_data)} bytes")
+                debug_logger.debug("🖼️ RGBA data length: %s bytes", len(rgba_data))
                 
                 qimage = QImage(rgba_data, width, height, QImage.Format.Format_RGBA8888)
-                debug_logger.info(f"🖼️ QImage created: {qimage.isNull()}")
-                debug_logger.info(f"🖼️ QImage size: {qimage.width()}x{qimage.height()}")
+                debug_logger.debug("🖼️ QImage created: %s", qimage.isNull())
+                debug_logger.debug("🖼️ QImage size: %sx%s", qimage.width(), qimage.height())
+                
+                # The QImage borrows rgba_data rather than copying it, so the bytes are
+                # cached alongside it to keep its pixels alive
+                self._gradient_preview_cache[cache_key] = (qimage, rgba_data)
+                if len(self._gradient_preview_cache) > _GRADIENT_PREVIEW_CACHE_SIZE:
+                    self._gradient_preview_cache.popitem(last=False)
                 
                 # Update preview display
-                debug_logger.info("🔧 Updating preview display...")
+                debug_logger.debug("🔧 Updating preview display...")
                 self.update_preview_display_qimage(qimage)
-                debug_logger.info("✅ Gradient preview updated successfully")
+                debug_logger.debug("✅ Gradient preview updated successfully")
             else:
                 debug_logger.error("❌ Failed to generate terrain preview")
                 
         except Exception as e:
             debug_logger.error(f"❌ Error updating gradient preview: {e}")
-            import traceback
             debug_logger.error(f"❌ Traceback: {traceback.format_exc()}")
             traceback.print_exc()
     
+    def _gradient_preview_cache_key(self, preview_db_path, gradient):
+        """Everything the gradient preview render depends on, for _gradient_preview_cache
+        
+        The gradient's repr covers its colors and settings, so an edited gradient
+        saved under the same name gets a new key.
+        """
+        scale_to_crop = self._scale_to_crop_radio is not None and self._scale_to_crop_radio.isChecked()
+        scale_to_max_min = self._scale_to_max_min_radio is not None and self._scale_to_max_min_radio.isChecked()
+        if scale_to_crop or self._min_elevation is None or self._max_elevation is None:
+            spinbox_range = None  # Range comes from the preview data (or the gradient), not the spinboxes
+        else:
+            spinbox_range = (self._min_elevation.value(), self._max_elevation.value())
+        return (str(preview_db_path), repr(gradient), scale_to_crop, scale_to_max_min, spinbox_range)
+    
     def calculate_elevation_range_for_preview(self, gradient, elevation_data):
         """
         Calculate elevation range for preview based on radio button selection.
@@ -4106,32 +4320,29 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         Returns:
             tuple: (min_elevation, max_elevation) in meters for rendering
         """
-        import numpy as np
-        
         # Check radio button states to determine gradient type override
-        scale_to_crop = hasattr(self, 'scale_to_crop_radio') and self.scale_to_crop_radio.isChecked()
-        scale_to_max_min = hasattr(self, 'scale_to_max_min_radio') and self.scale_to_max_min_radio.isChecked()
+        scale_to_crop = self._scale_to_crop_radio is not None and self._scale_to_crop_radio.isChecked()
+        scale_to_max_min = self._scale_to_max_min_radio is not None and self._scale_to_max_min_radio.isChecked()
         
         # Determine effective gradient type based on radio button override
         if scale_to_crop:
-            effective_gradient_type = "percent"
-            print(f"📻 Radio button override: Treating '{gradient.name}' as PERCENT gradient")
+            effective_units = GradientUnits.PERCENT
+            debug_logger.debug("📻 Radio button override: Treating '%s' as PERCENT gradient", gradient.name)
         elif scale_to_max_min:
-            effective_gradient_type = "meters" 
-            print(f"📻 Radio button override: Treating '{gradient.name}' as METERS gradient")
+            effective_units = GradientUnits.METERS
+            debug_logger.debug("📻 Radio button override: Treating '%s' as METERS gradient", gradient.name)
         else:
             # No radio button selected - use original gradient type
-            effective_gradient_type = getattr(gradient, 'units', 'meters').lower()
-            print(f"📻 No override: Using original gradient type: {effective_gradient_type}")
+            effective_units = gradient.units_enum
+            debug_logger.debug("📻 No override: Using original gradient type: %s", effective_units.value)
         
-        if effective_gradient_type == "percent":
+        if effective_units is GradientUnits.PERCENT:
             # PERCENT MODE: "Scale gradient to elevation found in crop area"
             # Scan database for actual min/max elevation and auto-populate spinboxes
-            valid_data = elevation_data[~np.isnan(elevation_data)]
-            if len(valid_data) > 0:
-                database_min = float(np.min(valid_data))
-                database_max = float(np.max(valid_data))
-                print(f"📊 Percent mode: Found elevation range {database_min:.0f}m to {database_max:.0f}m")
+            data_range = _elevation_min_max(elevation_data)
+            if data_range is not None:
+                database_min, database_max = data_range
+                debug_logger.debug("📊 Percent mode: Found elevation range %.0fm to %.0fm", database_min, database_max)
                 
                 # SPECIAL CASE: Posterized gradients with "above posterized" colors
                 # For these gradients, using data range would eliminate above-range elevations
@@ -4140,13 +4351,13 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 has_above_color = hasattr(gradient, 'below_gradient_color') and gradient.below_gradient_color
                 
                 if is_posterized and has_above_color:
-                    print(f"🎨 Posterized gradient with above-gradient color detected")
-                    print(f"🎨 Using gradient range to preserve above-gradient behavior: {gradient.min_elevation:.0f}m to {gradient.max_elevation:.0f}m")
+                    debug_logger.debug("🎨 Posterized gradient with above-gradient color detected")
+                    debug_logger.debug("🎨 Using gradient range to preserve above-gradient behavior: %.0fm to %.0fm", gradient.min_elevation, gradient.max_elevation)
                     return gradient.min_elevation, gradient.max_elevation
                 
                 # For preview icon generation, DO NOT update spinboxes
                 # Spinboxes should only be updated during main terrain rendering (Preview/Save buttons)
-                print(f"📊 Found elevations: {database_min:.0f}-{database_max:.0f}m (preview icon - no spinbox update)")
+                debug_logger.debug("📊 Found elevations: %.0f-%.0fm (preview icon - no spinbox update)", database_min, database_max)
                 
                 return database_min, database_max
             else:
@@ -4154,13 +4365,13 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 print("⚠️  No valid elevation data found, using gradient defaults")
                 return gradient.min_elevation, gradient.max_elevation
                 
-        else:  # effective_gradient_type == "meters"
+        else:  # effective_units is GradientUnits.METERS
             # METERS MODE: "Scale gradient to Maximum and Minimum elevation"  
             # Use values from spinboxes (like original meters gradients)
-            if hasattr(self, 'min_elevation') and hasattr(self, 'max_elevation'):
-                spinbox_min = float(self.min_elevation.value())
-                spinbox_max = float(self.max_elevation.value())
-                print(f"📏 Spinbox mode: Using elevation range {spinbox_min:.0f}m to {spinbox_max:.0f}m")
+            if self._min_elevation is not None and self._max_elevation is not None:
+                spinbox_min = float(self._min_elevation.value())
+                spinbox_max = float(self._max_elevation.value())
+                debug_logger.debug("📏 Spinbox mode: Using elevation range %.0fm to %.0fm", spinbox_min, spinbox_max)
                 return spinbox_min, spinbox_max
             else:
                 # Fallback if spinboxes not found
@@ -4170,78 +4381,89 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
     def update_preview_display_qimage(self, qimage):
         """Update the preview display with a QImage"""
         try:
-            debug_logger.info("🖼️ === UPDATING PREVIEW DISPLAY ===")
-            debug_logger.info(f"🖼️ QImage input: {qimage is not None}")
-            debug_logger.info(f"🖼️ QImage null: {qimage.isNull() if qimage else 'N/A'}")
+            verbose = debug_logger.isEnabledFor(logging.DEBUG)
+            if verbose:
+                debug_logger.debug("🖼️ === UPDATING PREVIEW DISPLAY ===")
+                debug_logger.debug("🖼️ QImage input: %s", qimage is not None)
+                debug_logger.debug("🖼️ QImage null: %s", qimage.isNull() if qimage else 'N/A')
+                
+            # preview_label may be filled in later by find_and_setup_preview_widget, so it is looked up per call
+            preview_label = getattr(self, 'preview_label', None)
+            if verbose:
+                debug_logger.debug("🔧 Preview label exists: %s", preview_label is not None)
             
             # Update the preview label if it exists
-            debug_logger.info(f"🔧 Has preview_label attribute: {hasattr(self, 'preview_label')}")
-            debug_logger.info(f"🔧 Preview label exists: {hasattr(self, 'preview_label') and self.preview_label is not None}")
-            
-            if hasattr(self, 'preview_label') and self.preview_label:
-                debug_logger.info(f"🔧 Preview label type: {type(self.preview_label)}")
-                debug_logger.info(f"🔧 Preview label visible: {self.preview_label.isVisible()}")
-                debug_logger.info(f"🔧 Preview label size: {self.preview_label.size()}")
-                
-                from PyQt6.QtGui import QPixmap
-                from PyQt6.QtCore import Qt
-                
-                debug_logger.info("🔧 Converting QImage to QPixmap...")
-                pixmap = QPixmap.fromImage(qimage)
-                debug_logger.info(f"🖼️ Pixmap created: {pixmap is not None}")
-                debug_logger.info(f"🖼️ Pixmap size: {pixmap.size()}")
-                debug_logger.info(f"🖼️ Pixmap null: {pixmap.isNull()}")
-                
-                # Scale to fit the preview area while maintaining aspect ratio
-                if hasattr(self.preview_label, 'size'):
-                    label_size = self.preview_label.size()
-                    debug_logger.info(f"🖼️ Label size for scaling: {label_size}")
+            if preview_label:
+                if verbose:
+                    debug_logger.debug("🔧 Preview label type: %s", type(preview_label))
+                    debug_logger.debug("🔧 Preview label visible: %s", preview_label.isVisible())
+                    debug_logger.debug("🔧 Preview label size: %s", preview_label.size())
+                
+                # Scale to fit the preview area while maintaining aspect ratio; the smooth
+                # rescale is reused while the same image is shown at the same label size
+                label_size = preview_label.size()
+                cache_key = (qimage.cacheKey(), label_size.width(), label_size.height())
+                scaled_pixmap = self._scaled_preview_cache.get(cache_key)
+                if scaled_pixmap is not None:
+                    self._scaled_preview_cache.move_to_end(cache_key)
+                    debug_logger.debug("🖼️ Scaled pixmap served from cache")
+                else:
+                    debug_logger.debug("🔧 Converting QImage to QPixmap...")
+                    pixmap = QPixmap.fromImage(qimage)
+                    if verbose:
+                        debug_logger.debug("🖼️ Pixmap size: %s", pixmap.size())
+                        debug_logger.debug("🖼️ Pixmap null: %s", pixmap.isNull())
+                        debug_logger.debug("🖼️ Label size for scaling: %s", label_size)
                     
                     scaled_pixmap = pixmap.scaled(
                         label_size,
                         Qt.AspectRatioMode.KeepAspectRatio,
                         Qt.TransformationMode.SmoothTransformation
                     )
-                    debug_logger.info(f"🖼️ Scaled pixmap size: {scaled_pixmap.size()}")
-                    debug_logger.info(f"🖼️ Scaled pixmap null: {scaled_pixmap.isNull()}")
-                    
-                    debug_logger.info("🔧 Setting pixmap on preview label...")
-                    self.preview_label.setPixmap(scaled_pixmap)
-                    debug_logger.info("✅ Preview display updated successfully")
-                else:
-                    # Fallback if size not available
-                    debug_logger.info("🔧 Using fallback pixmap setting (no size available)")
-                    self.preview_label.setPixmap(pixmap)
-                    debug_logger.info("✅ Preview display updated (fallback)")
+                    if verbose:
+                        debug_logger.debug("🖼️ Scaled pixmap size: %s", scaled_pixmap.size())
+                        debug_logger.debug("🖼️ Scaled pixmap null: %s", scaled_pixmap.isNull())
                     
-                # Force repaint/update
-                debug_logger.info("🔧 Forcing preview label update...")
-                self.preview_label.update()
-                self.preview_label.repaint()
+                    self._scaled_preview_cache[cache_key] = scaled_pixmap
+                    if len(self._scaled_preview_cache) > _GRADIENT_PREVIEW_CACHE_SIZE:
+                        self._scaled_preview_cache.popitem(last=False)
                 
-                # Force immediate processing of UI events to ensure visual update
-                from PyQt6.QtWidgets import QApplication
-                QApplication.processEvents()
+                debug_logger.debug("🔧 Setting pixmap on preview label...")
+                preview_label.setPixmap(scaled_pixmap)
+                debug_logger.debug("✅ Preview display updated successfully")
+                    
+                # Schedule a repaint (setPixmap already does; a synchronous repaint() would paint twice)
+                preview_label.update()
                 
             else:
                 debug_logger.error("❌ Preview label not found or not available")
-                debug_logger.info("🔧 Attempting to find and setup preview widget...")
+                debug_logger.debug("🔧 Attempting to find and setup preview widget...")
                 # Try to find preview widget by searching
                 self.find_and_setup_preview_widget()
                 
         except Exception as e:
             debug_logger.error(f"❌ Error updating preview display: {e}")
-            import traceback
             debug_logger.error(f"❌ Traceback: {traceback.format_exc()}")
     
     def find_and_setup_preview_widget(self):
-        """Try to find and setup the preview widget if not already found"""
+        """Try to find and setup the preview widget if not already found
+        
+        The UI file names it preview_label, so that name is looked up directly;
+        the scan of every QLabel for a "*preview*" name only ever runs once.
+        """
         try:
             from PyQt6.QtWidgets import QLabel
             
+            label = self.findChild(QLabel, "preview_label")
+            if label is not None:
+                self.preview_label = label
+                return
+            if self._preview_label_searched:
+                return
+            self._preview_label_searched = True
+            
             # Search for any QLabel that might be the preview display
-            all_labels = self.findChildren(QLabel)
-            for label in all_labels:
+            for label in self.findChildren(QLabel):
                 label_name = label.objectName()
                 # Look for labels with "preview" in the name
                 if 'preview' in label_name.lower():
@@ -4256,7 +4478,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
 
     def _database_exists(self, db_entry):
         """Check if a database entry still exists"""
-        path = Path(db_entry['path'])
+        path = db_entry.get('path_obj') or Path(db_entry['path'])
         return path.exists()
 
     def show_startup_database_dialog(self):
@@ -4275,6 +4497,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             print(f"Error showing startup dialog: {e}")
 
     # Gradient editor methods
+    @pyqtSlot()
     def open_new_gradient_editor(self):
         """Open the gradient editor for a new gradient with current gradient parameters"""
         try:
@@ -4352,6 +4575,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", f"Could not open gradient editor:\n{str(e)}")
 
+    @pyqtSlot()
     def open_edit_gradient_editor(self):
         """Open the gradient editor for the selected gradient"""
         try:
@@ -4430,6 +4654,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", f"Could not open gradient editor:\n{str(e)}")
 
+    @pyqtSlot()
     def delete_selected_gradient(self):
         """Delete the currently selected gradient"""
         try:
@@ -4622,6 +4847,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             QMessageBox.warning(self, "Error", f"Failed to save gradient:\n{str(e)}")
 
     # Gradient List Management Methods
+    @pyqtSlot()
     def move_gradient_up(self):
         """Move the selected gradient up in the list"""
         try:
@@ -4659,6 +4885,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", f"Failed to move gradient up:\n{str(e)}")
 
+    @pyqtSlot()
     def move_gradient_down(self):
         """Move the selected gradient down in the list"""
         try:
@@ -4696,6 +4923,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", f"Failed to move gradient down:\n{str(e)}")
 
+    @pyqtSlot()
     def sort_gradients_alphabetically(self):
         """Sort the gradient list alphabetically"""
         try:
@@ -4728,6 +4956,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", f"Failed to sort gradients:\n{str(e)}")
 
+    @pyqtSlot()
     def save_gradient_list_to_file(self):
         """Save the current gradient list to a file"""
         try:
@@ -4763,6 +4992,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             from PyQt6.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", f"Failed to save gradient list:\n{str(e)}")
 
+    @pyqtSlot()
     def load_gradient_list_from_file(self):
         """Load a gradient list from a file"""
         try:
@@ -4916,9 +5146,14 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             QMessageBox.warning(self, "Error", f"Failed to load gradient list:\n{str(e)}")
 
     # Preview and Export methods
+    @pyqtSlot()
     def generate_terrain_preview(self):
         """Generate a terrain preview in the preview window"""
         try:
+            # Make sure the export fields reflect the latest settings
+            if self._export_calc_timer.isActive():
+                self.flush_export_calculations()
+            
             # Validate that we have a DEM file or database loaded
             if not self.current_dem_file and not hasattr(self, 'current_database_info'):
                 from PyQt6.QtWidgets import QMessageBox
@@ -5081,6 +5316,10 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
     def export_terrain_file(self):
         """Export the terrain to a file with improved UI integration"""
         try:
+            # Make sure the export fields reflect the latest settings
+            if self._export_calc_timer.isActive():
+                self.flush_export_calculations()
+            
             from PyQt6.QtWidgets import QFileDialog, QMessageBox
             from pathlib import Path
             
@@ -5372,6 +5611,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             QMessageBox.warning(self, "Export Error", f"Export failed:\n{str(e)}")
             self.status_bar.showMessage(f"Export error: {str(e)}")
 
+    @pyqtSlot()
     def save_image_file(self):
         """Save terrain as image file with 5 image export options"""
         import time
@@ -5379,6 +5619,10 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
 
         # Start timing the export
         export_start_time = time.time()
+        
+        # Make sure the export fields reflect the latest settings
+        if self._export_calc_timer.isActive():
+            self.flush_export_calculations()
         export_timestamp = datetime.now()
 
         try:
@@ -5621,6 +5865,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         print(f"📋 Export data collection complete with {len(export_data)} fields")
         return export_data
 
+    @pyqtSlot()
     def _debug_export_wrapper(self):
         """Debug wrapper to verify menu action connection"""
         print("=" * 80)
@@ -5628,6 +5873,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
         print("=" * 80)
         self.show_export_elevation_database_dialog()
 
+    @pyqtSlot()
     def show_export_elevation_database_dialog(self):
         """Show export elevation database dialog with 2 database export options"""
         debug_logger.info("=" * 80)
@@ -6474,9 +6720,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 print(f"📁 Loading elevation data from multi-file database...")
                 
                 try:
-                    # Import and create the MultiFileDatabase
-                    from multi_file_database import MultiFileDatabase
-                    
+                    # Create the MultiFileDatabase
                     db_path = database_info.get('path')
                     if not db_path:
                         print("❌ No database path available")
@@ -6787,7 +7031,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 else:
                     # Try to detect from database
                     if database_info and database_info.get('type') == 'multi_file':
-                        from multi_file_database import MultiFileDatabase
                         from pathlib import Path
                         database_path = Path(database_info.get('path', ''))
                         if database_path.exists():
@@ -7364,7 +7607,6 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
             debug_logger.info(f"   Scale: {export_scale * 100:.1f}%")
 
             from pathlib import Path
-            from multi_file_database import MultiFileDatabase
             from dem_assembly_system import DEMAssembler, AssemblyConfig
             from dem_reader import DEMReader
 
@@ -7612,6 +7854,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
     # Preview Icon Menu Handlers  
     # ============================================================================
     
+    @pyqtSlot()
     def menu_create_preview_icon_from_selection(self):
         """Menu handler: Create preview icon from current selection"""
         try:
@@ -7653,6 +7896,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 f"Failed to create preview icon from selection:\n{str(e)}"
             )
     
+    @pyqtSlot()
     def menu_next_preview_icon(self):
         """Menu handler: Cycle to next preview icon"""
         try:
@@ -7692,6 +7936,7 @@ class DEMVisualizerQtDesignerWindow(QMainWindow):
                 f"Failed to cycle to next preview icon:\n{str(e)}"
             )
     
+    @pyqtSlot()
     def menu_delete_current_preview_icon(self):
         """Menu handler: Delete current preview icon"""
         try:
@@ -35,7 +35,8 @@ class WorldMapWidget(QWidget):
     def __init__(self):
         super().__init__()
         self.dem_coverage = None  # Geographic bounds of loaded DEM (single file)
-        self.tile_boundaries = []  # List of tile boundaries for multi-tile datasets
+        self._tile_boundaries = []  # List of tile boundaries for multi-tile datasets (see tile_boundaries)
+        self._tile_boundaries_builder = None  # Callable producing them, until first use
         self.selection_start_geo = None  # Geographic coordinates of selection start
         self.selection_end_geo = None    # Geographic coordinates of selection end
         self.is_selecting = False        # Track if currently selecting
@@ -77,9 +78,28 @@ class WorldMapWidget(QWidget):
         """Set the DEM reader for pixel resolution and grid origin information"""
         self.dem_reader = dem_reader
     
+    @property
+    def tile_boundaries(self):
+        """Tile boundary dicts; a builder given to set_tile_boundaries is only run on first use"""
+        if self._tile_boundaries_builder is not None:
+            builder, self._tile_boundaries_builder = self._tile_boundaries_builder, None
+            self._tile_boundaries = list(builder())
+        return self._tile_boundaries
+    
     def set_tile_boundaries(self, tile_list):
-        """Set multiple tile boundaries for multi-tile datasets"""
-        self.tile_boundaries = tile_list
+        """
+        Set multiple tile boundaries for multi-tile datasets
+        
+        Args:
+            tile_list: List of boundary dicts, or a callable returning an iterable of them
+                (deferred until the boundaries are first painted or queried)
+        """
+        if callable(tile_list):
+            self._tile_boundaries_builder = tile_list
+            self._tile_boundaries = []
+        else:
+            self._tile_boundaries_builder = None
+            self._tile_boundaries = tile_list
         # Don't clear dem_coverage - allow both tile boundaries AND overall coverage
         self.update()
     
@@ -449,6 +469,9 @@ class WorldMapWidget(QWidget):
         # These are needed for the paintEvent guard condition
         self.selection_start_geo = (west, north)  # Top-left corner
         self.selection_end_geo = (east, south)    # Bottom-right corner
+        
+        # Schedule a repaint so callers don't have to
+        self.update()
     
     def paintEvent(self, event):
         """Draw the world map with DEM coverage and selection"""
@@ -1085,7 +1108,6 @@ class MapDisplayWidget(QWidget):
                 snapped_bounds['west'], snapped_bounds['east'],
                 snapped_bounds['south'], snapped_bounds['north']
             )
-            self.world_map.update()
             
             # Update coordinate fields with snapped values
             self.update_coordinate_fields(snapped_bounds)
@@ -1316,7 +1338,7 @@ class MapDisplayWidget(QWidget):
     
     def update_selection_display(self, bounds):
         """Update both world map selection and coordinate fields"""
-        # Update world map selection rectangles
+        # Update world map selection rectangles (also triggers the map redraw)
         self.world_map.update_selection_rectangles(
             bounds['west'], bounds['east'], bounds['south'], bounds['north']
         )
@@ -1324,8 +1346,5 @@ class MapDisplayWidget(QWidget):
         # Update coordinate fields
         self.update_coordinate_fields(bounds)
         
-        # Trigger map redraw
-        self.world_map.update()
-        
         # Emit selection change signal
         self.selection_changed.emit(bounds)
\ No newline at end of file
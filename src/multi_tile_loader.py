@@ -9,6 +9,7 @@ import numpy as np
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 from dem_reader import DEMReader
+from startup_cache import startup_cache
 
 class MultiTileLoader:
     """
@@ -64,8 +65,13 @@ class MultiTileLoader:
         metadata_file = metadata_files[0]  # Use first JSON file found
         
         try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+            # Reuse the parsed metadata from the startup cache while the file is unchanged
+            mtime, size = startup_cache.file_stamp(metadata_file)
+            metadata = startup_cache.get(metadata_file, mtime, size)
+            if metadata is None:
+                with open(metadata_file, 'r') as f:
+                    metadata = json.load(f)
+                startup_cache.put(metadata_file, mtime, size, metadata)
                 
             self.dataset_info = metadata.get('dataset_info', {})
             tile_specs = metadata.get('tiles', {})
@@ -116,30 +122,41 @@ class MultiTileLoader:
         }
         
         self.tiles = {}
+        new_cache_entries = []
         
         for dem_file in dem_files:
             tile_name = dem_file.stem
             
             try:
-                # Create temporary DEM reader to get bounds
-                reader = DEMReader()
-                if reader.load_dem_file(str(dem_file)):
+                # Tile headers that were read before come from the startup cache
+                mtime, size = startup_cache.file_stamp(dem_file)
+                cached = startup_cache.get(dem_file, mtime, size)
+                if cached is not None:
+                    bounds, dimensions = cached
+                else:
+                    # Create temporary DEM reader to get bounds
+                    reader = DEMReader()
+                    if not reader.load_dem_file(str(dem_file)):
+                        continue
                     bounds = reader.get_geographic_bounds()  # Should return [west, north, east, south]
                     dimensions = [reader.width, reader.height]
-                    
-                    self.tiles[tile_name] = {
-                        'file_path': dem_file,
-                        'bounds': bounds,
-                        'dimensions': dimensions,
-                        'bounds_desc': f"Scanned from {dem_file.name}",
-                        'loaded': False,
-                        'dem_reader': None,
-                        'data': None
-                    }
+                    new_cache_entries.append((dem_file, mtime, size, (bounds, dimensions)))
+                
+                self.tiles[tile_name] = {
+                    'file_path': dem_file,
+                    'bounds': bounds,
+                    'dimensions': dimensions,
+                    'bounds_desc': f"Scanned from {dem_file.name}",
+                    'loaded': False,
+                    'dem_reader': None,
+                    'data': None
+                }
                     
             except Exception as e:
                 print(f"Warning: Could not read {dem_file}: {e}")
         
+        startup_cache.put_many(new_cache_entries)
+        
         if self.tiles:
             self._calculate_coverage_bounds()
             
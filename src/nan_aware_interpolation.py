@@ -9,7 +9,7 @@ _DEBUG = False
 
 import numpy as np
 from scipy import ndimage
-from typing import Tuple
+from typing import Optional, Tuple
 
 def resize_with_nan_exclusion(data: np.ndarray, target_shape: Tuple[int, int], method: str = 'lanczos') -> np.ndarray:
     """
@@ -138,6 +138,104 @@ def _resize_with_block_averaging(data: np.ndarray, target_shape: Tuple[int, int]
     
     return result
 
+def resize_bilinear_nan(data: np.ndarray, target_shape: Tuple[int, int],
+                        region: Optional[Tuple[int, int, int, int]] = None,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Resize elevation data with bilinear interpolation in a single pass.
+    
+    Only the four source neighbours of each output pixel are read, so no
+    full-size temporaries (filled copies, masks) are created. NaN propagates
+    natively: an output pixel is NaN if any of its four neighbours is NaN.
+    
+    Args:
+        data: Input elevation data with NaN for no-data areas
+        target_shape: Target (height, width) for output
+        region: Optional (row_offset, col_offset, height, width) sub-rectangle of
+            data to resample, so callers can crop without slicing first
+        out: Optional preallocated float32 array of target_shape to write into
+        
+    Returns:
+        Resized float32 elevation data (out, if given)
+    """
+    if region is None:
+        row_offset, col_offset = 0, 0
+        src_height, src_width = data.shape
+    else:
+        row_offset, col_offset, src_height, src_width = region
+    target_height, target_width = target_shape
+    
+    # Source pixel-centre coordinates for each output row/column (within the region)
+    ys = (np.arange(target_height) + 0.5) * (src_height / target_height) - 0.5
+    xs = (np.arange(target_width) + 0.5) * (src_width / target_width) - 0.5
+    np.clip(ys, 0, src_height - 1, out=ys)
+    np.clip(xs, 0, src_width - 1, out=xs)
+    
+    y0 = ys.astype(np.intp)
+    x0 = xs.astype(np.intp)
+    y1 = np.minimum(y0 + 1, src_height - 1)
+    x1 = np.minimum(x0 + 1, src_width - 1)
+    fy = (ys - y0).astype(np.float32)[:, None]
+    fx = (xs - x0).astype(np.float32)[None, :]
+    
+    # Shift region-relative indices into data coordinates
+    y0 += row_offset
+    y1 += row_offset
+    x0 += col_offset
+    x1 += col_offset
+    
+    # Gather the four neighbours (target-sized arrays only, as float to avoid integer overflow)
+    top_left = data[y0[:, None], x0[None, :]].astype(np.float32, copy=False)
+    top_right = data[y0[:, None], x1[None, :]].astype(np.float32, copy=False)
+    bottom_left = data[y1[:, None], x0[None, :]].astype(np.float32, copy=False)
+    bottom_right = data[y1[:, None], x1[None, :]].astype(np.float32, copy=False)
+    
+    top = top_left + (top_right - top_left) * fx
+    bottom = bottom_left + (bottom_right - bottom_left) * fx
+    
+    if out is None:
+        out = np.empty(target_shape, dtype=np.float32)
+    np.subtract(bottom, top, out=bottom)
+    bottom *= fy
+    np.add(top, bottom, out=out)
+    
+    return out
+
+def nan_stats(data: np.ndarray, block_rows: int = 256) -> Tuple[float, float, float, int]:
+    """
+    Compute min, max, mean and valid-pixel count of elevation data ignoring NaN.
+    
+    The array is streamed in row blocks so each block is read from memory once
+    and all four statistics are taken while it is cache-resident, instead of
+    four separate full-array passes (nanmin, nanmax, nanmean, isnan count).
+    
+    Args:
+        data: 2D elevation data with NaN for no-data areas
+        block_rows: Number of rows processed per block
+        
+    Returns:
+        (min, max, mean, valid_count); min/max/mean are NaN if there is no valid data
+    """
+    data_min = np.inf
+    data_max = -np.inf
+    total = 0.0
+    valid_count = 0
+    
+    for row in range(0, data.shape[0], block_rows):
+        block = data[row:row + block_rows]
+        if block.dtype.kind == 'f':
+            block = block[~np.isnan(block)]
+        if block.size == 0:
+            continue
+        data_min = min(data_min, block.min())
+        data_max = max(data_max, block.max())
+        total += float(block.sum(dtype=np.float64))
+        valid_count += block.size
+    
+    if valid_count == 0:
+        return float('nan'), float('nan'), float('nan'), 0
+    return float(data_min), float(data_max), total / valid_count, valid_count
+
 def test_nan_aware_interpolation():
     """Test the NaN-aware interpolation with a synthetic dataset"""
     
@@ -41,6 +41,9 @@ class RecentDatabasesManager:
                 with open(self.config_file, 'r') as f:
                     data = json.load(f)
                     self.recent_databases = data.get('recent_databases', [])
+                    # Stored paths are already resolved (see add_recent_database); keep a Path per entry
+                    for db in self.recent_databases:
+                        db['path_obj'] = Path(db['path'])
                     # Validate that files still exist
                     self.recent_databases = [db for db in self.recent_databases if self._database_exists(db)]
         except Exception as e:
@@ -48,18 +51,25 @@ class RecentDatabasesManager:
             self.recent_databases = []
     
     def save_recent_databases(self):
-        """Save recent databases to config file"""
+        """Save recent databases to config file (written to a temp file, then swapped in)"""
         try:
+            # 'path_obj' is an in-memory convenience and is not JSON serializable
             data = {
-                'recent_databases': self.recent_databases,
+                'recent_databases': [
+                    {key: value for key, value in db.items() if key != 'path_obj'}
+                    for db in self.recent_databases
+                ],
                 'last_updated': datetime.now().isoformat()
             }
-            with open(self.config_file, 'w') as f:
+            tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
+            with open(tmp_file, 'w') as f:
                 json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.config_file)
         except Exception as e:
             print(f"Error saving recent databases: {e}")
     
-    def add_recent_database(self, database_path: str, database_type: str, display_name: str = None):
+    def add_recent_database(self, database_path: str, database_type: str, display_name: str = None,
+                            defer_save: bool = False):
         """
         Add a database to the recent list
         
@@ -67,18 +77,21 @@ class RecentDatabasesManager:
             database_path: Full path to database file or folder
             database_type: 'single_file' or 'multi_file'
             display_name: Optional display name (defaults to filename/foldername)
+            defer_save: If True, skip writing to disk; caller must call save_recent_databases()
         """
-        database_path = str(Path(database_path).resolve())
+        path_obj = Path(database_path).resolve()
+        database_path = str(path_obj)
         
         if not display_name:
-            display_name = Path(database_path).name
+            display_name = path_obj.name
         
         # Create database entry
         db_entry = {
             'path': database_path,
             'type': database_type,
             'display_name': display_name,
-            'last_opened': datetime.now().isoformat()
+            'last_opened': datetime.now().isoformat(),
+            'path_obj': path_obj
         }
         
         # Remove if already exists (to move to top)
@@ -91,7 +104,8 @@ class RecentDatabasesManager:
         self.recent_databases = self.recent_databases[:self.max_recent]
         
         # Save to disk
-        self.save_recent_databases()
+        if not defer_save:
+            self.save_recent_databases()
     
     def get_recent_databases(self) -> List[Dict]:
         """Get list of recent databases (most recent first)"""
@@ -120,7 +134,7 @@ class RecentDatabasesManager:
     
     def _database_exists(self, db_entry: Dict) -> bool:
         """Check if a database still exists on disk"""
-        path = Path(db_entry['path'])
+        path = db_entry['path_obj']
         if db_entry['type'] == 'single_file':
             return path.is_file()
         elif db_entry['type'] == 'multi_file':
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Startup Cache
+Small SQLite store for parsed multi-file database information, so reopening a
+database folder can skip re-parsing its metadata JSON or re-reading every tile header.
+"""
+
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, Optional, Tuple, Union
+
+from recent_databases import get_writable_data_path
+
+
+class StartupCache:
+    """Caches values keyed on a file path, valid while the file's (mtime, size) is unchanged"""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        # Use bundle-aware path for the cache database
+        self.cache_file = cache_file or get_writable_data_path("startup_cache.db")
+        self._conn = None  # Opened on first use so importing this module stays cheap
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database and create its table on first use"""
+        if self._conn is None:
+            conn = sqlite3.connect(str(self.cache_file))
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(path TEXT PRIMARY KEY, mtime REAL, size INTEGER, blob BLOB)"
+            )
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def file_stamp(file_path: Union[str, Path]) -> Tuple[float, int]:
+        """Return the (mtime, size) pair a cache entry for file_path is validated against"""
+        st = Path(file_path).stat()
+        return st.st_mtime, st.st_size
+
+    def get(self, file_path: Union[str, Path], mtime: float, size: int) -> Optional[Any]:
+        """
+        Get the cached value for file_path
+
+        Returns:
+            The cached value, or None if there is no entry or the file has changed since it was stored
+        """
+        try:
+            row = self._connect().execute(
+                "SELECT mtime, size, blob FROM entries WHERE path = ?", (str(file_path),)
+            ).fetchone()
+            if row is not None and row[0] == mtime and row[1] == size:
+                return pickle.loads(row[2])
+        except Exception as e:
+            print(f"Error reading startup cache: {e}")
+        return None
+
+    def put(self, file_path: Union[str, Path], mtime: float, size: int, value: Any):
+        """Store value for file_path, stamped with the file's (mtime, size)"""
+        self.put_many([(file_path, mtime, size, value)])
+
+    def put_many(self, entries: Iterable[Tuple[Union[str, Path], float, int, Any]]):
+        """Store several (file_path, mtime, size, value) entries in one transaction"""
+        rows = [
+            (str(file_path), mtime, size, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            for file_path, mtime, size, value in entries
+        ]
+        if not rows:
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", rows)
+        except Exception as e:
+            print(f"Error writing startup cache: {e}")
+
+
+# Global instance
+startup_cache = StartupCache()
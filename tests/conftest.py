@@ -0,0 +1,6 @@
+"""Make the flat src/ modules importable the same way the app imports them"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,54 @@
+"""Tests for the memoized coordinate formatting in coordinate_validator"""
+
+import random
+
+import pytest
+
+from coordinate_converter import CoordinateConverter
+from coordinate_validator import CoordinateValidator
+
+
+def _reference_format_coordinate_clean(coordinate, is_longitude, use_dms=False):
+    """Uncached formatter, as it was before format_coordinate_clean was memoized"""
+    if use_dms:
+        return CoordinateConverter.format_coordinate(coordinate, is_longitude, True)
+    if abs(coordinate - round(coordinate)) < 1e-10:
+        return f"{coordinate:.0f}"
+    return f"{coordinate:.6f}".rstrip('0').rstrip('.')
+
+
+EDGE_VALUES = [
+    0.0, -0.0, 1e-12, -1e-12, 0.5, -0.5, 1.0, -1.0,
+    58.89907737519417, -58.89907737519417,
+    45.0000000001, 45.0000001, 179.9999999999, -180.0, 180.0, 90.0, -90.0,
+    12.3456785, 0.0000005, 0.1 + 0.2,
+]
+
+
+@pytest.mark.parametrize("use_dms", [False, True])
+@pytest.mark.parametrize("is_longitude", [False, True])
+@pytest.mark.parametrize("coordinate", EDGE_VALUES)
+def test_format_coordinate_clean_matches_uncached_output(coordinate, is_longitude, use_dms):
+    validator = CoordinateValidator()
+    expected = _reference_format_coordinate_clean(coordinate, is_longitude, use_dms)
+    # Twice, so the second call is served from the cache
+    assert validator.format_coordinate_clean(coordinate, is_longitude, use_dms) == expected
+    assert validator.format_coordinate_clean(coordinate, is_longitude, use_dms) == expected
+
+
+def test_format_coordinate_clean_keeps_sign_of_negative_zero():
+    validator = CoordinateValidator()
+    assert validator.format_coordinate_clean(0.0, True) == "0"
+    assert validator.format_coordinate_clean(-0.0, True) == _reference_format_coordinate_clean(-0.0, True)
+    assert (validator.format_coordinate_clean(-0.0, False, True)
+            == _reference_format_coordinate_clean(-0.0, False, True))
+
+
+def test_format_coordinate_clean_matches_uncached_output_on_random_values():
+    validator = CoordinateValidator()
+    rng = random.Random(1234)
+    for _ in range(5000):
+        coordinate = rng.uniform(-180.0, 180.0)
+        for use_dms in (False, True):
+            assert (validator.format_coordinate_clean(coordinate, True, use_dms)
+                    == _reference_format_coordinate_clean(coordinate, True, use_dms))
@@ -0,0 +1,50 @@
+"""Tests for RecentDatabasesManager's cached Path objects"""
+
+import json
+from pathlib import Path
+
+import recent_databases
+from recent_databases import RecentDatabasesManager
+
+
+def _make_manager(tmp_path, monkeypatch, entries):
+    config_file = tmp_path / "recent_databases.json"
+    config_file.write_text(json.dumps({'recent_databases': entries}))
+    monkeypatch.setattr(recent_databases, "get_writable_data_path", lambda relative_path: config_file)
+    return RecentDatabasesManager()
+
+
+def test_loaded_entries_have_path_obj_before_get_last_database(tmp_path, monkeypatch):
+    dem_file = tmp_path / "dem.tif"
+    dem_file.write_bytes(b"")
+    db_folder = tmp_path / "tiles"
+    db_folder.mkdir()
+    manager = _make_manager(tmp_path, monkeypatch, [
+        {'path': str(dem_file), 'type': 'single_file', 'display_name': 'dem.tif'},
+        {'path': str(db_folder), 'type': 'multi_file', 'display_name': 'tiles'},
+    ])
+    
+    recent = manager.get_recent_databases()
+    
+    assert [db['path_obj'] for db in recent] == [dem_file, db_folder]
+    assert all(isinstance(db['path_obj'], Path) for db in recent)
+
+
+def test_added_entry_has_resolved_path_obj_and_is_saved_without_it(tmp_path, monkeypatch):
+    dem_file = tmp_path / "dem.tif"
+    dem_file.write_bytes(b"")
+    manager = _make_manager(tmp_path, monkeypatch, [])
+    
+    manager.add_recent_database(str(dem_file), 'single_file')
+    
+    assert manager.get_recent_databases()[0]['path_obj'] == dem_file.resolve()
+    saved = json.loads((tmp_path / "recent_databases.json").read_text())
+    assert 'path_obj' not in saved['recent_databases'][0]
+
+
+def test_missing_databases_are_dropped_on_load(tmp_path, monkeypatch):
+    manager = _make_manager(tmp_path, monkeypatch, [
+        {'path': str(tmp_path / "gone.tif"), 'type': 'single_file', 'display_name': 'gone.tif'},
+    ])
+    
+    assert manager.get_recent_databases() == []
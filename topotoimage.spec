@@ -83,6 +83,7 @@ datas = [
     ('src/shadow_methods/shadow_method_1.py', 'src/shadow_methods'),
     ('src/shadow_methods/shadow_method_2.py', 'src/shadow_methods'),
     ('src/shadow_methods/shadow_method_3.py', 'src/shadow_methods'),
+    ('src/startup_cache.py', 'src'),
     ('src/terrain_renderer.py', 'src'),
     ('src/update_checker.py', 'src'),
     ('src/version.py', 'src'),